@@ -0,0 +1,51 @@
+"""
+Per-lookup latency of the in-memory location index vs the SQL query path.
+
+Run from src/:  python -m bench.db_index [rows]
+"""
+import os
+import sys
+import tempfile
+import time
+
+from bench.synthetic import make_locations_db
+from ui.db import DB
+
+
+def _per_call_us(fn, args, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for a in args:
+            fn(a)
+        best = min(best, time.perf_counter() - start)
+    return best / len(args) * 1e6
+
+
+def main(n_rows=50_000):
+    with tempfile.TemporaryDirectory() as tmp:
+        db = DB(make_locations_db(os.path.join(tmp, "locations.db"), n_rows))
+
+        start = time.perf_counter()
+        db.reload()
+        load_ms = (time.perf_counter() - start) * 1000
+
+        states = db.get_states()
+        districts = [d for s in states[:4] for d in db.get_districts(s)][:2000]
+        pairs = [(s, d) for s in states[:4] for d in db.get_districts(s)][:2000]
+
+        print(f"rows: {n_rows}  index build: {load_ms:.1f} ms")
+        print(f"{'lookup':<22}{'sql (us)':>12}{'index (us)':>12}")
+        for name, sql_fn, idx_fn, args in (
+            ("get_districts", db.query_districts, db.get_districts, states),
+            ("get_location_data", db.query_location_data, db.get_location_data, districts),
+            ("get_location", lambda p: db.query_location(*p), lambda p: db.get_location(*p), pairs),
+        ):
+            sql = _per_call_us(sql_fn, args)
+            idx = _per_call_us(idx_fn, args)
+            print(f"{name:<22}{sql:>12.2f}{idx:>12.2f}")
+        db.close()
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:]))
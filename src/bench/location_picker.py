@@ -0,0 +1,59 @@
+"""
+Per-keystroke filter latency of the type-ahead location picker.
+
+Types a few district names one character at a time into the picker's
+list model and reports the worst and median keystroke against the 16 ms
+frame budget.
+
+Run from src/:  python -m bench.location_picker [--db data/locations.db] [--rows 800]
+"""
+import argparse
+import os
+import statistics
+import tempfile
+import time
+
+FRAME_MS = 16.0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark location picker filtering.")
+    parser.add_argument("--db", default=None)
+    parser.add_argument("--rows", type=int, default=800, help="synthetic districts without --db")
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PySide6.QtWidgets import QApplication
+    from bench.synthetic import make_locations_db
+    from ui.db import DB
+    from ui.location_picker import LocationListModel, build_location_index
+
+    app = QApplication.instance() or QApplication([])
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = args.db or make_locations_db(os.path.join(tmp, "locations.db"), args.rows)
+        db = DB(path)
+        pairs = db.get_locations()
+        model = LocationListModel(db.district_matcher())
+        model.set_index(build_location_index(pairs=pairs))
+        db.close()
+
+    # Warm up thefuzz import and the matcher's first query
+    model.set_pattern("warmup")
+
+    samples = []
+    for _, district in pairs[:: max(1, len(pairs) // 10)]:
+        typed = district[:-1] + "x"  # last keystroke is a typo to hit the fuzzy path
+        for i in range(1, len(typed) + 1):
+            start = time.perf_counter()
+            model.set_pattern(typed[:i])
+            samples.append((time.perf_counter() - start) * 1000)
+
+    worst = max(samples)
+    print(f"districts: {len(pairs)}  keystrokes: {len(samples)}")
+    print(f"median {statistics.median(samples):.2f} ms  worst {worst:.2f} ms  "
+          f"(budget {FRAME_MS:.0f} ms: {'OK' if worst <= FRAME_MS else 'OVER'})")
+
+
+if __name__ == "__main__":
+    main()
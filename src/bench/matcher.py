@@ -0,0 +1,74 @@
+"""
+Fuzzy district matching: trigram-indexed NameMatcher vs all-pairs
+thefuzz process.extract, over the full district list.
+
+Run from src/:  python -m bench.matcher [--db data/locations.db]
+Without a locations.db a synthetic list of names is used.
+"""
+import argparse
+import os
+import random
+import string
+import time
+
+from ui.matcher import NameMatcher
+
+
+def _synthetic_names(n=800, seed=0):
+    rng = random.Random(seed)
+    syllables = ["pur", "bad", "nag", "gar", "ko", "ta", "ra", "shi", "man", "dha", "li", "wa"]
+    names = set()
+    while len(names) < n:
+        names.add("".join(rng.choice(syllables) for _ in range(rng.randint(2, 4))).title())
+    return sorted(names)
+
+
+def _typo(name, rng):
+    i = rng.randrange(len(name))
+    return name[:i] + rng.choice(string.ascii_lowercase) + name[i + 1:]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark fuzzy district matching.")
+    parser.add_argument("--db", default=None)
+    parser.add_argument("--queries", type=int, default=200)
+    args = parser.parse_args(argv)
+
+    if args.db and os.path.exists(args.db):
+        from ui.db import DB
+
+        names = [d for _, d in sorted(DB(args.db)._records)]
+    else:
+        names = _synthetic_names()
+
+    rng = random.Random(1)
+    queries = [_typo(rng.choice(names), rng) for _ in range(args.queries)]
+
+    start = time.perf_counter()
+    matcher = NameMatcher(names)
+    build_ms = (time.perf_counter() - start) * 1000
+
+    from thefuzz import process
+
+    start = time.perf_counter()
+    for q in queries:
+        process.extract(q, names, limit=10)
+    brute = (time.perf_counter() - start) / len(queries) * 1000
+
+    start = time.perf_counter()
+    results = [matcher.search(q, limit=10, cutoff=0) for q in queries]
+    indexed = (time.perf_counter() - start) / len(queries) * 1000
+
+    agree = sum(
+        bool(hits) and hits[0][0] == process.extractOne(q, names)[0]
+        for q, hits in zip(queries, results)
+    )
+
+    print(f"names: {len(names)}  index build: {build_ms:.1f} ms")
+    print(f"process.extract (all pairs): {brute:8.3f} ms/query")
+    print(f"NameMatcher.search (indexed): {indexed:7.3f} ms/query")
+    print(f"top-1 agreement with all-pairs: {agree}/{len(queries)}")
+
+
+if __name__ == "__main__":
+    main()
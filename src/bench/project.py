@@ -0,0 +1,59 @@
+"""
+Project file round-trip: save and reload N projects, binary and JSON.
+
+Run from src/:  python -m bench.project [count]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+from ui import project
+
+
+def make_state(rng):
+    return {
+        "structure": {"type": "highway"},
+        "location": {
+            "mode": "name",
+            "state": f"State {rng.randrange(36):02d}",
+            "district": f"District {rng.randrange(50000):05d}",
+            "custom": None,
+        },
+        "geometry": {
+            "span": f"{rng.uniform(20, 45):.1f}",
+            "carriageway_width": f"{rng.choice([7.5, 11.0, 14.5])}",
+            "footpath": rng.choice(["None", "Single-Sided", "Both Sides"]),
+            "skew": f"{rng.uniform(-15, 15):.1f}",
+            "additional": {"spacing": 2.5, "girders": 5, "overhang": 1.0, "overall_width": 12.5},
+        },
+        "materials": {"girder": "E350", "cross": "E250", "concrete": "M30"},
+    }
+
+
+def main(count=10_000):
+    rng = random.Random(0)
+    states = [make_state(rng) for _ in range(count)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for binary in (True, False):
+            paths = [os.path.join(tmp, f"p{i}{project.EXTENSION}") for i in range(count)]
+
+            start = time.perf_counter()
+            for path, state in zip(paths, states):
+                project.save_project(path, state, binary)
+            save_s = time.perf_counter() - start
+
+            start = time.perf_counter()
+            for path, state in zip(paths, states):
+                assert project.load_project(path).to_dict() == state
+            load_s = time.perf_counter() - start
+
+            size = os.path.getsize(paths[0])
+            print(f"{'binary' if binary else 'json':<7} {count} files  ~{size} B each  "
+                  f"save {save_s * 1000:.0f} ms  load+decode {load_s * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:]))
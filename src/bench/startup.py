@@ -0,0 +1,59 @@
+"""
+Cold-start budget check.
+
+Launches the app (or a frozen PyInstaller build) with --profile-startup
+--exit-after-startup on the offscreen Qt platform, prints the per-phase
+breakdown and exits non-zero if the total exceeds the budget.
+
+Run from src/:  python -m bench.startup [--exe dist/app.exe] [--budget-ms 3000] [--runs 3]
+"""
+import argparse
+import os
+import re
+import subprocess
+import sys
+
+LINE_RE = re.compile(r"^\[startup\] (.+?)\s+([\d.]+) ms$")
+DEFAULT_BUDGET_MS = float(os.environ.get("BRIDGE_STARTUP_BUDGET_MS", "3000"))
+
+
+def run_once(cmd):
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen")
+    proc = subprocess.run(
+        cmd + ["--profile-startup", "--exit-after-startup"],
+        env=env, capture_output=True, text=True, timeout=120,
+    )
+    phases = {}
+    for line in proc.stderr.splitlines():
+        m = LINE_RE.match(line.strip())
+        if m:
+            phases[m.group(1).strip()] = float(m.group(2))
+    if "total" not in phases:
+        raise RuntimeError(f"no startup report (exit {proc.returncode}):\n{proc.stderr}")
+    return phases
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--exe", help="frozen executable (default: python main.py)")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    cmd = [args.exe] if args.exe else [sys.executable, "main.py"]
+    runs = [run_once(cmd) for _ in range(args.runs)]
+
+    # Best run per phase: cold-start noise only ever adds time
+    best = {name: min(r.get(name, float("inf")) for r in runs) for name in runs[0]}
+    for name, ms in best.items():
+        print(f"{name:<24}{ms:>10.1f} ms")
+
+    if best["total"] > args.budget_ms:
+        print(f"FAIL: startup {best['total']:.1f} ms > budget {args.budget_ms:.1f} ms")
+        return 1
+    print(f"OK: startup within {args.budget_ms:.1f} ms budget")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
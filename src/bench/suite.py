@@ -0,0 +1,342 @@
+"""
+Benchmark suite for the UI and data layer, with regression thresholds.
+
+Runs every case on the offscreen Qt platform against a synthetic
+locations table and reports the median, min and max per case in ms:
+- main_window_cold: import + MainWindow() in a fresh interpreter
+- load_db: BasicInputs.load_db() until db_ready (worker + GUI)
+- load_db_gui: GUI-thread part of that load (on_db_loaded)
+- selection_round_trip: state -> district -> environment labels,
+  through the real combo and store signals
+- geometry_recompute: one ModifyGeometryDialog slider step
+- db_*: raw DB lookups and queries, per call
+
+A case fails when its median exceeds its budget (THRESHOLDS) or, with
+--baseline, regresses by more than --tolerance against a previous JSON
+report. The exit status is 1 if any case failed. Settings and caches go
+to a temporary directory, not the user's.
+
+The single-topic modules next to this one (db_index, location_picker,
+matcher, project, startup, validation) remain for closer looks.
+
+Run from src/:
+    python -m bench.suite [--rows 50000] [--output bench.json]
+    python -m bench.suite --baseline bench.json --tolerance 0.25
+"""
+import argparse
+import json
+import os
+import platform
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+FRAME_MS = 16.0
+
+# Median budgets in ms
+THRESHOLDS = {
+    "main_window_cold": 2500.0,
+    "load_db": 5000.0,
+    "load_db_gui": FRAME_MS,
+    "selection_round_trip": FRAME_MS,
+    "geometry_recompute": FRAME_MS,
+    "db_get_location": 0.01,
+    "db_query_location": 0.5,
+    "db_location_data_many": 50.0,
+    "db_hazard_first_page": 50.0,
+}
+
+# Baseline comparisons ignore changes smaller than this (timer noise)
+NOISE_MS = 0.05
+
+
+def _ms(seconds):
+    return seconds * 1000.0
+
+
+def _qt_app():
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PySide6.QtWidgets import QApplication
+
+    return QApplication.instance() or QApplication([])
+
+
+def _isolate_settings(tmp):
+    """Point QSettings and the per-user directories away from the user's files."""
+    from PySide6.QtCore import QSettings
+
+    from ui import resources
+
+    resources.USER_BASE = tmp
+    for fmt in (QSettings.NativeFormat, QSettings.IniFormat):
+        QSettings.setPath(fmt, QSettings.UserScope, tmp)
+
+
+def _wait(app, done, timeout=30.0):
+    deadline = time.perf_counter() + timeout
+    while not done():
+        if time.perf_counter() > deadline:
+            raise RuntimeError("timed out waiting for the event loop")
+        app.processEvents()
+        time.sleep(0.0005)
+
+
+# ==============================================================
+# Cases: each returns a list of samples in seconds
+# ==============================================================
+
+def bench_main_window_cold(ctx):
+    # A fresh interpreter per sample, so imports and first-use caches are cold
+    samples = []
+    for _ in range(ctx["runs"]):
+        out = subprocess.run(
+            [sys.executable, "-m", "bench.suite", "--child", "main_window"],
+            env=dict(os.environ, QT_QPA_PLATFORM="offscreen"),
+            capture_output=True, text=True, timeout=120, check=True,
+        )
+        samples.append(float(out.stdout.strip().splitlines()[-1]))
+    return samples
+
+
+def _child_main_window():
+    app = _qt_app()
+    with tempfile.TemporaryDirectory() as tmp:
+        _isolate_settings(tmp)
+        start = time.perf_counter()
+        from ui.main_window import MainWindow
+
+        window = MainWindow()
+        elapsed = time.perf_counter() - start
+        window.tasks.wait()
+        window.basic_inputs_widget.tasks.wait()
+        app.processEvents()
+    print(elapsed)
+
+
+def bench_load_db(ctx):
+    from ui.basic_inputs import BasicInputs
+
+    app = ctx["app"]
+    walls, gui = [], []
+    for _ in range(ctx["runs"]):
+        widget = BasicInputs()
+        _wait(app, lambda: not widget.tasks.is_busy())
+
+        handler = widget.on_db_loaded
+
+        def timed(*args, handler=handler):
+            start = time.perf_counter()
+            handler(*args)
+            gui.append(time.perf_counter() - start)
+
+        widget.on_db_loaded = timed
+        ready = []
+        widget.db_ready.connect(ready.append)
+        start = time.perf_counter()
+        widget.load_db(ctx["db_path"])
+        _wait(app, lambda: ready)
+        walls.append(time.perf_counter() - start)
+        widget.db.close()
+        widget.deleteLater()
+    return {"load_db": walls, "load_db_gui": gui}
+
+
+def bench_selection_round_trip(ctx):
+    from ui.basic_inputs import BasicInputs
+    from ui.db_loader import load_database
+    from ui.tasks import CancelToken
+
+    app = ctx["app"]
+    widget = BasicInputs()
+    _wait(app, lambda: not widget.tasks.is_busy())
+    widget.on_db_loaded(*load_database(CancelToken(), ctx["db_path"]))
+    widget.chk_mode_name.setChecked(True)
+
+    db = widget.db
+    updates = []
+    widget.environment.changed.connect(updates.append)
+    samples = []
+    for state in db.get_states()[:ctx["runs"] * 5]:
+        district = db.get_districts(state)[-1]
+        count = len(updates)
+        start = time.perf_counter()
+        widget.cmb_state.setCurrentText(state)
+        widget.cmb_district.setCurrentText(district)
+        _wait(app, lambda: len(updates) > count)
+        samples.append(time.perf_counter() - start)
+        if not widget.lbl_wind.text().endswith("m/s"):
+            raise RuntimeError("environment labels were not updated")
+    db.close()
+    widget.deleteLater()
+    return samples
+
+
+def bench_geometry_recompute(ctx):
+    from ui.modify_geometry_dialog import ModifyGeometryDialog
+
+    dialog = ModifyGeometryDialog(11.0)
+    dialog.in_overhang.setText("1.0")
+    emitted = []
+    dialog.values_changed.connect(emitted.append)
+    slider = dialog.slider_spacing
+    values = list(range(20, 40)) * max(1, ctx["runs"])
+    samples = []
+    for value in values:
+        count = len(emitted)
+        start = time.perf_counter()
+        slider.setValue(value)
+        samples.append(time.perf_counter() - start)
+        if len(emitted) == count and slider.value() == value:
+            raise RuntimeError(f"no recompute for slider value {value}")
+    dialog.deleteLater()
+    return samples
+
+
+def _per_call(fn, args, runs):
+    """Mean per-call time over one pass through args, one sample per run."""
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        for a in args:
+            fn(a)
+        samples.append((time.perf_counter() - start) / len(args))
+    return samples
+
+
+def bench_db(ctx):
+    from ui.db import DB
+
+    with DB(ctx["db_path"]) as db:
+        states = db.get_states()
+        pairs = [(s, d) for s in states for d in db.get_districts(s)[:60]][:2000]
+        return {
+            "db_get_location": _per_call(lambda p: db.get_location(*p), pairs, ctx["runs"]),
+            "db_query_location": _per_call(lambda p: db.query_location(*p), pairs, ctx["runs"]),
+            "db_location_data_many": _per_call(db.get_location_data_many, [pairs[:1000]], ctx["runs"]),
+            "db_hazard_first_page": _per_call(
+                lambda bounds: db.hazard_cursor(**bounds).fetchmany(200),
+                [{"wind_min": 44.0}, {"zone_min": "IV"}, {"temp_range_min": 35.0}], ctx["runs"]),
+        }
+
+
+CASES = (
+    ("main_window_cold", bench_main_window_cold),
+    ("load_db", bench_load_db),
+    ("selection_round_trip", bench_selection_round_trip),
+    ("geometry_recompute", bench_geometry_recompute),
+    ("db", bench_db),
+)
+
+
+# ==============================================================
+# Report
+# ==============================================================
+
+def summarize(name, samples, baseline, tolerance):
+    ms = [_ms(s) for s in samples]
+    result = {
+        "median_ms": statistics.median(ms),
+        "min_ms": min(ms),
+        "max_ms": max(ms),
+        "samples": len(ms),
+        "threshold_ms": THRESHOLDS.get(name),
+    }
+    failures = []
+    if result["threshold_ms"] is not None and result["median_ms"] > result["threshold_ms"]:
+        failures.append(f"over budget {result['threshold_ms']:g} ms")
+    previous = (baseline or {}).get(name)
+    if previous is not None:
+        limit = max(previous["median_ms"] * (1 + tolerance), previous["median_ms"] + NOISE_MS)
+        result["baseline_ms"] = previous["median_ms"]
+        if result["median_ms"] > limit:
+            failures.append(f"regressed from {previous['median_ms']:.3f} ms")
+    result["ok"] = not failures
+    result["failures"] = failures
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the UI and data layer benchmark suite.")
+    parser.add_argument("--rows", type=int, default=50_000, help="synthetic locations")
+    parser.add_argument("--runs", type=int, default=5, help="samples per case (cold starts: fewer)")
+    parser.add_argument("--only", nargs="+", choices=[name for name, _ in CASES],
+                        help="run these cases only")
+    parser.add_argument("--output", help="write the JSON report here ('-' for stdout)")
+    parser.add_argument("--baseline", help="previous JSON report to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="allowed relative slowdown against the baseline (default 0.25)")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child == "main_window":
+        _child_main_window()
+        return 0
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+
+    from bench.synthetic import make_locations_db
+    from tools.ingest import INDEXES
+
+    app = _qt_app()
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        _isolate_settings(tmp)
+        db_path = make_locations_db(os.path.join(tmp, "locations.db"), args.rows)
+        # Same indexes as a database built by tools.ingest
+        conn = sqlite3.connect(db_path)
+        for sql in INDEXES:
+            conn.execute(sql)
+        conn.close()
+
+        ctx = {"app": app, "db_path": db_path, "runs": args.runs}
+        for name, case in CASES:
+            if args.only and name not in args.only:
+                continue
+            samples = case(ctx)
+            # Some cases time several things at once
+            for case_name, case_samples in (samples.items() if isinstance(samples, dict)
+                                            else [(name, samples)]):
+                results[case_name] = summarize(case_name, case_samples, baseline, args.tolerance)
+        app.processEvents()
+
+    failed = [name for name, r in results.items() if not r["ok"]]
+    print(f"{'case':<24}{'median':>12}{'min':>12}{'max':>12}{'budget':>10}")
+    for name, r in results.items():
+        budget = f"{r['threshold_ms']:g}" if r["threshold_ms"] is not None else "-"
+        status = "" if r["ok"] else "  FAIL: " + "; ".join(r["failures"])
+        print(f"{name:<24}{r['median_ms']:>12.3f}{r['min_ms']:>12.3f}{r['max_ms']:>12.3f}{budget:>10}{status}")
+
+    report = {
+        "meta": {
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "qt": __import__("PySide6").__version__,
+            "platform": platform.platform(),
+            "rows": args.rows,
+            "runs": args.runs,
+            "tolerance": args.tolerance,
+        },
+        "results": results,
+    }
+    if args.output == "-":
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    elif args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+    if failed:
+        print(f"FAIL: {', '.join(failed)}")
+        return 1
+    print(f"OK: {len(results)} cases within budget")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,43 @@
+"""Synthetic `locations` tables for benchmarks (run from src/)."""
+import random
+import sqlite3
+
+SCHEMA = """
+CREATE TABLE locations (
+    State TEXT,
+    District TEXT,
+    Wind REAL,
+    SeismicZone TEXT,
+    SeismicFactor REAL,
+    TempMax REAL,
+    TempMin REAL
+)
+"""
+
+ZONES = (("II", 0.10), ("III", 0.16), ("IV", 0.24), ("V", 0.36))
+WINDS = (33.0, 39.0, 44.0, 47.0, 50.0, 55.0)
+
+
+def make_locations_db(path, n_rows=50_000, n_states=36, seed=0):
+    """Write a locations table with `n_rows` districts spread over `n_states`."""
+    rng = random.Random(seed)
+    conn = sqlite3.connect(path)
+    conn.execute("DROP TABLE IF EXISTS locations")
+    conn.execute(SCHEMA)
+    rows = []
+    for i in range(n_rows):
+        zone, factor = rng.choice(ZONES)
+        tmax = round(rng.uniform(35.0, 50.0), 1)
+        rows.append((
+            f"State {i % n_states:02d}",
+            f"District {i:05d}",
+            rng.choice(WINDS),
+            zone,
+            factor,
+            tmax,
+            round(tmax - rng.uniform(25.0, 45.0), 1),
+        ))
+    conn.executemany("INSERT INTO locations VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+    conn.commit()
+    conn.close()
+    return path
@@ -0,0 +1,37 @@
+"""
+Headless validation throughput over serialized forms.
+
+Run from src/:  python -m bench.validation [records]
+"""
+import random
+import sys
+import time
+
+from ui import validation
+
+
+def make_records(n, seed=0):
+    rng = random.Random(seed)
+    pool = ["", "abc", "-", "1e1"]
+    return [
+        {
+            "span": rng.choice(pool) if rng.random() < 0.1 else f"{rng.uniform(10, 55):.1f}",
+            "skew": rng.choice(pool) if rng.random() < 0.1 else f"{rng.uniform(-30, 30):.1f}",
+        }
+        for _ in range(n)
+    ]
+
+
+def main(n=100_000):
+    records = make_records(n)
+
+    start = time.perf_counter()
+    flagged = sum(any(r.values()) for r in validation.validate_records(records))
+    elapsed = time.perf_counter() - start
+
+    print(f"records: {n}  flagged: {flagged}")
+    print(f"total {elapsed * 1000:.1f} ms  ({elapsed / n * 1e6:.2f} us/record)")
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:]))
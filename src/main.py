@@ -1,34 +1,76 @@
+import multiprocessing
+import os
 import sys
-from PySide6.QtWidgets import QApplication, QSplashScreen
-from PySide6.QtGui import QPixmap, QIcon
-from PySide6.QtCore import Qt, QTimer
-from ui.main_window import MainWindow, resource_path
+import time
+
+from ui import startup_profile
+
+with startup_profile.phase("imports"):
+    from PySide6.QtWidgets import QApplication, QSplashScreen
+    from PySide6.QtCore import Qt, QTimer
+    from ui import assets
+    from ui.main_window import MainWindow
+
+# Optional minimum splash display time (ms); the splash otherwise closes as
+# soon as the main window reports ready.
+SPLASH_MIN_MS = int(os.environ.get("BRIDGE_SPLASH_MIN_MS", "0"))
 
 
 def main():
-    app = QApplication(sys.argv)
+    with startup_profile.phase("QApplication"):
+        app = QApplication(sys.argv)
     
     # Set application icon (shows in taskbar)
-    app.setWindowIcon(QIcon(resource_path("assets/icon.ico")))
+    app.setWindowIcon(assets.icon("icon"))
     
     # Create and display splash screen
-    splash_pix = QPixmap(resource_path("assets/splash.png"))
-    splash = QSplashScreen(splash_pix, Qt.WindowStaysOnTopHint)
-    splash.show()
-    app.processEvents()
+    with startup_profile.phase("splash"):
+        # The reference image decodes in the background meanwhile
+        assets.preload("cross_section")
+        splash_pix = assets.pixmap("splash")
+        splash = QSplashScreen(splash_pix, Qt.WindowStaysOnTopHint)
+        splash.show()
+    shown_at = time.monotonic()
+
+    def show_progress(message):
+        splash.showMessage(message, Qt.AlignBottom | Qt.AlignHCenter, Qt.white)
+        app.processEvents()
+
+    show_progress("Starting…")
     
     # Create main window (but don't show yet)
-    window = MainWindow()
+    window = MainWindow(on_progress=show_progress)
     
-    # Close splash and show main window after 2 seconds
+    # Close splash and show main window as soon as it reports ready
     def show_main_window():
-        splash.close()
+        paint_start = time.perf_counter()
         window.show()
-    
-    QTimer.singleShot(2000, show_main_window)
+        splash.finish(window)
+
+        # Zero-timeout timers run after the pending show/paint events
+        def first_paint_done():
+            startup_profile.record("first paint", (time.perf_counter() - paint_start) * 1000)
+            startup_profile.report()
+            if startup_profile.exit_after_startup():
+                app.quit()
+
+        if startup_profile.enabled() or startup_profile.exit_after_startup():
+            QTimer.singleShot(0, first_paint_done)
+
+    def on_ready():
+        elapsed_ms = (time.monotonic() - shown_at) * 1000
+        QTimer.singleShot(max(0, int(SPLASH_MIN_MS - elapsed_ms)), show_main_window)
+
+    if window.is_ready():
+        on_ready()
+    else:
+        window.ready.connect(on_ready)
     
     sys.exit(app.exec())
 
 
 if __name__ == "__main__":
+    # Sweep worker processes of a frozen build start here; they must run
+    # their task, not the app
+    multiprocessing.freeze_support()
     main()
@@ -0,0 +1,81 @@
+"""
+Look up wind, seismic and temperature parameters for many project sites.
+
+Reads a CSV with State and District columns (any other columns are passed
+through) and writes it back out with the loading parameters appended.
+Rows are streamed in chunks, so memory use does not grow with the input.
+
+Run from src/:  python -m tools.batch_lookup sites.csv -o sites_params.csv
+"""
+import argparse
+import csv
+import sys
+from itertools import islice
+
+from ui.db import DB, DB_PATH
+
+OUTPUT_COLUMNS = ("Wind", "SeismicZone", "SeismicFactor", "TempMax", "TempMin", "Status")
+
+
+def _find_column(fieldnames, name):
+    for field in fieldnames:
+        if field.strip().casefold() == name.casefold():
+            return field
+    raise SystemExit(f"input CSV has no '{name}' column (found: {', '.join(fieldnames)})")
+
+
+def lookup_csv(db, infile, outfile, chunk_size=DB.BATCH_ROWS * 10):
+    """Stream rows from infile to outfile; returns (rows, not_found)."""
+    reader = csv.DictReader(infile)
+    if not reader.fieldnames:
+        raise SystemExit("input CSV is empty")
+    state_col = _find_column(reader.fieldnames, "State")
+    district_col = _find_column(reader.fieldnames, "District")
+
+    writer = csv.writer(outfile)
+    writer.writerow(list(reader.fieldnames) + list(OUTPUT_COLUMNS))
+
+    total = missing = 0
+    while True:
+        chunk = list(islice(reader, chunk_size))
+        if not chunk:
+            break
+        # Short rows leave missing fields as None; they come out not found
+        pairs = [((row.get(state_col) or "").strip(), (row.get(district_col) or "").strip())
+                 for row in chunk]
+        for row, data in zip(chunk, db.get_location_data_many(pairs)):
+            values = [row.get(f, "") for f in reader.fieldnames]
+            if data is None:
+                missing += 1
+                writer.writerow(values + [""] * 5 + ["not found"])
+            else:
+                writer.writerow(values + list(data) + ["ok"])
+        total += len(chunk)
+    return total, missing
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Batch location parameter lookup.")
+    parser.add_argument("input", help="CSV with State and District columns ('-' for stdin)")
+    parser.add_argument("-o", "--output", default="-", help="output CSV ('-' for stdout)")
+    parser.add_argument("--db", default=DB_PATH)
+    args = parser.parse_args(argv)
+
+    db = DB(args.db, preload=False)
+    infile = sys.stdin if args.input == "-" else open(args.input, newline="", encoding="utf-8-sig")
+    outfile = sys.stdout if args.output == "-" else open(args.output, "w", newline="", encoding="utf-8")
+    try:
+        total, missing = lookup_csv(db, infile, outfile)
+    finally:
+        if infile is not sys.stdin:
+            infile.close()
+        if outfile is not sys.stdout:
+            outfile.close()
+        db.close()
+
+    print(f"{total} sites, {missing} not found", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
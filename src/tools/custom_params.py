@@ -0,0 +1,267 @@
+"""
+Bulk import/export of custom loading parameters.
+
+Site survey tables (CSV or XLSX) with wind, zone, factor, tmax and tmin
+columns are read in chunks, validated column-wise with the same checks
+as CustomTableEditor (ui.validation.validate_custom_frame) and written
+to a `custom_params` table in a SQLite file in the per-user data
+directory (CUSTOM_DB_PATH), for dev runs and frozen builds alike. Bad
+rows are reported with their source row number and skipped; the import
+carries on. The GUI's database load attaches the store (DB.attach), so
+`custom.custom_params` is queryable alongside `locations`.
+
+Column names are matched case-insensitively; an optional Site (or Name /
+Location) column keys the rows, otherwise "<file>:<row>" is used.
+
+Run from src/:
+    python -m tools.custom_params import survey.xlsx --errors errors.csv
+    python -m tools.custom_params export custom.csv
+"""
+import argparse
+import csv
+import os
+import re
+import sqlite3
+import sys
+
+from ui import validation
+from ui.resources import user_dir
+
+# Not in the data folder: a frozen build bundles it read-only
+CUSTOM_DB_PATH = os.path.join(user_dir("data"), "custom_params.db")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS custom_params (
+    Site TEXT PRIMARY KEY,
+    Wind REAL NOT NULL,
+    SeismicZone INTEGER NOT NULL,
+    SeismicFactor REAL NOT NULL,
+    TempMax REAL NOT NULL,
+    TempMin REAL NOT NULL,
+    Source TEXT
+)
+"""
+COLUMNS = ("Site", "Wind", "SeismicZone", "SeismicFactor", "TempMax", "TempMin", "Source")
+
+# Accepted header spellings: casefolded, punctuation and units dropped,
+# so "Basic Wind Speed (m/s)" matches "basicwindspeed"
+ALIASES = {
+    "site": ("site", "name", "location", "sitename"),
+    "wind": ("wind", "windspeed", "basicwindspeed", "vb"),
+    "zone": ("zone", "seismiczone"),
+    "factor": ("factor", "seismicfactor", "zonefactor", "z"),
+    "tmax": ("tmax", "maxtemp", "maxtemperature", "tempmax"),
+    "tmin": ("tmin", "mintemp", "mintemperature", "tempmin"),
+}
+
+CHUNK_ROWS = 20_000
+
+
+_UNITS_RE = re.compile(r"\(.*?\)")
+_PUNCT_RE = re.compile(r"[\W_]+")
+
+
+def _key(header):
+    return _PUNCT_RE.sub("", _UNITS_RE.sub("", str(header).casefold()))
+
+
+def map_columns(headers):
+    """{field: header} for the recognised columns; raises ValueError if any are missing."""
+    keys = {_key(h): h for h in headers if h is not None}
+    found = {}
+    for field, aliases in ALIASES.items():
+        for alias in aliases:
+            if alias in keys:
+                found[field] = keys[alias]
+                break
+    missing = [f for f in validation.CUSTOM_FIELDS if f not in found]
+    if missing:
+        raise ValueError(f"missing column(s): {', '.join(missing)} (found: {', '.join(map(str, headers))})")
+    return found
+
+
+# ==============================================================
+# Readers: yield (first source row number, DataFrame of text)
+# ==============================================================
+
+def _read_csv(path, chunk_rows):
+    import pandas as pd
+
+    row = 2    # line 1 is the header
+    for chunk in pd.read_csv(path, dtype=str, keep_default_na=False, chunksize=chunk_rows,
+                             encoding="utf-8-sig", skipinitialspace=True):
+        yield row, chunk
+        row += len(chunk)
+
+
+def _read_xlsx(path, chunk_rows):
+    import pandas as pd
+    try:
+        import openpyxl
+    except ImportError:
+        raise ValueError("reading .xlsx files needs the openpyxl package") from None
+
+    book = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    try:
+        rows = book.active.iter_rows(values_only=True)
+        headers = next(rows, None)
+        if headers is None:
+            return
+        start, chunk = 2, []
+        for values in rows:
+            chunk.append(values)
+            if len(chunk) == chunk_rows:
+                yield start, pd.DataFrame(chunk, columns=headers)
+                start, chunk = start + len(chunk), []
+        if chunk:
+            yield start, pd.DataFrame(chunk, columns=headers)
+    finally:
+        book.close()
+
+
+def read_chunks(path, chunk_rows=CHUNK_ROWS):
+    if path.lower().endswith((".xlsx", ".xlsm")):
+        return _read_xlsx(path, chunk_rows)
+    return _read_csv(path, chunk_rows)
+
+
+# ==============================================================
+# Store
+# ==============================================================
+
+class CustomParamsStore:
+    """The custom_params table; writable, unlike the locations DB."""
+
+    def __init__(self, path=CUSTOM_DB_PATH):
+        self.path = path
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.execute(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def import_file(self, path, chunk_rows=CHUNK_ROWS, on_error=None, progress=None, is_cancelled=None):
+        """
+        Validate and upsert every row of a CSV/XLSX file. on_error(row,
+        message) is called for each rejected row (source row numbers) and
+        progress(rows_read, 0) after each chunk. Returns (imported,
+        rejected), or None when is_cancelled() returned True, in which
+        case nothing is written.
+        """
+        import numpy as np
+
+        source = os.path.basename(path)
+        imported = rejected = 0
+        columns = None
+        with self.conn:
+            for first_row, chunk in read_chunks(path, chunk_rows):
+                if columns is None:
+                    columns = map_columns(list(chunk.columns))
+                frame = chunk.rename(columns={v: k for k, v in columns.items()})
+                values, messages = validation.validate_custom_frame(frame)
+
+                ok = (messages == "").to_numpy()
+                row_numbers = np.arange(first_row, first_row + len(chunk))
+                if on_error is not None:
+                    for row, message in zip(row_numbers[~ok], messages[~ok]):
+                        on_error(int(row), message)
+
+                if "site" in frame:
+                    sites = frame["site"].astype("string").str.strip().fillna("")
+                    sites = sites.where(sites != "", [f"{source}:{r}" for r in row_numbers])
+                else:
+                    sites = [f"{source}:{r}" for r in row_numbers]
+                good = values[ok]
+                self.conn.executemany(
+                    "INSERT OR REPLACE INTO custom_params VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    zip(np.asarray(sites, dtype=object)[ok],
+                        good["wind"].tolist(), good["zone"].astype(int).tolist(),
+                        good["factor"].tolist(), good["tmax"].tolist(), good["tmin"].tolist(),
+                        [source] * len(good)))
+                imported += int(ok.sum())
+                rejected += int((~ok).sum())
+                if progress is not None:
+                    progress(imported + rejected, 0)
+                if is_cancelled is not None and is_cancelled():
+                    self.conn.rollback()
+                    return None
+        return imported, rejected
+
+    def export_csv(self, outfile, chunk_rows=CHUNK_ROWS):
+        """Stream the table to an open text file as CSV; returns rows written."""
+        writer = csv.writer(outfile)
+        writer.writerow(COLUMNS)
+        cursor = self.conn.execute(f"SELECT {', '.join(COLUMNS)} FROM custom_params ORDER BY Site")
+        total = 0
+        while True:
+            rows = cursor.fetchmany(chunk_rows)
+            if not rows:
+                break
+            writer.writerows(rows)
+            total += len(rows)
+        return total
+
+    def sites(self):
+        return [row[0] for row in self.conn.execute("SELECT Site FROM custom_params ORDER BY Site")]
+
+    def get(self, site):
+        """Values for a site in CustomTableEditor.get_values() form, or None."""
+        row = self.conn.execute(
+            "SELECT Wind, SeismicZone, SeismicFactor, TempMax, TempMin FROM custom_params WHERE Site=?",
+            (site,)
+        ).fetchone()
+        return dict(zip(validation.CUSTOM_FIELDS, row)) if row else None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Import/export custom loading parameters.")
+    parser.add_argument("--store", default=CUSTOM_DB_PATH, help="custom parameters SQLite file")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    imp = sub.add_parser("import", help="validate and load a CSV/XLSX table")
+    imp.add_argument("input")
+    imp.add_argument("--errors", help="write rejected rows (row, message) to this CSV")
+
+    exp = sub.add_parser("export", help="write the stored table as CSV")
+    exp.add_argument("output", help="CSV path ('-' for stdout)")
+
+    args = parser.parse_args(argv)
+    with CustomParamsStore(args.store) as store:
+        if args.command == "export":
+            outfile = sys.stdout if args.output == "-" else open(args.output, "w", newline="", encoding="utf-8")
+            try:
+                rows = store.export_csv(outfile)
+            finally:
+                if outfile is not sys.stdout:
+                    outfile.close()
+            print(f"{rows} rows exported", file=sys.stderr)
+            return 0
+
+        errfile = open(args.errors, "w", newline="", encoding="utf-8") if args.errors else None
+        try:
+            if errfile is not None:
+                writer = csv.writer(errfile)
+                writer.writerow(("Row", "Error"))
+                on_error = lambda row, message: writer.writerow((row, message))
+            else:
+                on_error = lambda row, message: print(f"row {row}: {message}", file=sys.stderr)
+            try:
+                imported, rejected = store.import_file(args.input, on_error=on_error)
+            except ValueError as exc:
+                parser.error(str(exc))
+        finally:
+            if errfile is not None:
+                errfile.close()
+    print(f"{imported} rows imported, {rejected} rejected", file=sys.stderr)
+    return 1 if rejected else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,103 @@
+"""
+On-disk cache of per-page table extraction results.
+
+Entries are keyed by a content hash of the PDF page together with the
+extractor settings, so a rebuild only re-extracts pages that changed.
+Stored in a small SQLite file with LRU eviction once it grows past
+`max_bytes`; by default in the user's cache directory (DEFAULT_PATH),
+not next to the database being built.
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import time
+
+from ui.resources import user_dir
+
+DEFAULT_PATH = os.path.join(user_dir("cache"), "extract_cache.db")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS pages (
+    key TEXT PRIMARY KEY,
+    rows TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    last_used REAL NOT NULL
+)
+"""
+
+
+def settings_digest(settings):
+    return hashlib.sha256(json.dumps(settings, sort_keys=True).encode()).hexdigest()
+
+
+def page_hash(page):
+    """
+    Content hash of a pdfplumber page: its content streams, the raw data
+    of its XObjects (scanned images) and its media box.
+    """
+    from pdfminer.pdftypes import resolve1
+
+    h = hashlib.sha256(repr(page.mediabox).encode())
+    for stream in page.page_obj.contents or ():
+        h.update(resolve1(stream).get_rawdata() or b"")
+    xobjects = resolve1((page.page_obj.resources or {}).get("XObject")) or {}
+    for name in sorted(xobjects):
+        h.update(name.encode() if isinstance(name, str) else bytes(name))
+        h.update(resolve1(xobjects[name]).get_rawdata() or b"")
+    return h.hexdigest()
+
+
+class PageCache:
+    def __init__(self, path, settings, max_bytes=64 * 1024 * 1024):
+        self.path = path
+        self.max_bytes = max_bytes
+        self._settings = settings_digest(settings)
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.execute(SCHEMA)
+        self.conn.commit()
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, content_hash):
+        return f"{content_hash}:{self._settings}"
+
+    def get(self, content_hash):
+        """Return the cached rows for a page, or None."""
+        key = self.key(content_hash)
+        row = self.conn.execute("SELECT rows FROM pages WHERE key=?", (key,)).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.conn.execute("UPDATE pages SET last_used=? WHERE key=?", (time.time(), key))
+        return json.loads(row[0])
+
+    def put(self, content_hash, rows):
+        data = json.dumps(rows)
+        self.conn.execute(
+            "INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?)",
+            (self.key(content_hash), data, len(data), time.time()),
+        )
+
+    def evict(self):
+        """Drop least recently used entries until the cache fits max_bytes."""
+        total = self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM pages").fetchone()[0]
+        if total <= self.max_bytes:
+            return 0
+        evicted = 0
+        for key, size in self.conn.execute(
+            "SELECT key, size FROM pages ORDER BY last_used"
+        ).fetchall():
+            if total <= self.max_bytes:
+                break
+            self.conn.execute("DELETE FROM pages WHERE key=?", (key,))
+            total -= size
+            evicted += 1
+        return evicted
+
+    def close(self):
+        self.evict()
+        self.conn.commit()
+        self.conn.close()
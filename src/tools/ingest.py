@@ -0,0 +1,373 @@
+"""
+Build data/locations.db from the wind, seismic and temperature tables in pdfs/.
+
+Each PDF page is extracted in a process pool (pdfplumber tables, with an
+OCR fallback through pdf2image + pytesseract for scanned pages), the rows
+are normalized per table kind, joined on (State, District) and written in
+bulk inside a single transaction. Extraction results are cached per page
+content hash (tools/extract_cache.py), so rebuilds only re-extract pages
+that changed.
+
+Run from src/:  python -m tools.ingest [--pdf-dir ../pdfs] [--out data/locations.db]
+"""
+import argparse
+import os
+import re
+import sqlite3
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from ui.db import COVERING_INDEX, DB_PATH, HAZARD_INDEXES
+
+# Table kind -> source file name in the PDF directory
+SOURCES = {
+    "wind": "Wind Table.pdf",
+    "seismic": "Seismic Table.pdf",
+    "temperature": "Temperature Table.pdf",
+}
+
+# Anything that changes extraction output belongs here (it also keys caches)
+EXTRACTOR_SETTINGS = {
+    "table_settings": {"vertical_strategy": "lines", "horizontal_strategy": "lines"},
+    "ocr_dpi": 300,
+    "ocr_min_chars": 20,
+}
+
+# IS 1893 zone factors
+ZONE_FACTORS = {"II": 0.10, "III": 0.16, "IV": 0.24, "V": 0.36}
+
+SCHEMA = """
+CREATE TABLE locations (
+    State TEXT NOT NULL,
+    District TEXT NOT NULL,
+    Wind REAL,
+    SeismicZone TEXT,
+    SeismicFactor REAL,
+    TempMax REAL,
+    TempMin REAL
+)
+"""
+
+# The covering index also serves State-only and (State, District) filters
+# through its leftmost columns, so no separate indexes are needed. Hazard
+# range queries (DB.hazard_cursor) get one index per parameter.
+INDEXES = (
+    COVERING_INDEX,
+) + HAZARD_INDEXES
+
+
+# ==============================================================
+# Extraction (runs in worker processes)
+# ==============================================================
+
+_open_pdfs = {}
+
+
+def _open_pdf(path):
+    # One handle per worker process and file, reused across pages
+    import pdfplumber
+
+    if path not in _open_pdfs:
+        _open_pdfs[path] = pdfplumber.open(path)
+    return _open_pdfs[path]
+
+
+def page_count(path):
+    import pdfplumber
+
+    with pdfplumber.open(path) as pdf:
+        return len(pdf.pages)
+
+
+def _ocr_rows(path, page_no, settings):
+    from pdf2image import convert_from_path
+    import pytesseract
+
+    images = convert_from_path(
+        path, dpi=settings["ocr_dpi"], first_page=page_no + 1, last_page=page_no + 1
+    )
+    rows = []
+    for image in images:
+        for line in pytesseract.image_to_string(image).splitlines():
+            # Columns are separated by runs of 2+ spaces (or |) in OCR output
+            cells = [c for c in re.split(r"\s{2,}|\|", line.strip()) if c]
+            if cells:
+                rows.append(cells)
+    return rows
+
+
+def extract_page(path, page_no, settings=EXTRACTOR_SETTINGS):
+    """Return the raw table rows (lists of cell strings) of one PDF page."""
+    page = _open_pdf(path).pages[page_no]
+    text = page.extract_text() or ""
+
+    if len(text.strip()) < settings["ocr_min_chars"]:
+        return _ocr_rows(path, page_no, settings)
+
+    rows = []
+    for table in page.extract_tables(settings["table_settings"]):
+        rows.extend([c or "" for c in row] for row in table)
+    if not rows:
+        # No ruled table found; fall back to whitespace-separated text lines
+        rows = [re.split(r"\s{2,}", line.strip()) for line in text.splitlines() if line.strip()]
+    return rows
+
+
+# ==============================================================
+# Normalization
+# ==============================================================
+
+_NUM_RE = re.compile(r"^[-+−]?\d+(?:\.\d+)?$")
+_ZONE_RE = re.compile(r"^(?:zone\s*)?(II|III|IV|V)$", re.IGNORECASE)
+_HEADER_WORDS = ("state", "district", "speed", "temperature", "s.no", "sl. no")
+
+
+def clean(cell):
+    cell = re.sub(r"\s+", " ", str(cell or "")).strip(" .*:")
+    return cell.replace("−", "-")
+
+
+def location_key(state, district):
+    """Normalized join key: case-folded, punctuation and spacing removed."""
+    norm = lambda s: re.sub(r"[^a-z0-9]+", " ", s.casefold()).strip()
+    return norm(state), norm(district)
+
+
+def _is_header(cells):
+    joined = " ".join(cells).casefold()
+    if any(_NUM_RE.match(c) or _ZONE_RE.match(c) for c in cells):
+        return False
+    return any(word in joined for word in _HEADER_WORDS)
+
+
+def normalize_rows(kind, rows):
+    """
+    Turn raw rows of one table kind into {(state, district): values}.
+
+    Blank state cells (merged cells in the PDF) carry the previous state.
+    Values are (wind,), (zone, factor) or (tmax, tmin) depending on kind.
+    """
+    out = {}
+    state = None
+    for row in rows:
+        cells = [clean(c) for c in row]
+        cells = [c for c in cells if c]
+        if not cells or _is_header(cells):
+            continue
+
+        nums = [float(c) for c in cells if _NUM_RE.match(c)]
+        zones = [_ZONE_RE.match(c).group(1).upper() for c in cells if _ZONE_RE.match(c)]
+        texts = [c for c in cells if not _NUM_RE.match(c) and not _ZONE_RE.match(c)]
+        if not texts:
+            continue
+
+        if len(texts) >= 2:
+            state, district = texts[-2], texts[-1]
+        elif state is not None:
+            district = texts[0]
+        else:
+            continue
+
+        if kind == "wind" and nums:
+            values = (nums[-1],)
+        elif kind == "seismic" and zones:
+            values = (zones[-1], ZONE_FACTORS[zones[-1]])
+        elif kind == "temperature" and len(nums) >= 2:
+            values = (max(nums[-2:]), min(nums[-2:]))
+        else:
+            continue
+
+        out.setdefault(location_key(state, district), (state, district, values))
+    return out
+
+
+def align_keys(known, table):
+    """
+    Re-key `table` onto the `known` location keys where names only differ
+    in spelling (fuzzy state match, then fuzzy district match within it).
+    Unmatched entries keep their own key.
+    """
+    from ui.matcher import NameMatcher
+
+    by_state = {}
+    for state, district in known:
+        by_state.setdefault(state, []).append(district)
+    states = NameMatcher(sorted(by_state))
+    districts = {}
+
+    out = {}
+    for key, value in table.items():
+        target = key
+        if key not in known:
+            state = states.best(key[0])
+            if state is not None:
+                if state not in districts:
+                    districts[state] = NameMatcher(by_state[state])
+                district = districts[state].best(key[1])
+                if district is not None and (state, district) not in table:
+                    target = (state, district)
+        out.setdefault(target, value)
+    return out
+
+
+def merge_tables(tables):
+    """
+    Join the normalized wind/seismic/temperature maps on (State, District),
+    tolerating spelling differences between the tables.
+
+    Returns location rows in schema column order; parameters missing from a
+    table are left NULL.
+    """
+    aligned = {}
+    names = {}
+    for kind in SOURCES:
+        table = tables.get(kind, {})
+        aligned[kind] = align_keys(names, table) if names else dict(table)
+        for key, (state, district, _) in aligned[kind].items():
+            names.setdefault(key, (state, district))
+
+    rows = []
+    for key, (state, district) in sorted(names.items()):
+        wind = aligned["wind"].get(key, (None, None, (None,)))[2]
+        seismic = aligned["seismic"].get(key, (None, None, (None, None)))[2]
+        temp = aligned["temperature"].get(key, (None, None, (None, None)))[2]
+        rows.append((state, district, *wind, *seismic, *temp))
+    return rows
+
+
+# ==============================================================
+# Writing
+# ==============================================================
+
+def write_db(rows, out_path):
+    """Write rows to a fresh locations table and atomically replace out_path."""
+    os.makedirs(os.path.dirname(os.path.abspath(out_path)), exist_ok=True)
+    tmp_path = out_path + ".tmp"
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+
+    conn = sqlite3.connect(tmp_path)
+    try:
+        with conn:
+            conn.execute(SCHEMA)
+            conn.executemany("INSERT INTO locations VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+            for sql in INDEXES:
+                conn.execute(sql)
+    finally:
+        conn.close()
+    os.replace(tmp_path, out_path)
+
+
+# ==============================================================
+# Pipeline
+# ==============================================================
+
+def _page_hashes(path):
+    import pdfplumber
+    from tools.extract_cache import page_hash
+
+    with pdfplumber.open(path) as pdf:
+        return [page_hash(page) for page in pdf.pages]
+
+
+def extract_all(pdf_dir, workers=None, cache=None):
+    """
+    Extract every page of every source PDF in a process pool.
+
+    With a PageCache only pages whose content hash is not cached are
+    extracted; the rest are served from the cache.
+    """
+    pages = []  # (kind, path, page_no, content_hash or None)
+    for kind, name in SOURCES.items():
+        path = os.path.join(pdf_dir, name)
+        if cache is None:
+            pages.extend((kind, path, page_no, None) for page_no in range(page_count(path)))
+        else:
+            pages.extend((kind, path, page_no, digest)
+                         for page_no, digest in enumerate(_page_hashes(path)))
+
+    results = [cache.get(digest) if cache is not None else None for *_, digest in pages]
+    missing = [i for i, rows in enumerate(results) if rows is None]
+
+    if missing:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {i: pool.submit(extract_page, pages[i][1], pages[i][2]) for i in missing}
+            for i, future in futures.items():
+                results[i] = future.result()
+                if cache is not None:
+                    cache.put(pages[i][3], results[i])
+
+    # Merge in page order so rows keep their original sequence
+    raw = {kind: [] for kind in SOURCES}
+    for (kind, *_), rows in zip(pages, results):
+        raw[kind].extend(rows)
+    return raw
+
+
+def build(pdf_dir, out_path, workers=None, cache_path=None, cache_max_mb=64):
+    start = time.perf_counter()
+    cache = None
+    if cache_path:
+        from tools.extract_cache import PageCache
+
+        cache = PageCache(cache_path, EXTRACTOR_SETTINGS, cache_max_mb * 1024 * 1024)
+    try:
+        raw = extract_all(pdf_dir, workers, cache)
+    finally:
+        if cache is not None:
+            cache.close()
+
+    tables = {kind: normalize_rows(kind, rows) for kind, rows in raw.items()}
+    rows = merge_tables(tables)
+    write_db(rows, out_path)
+
+    for kind, table in tables.items():
+        print(f"{kind:<12}{len(table):>6} locations")
+    if cache is not None:
+        print(f"page cache: {cache.hits} hits, {cache.misses} re-extracted")
+    incomplete = sum(1 for row in rows if None in row)
+    print(f"wrote {len(rows)} rows ({incomplete} incomplete) to {out_path} "
+          f"in {time.perf_counter() - start:.1f} s")
+    return rows
+
+
+def reindex(db_path):
+    """Add the lookup indexes to an existing locations.db."""
+    conn = sqlite3.connect(db_path)
+    try:
+        with conn:
+            for sql in INDEXES:
+                conn.execute(sql)
+    finally:
+        conn.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build locations.db from the source PDFs.")
+    parser.add_argument("--pdf-dir", default=os.path.join("..", "pdfs"))
+    parser.add_argument("--out", default=DB_PATH)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--cache", default=None,
+                        help="page extraction cache (default: extract_cache.db in the user cache directory)")
+    parser.add_argument("--no-cache", action="store_true", help="re-extract every page")
+    parser.add_argument("--cache-max-mb", type=int, default=64)
+    parser.add_argument("--reindex", action="store_true",
+                        help="only add the lookup indexes to an existing --out database")
+    args = parser.parse_args(argv)
+
+    if args.reindex:
+        reindex(args.out)
+        return 0
+
+    cache_path = None
+    if not args.no_cache:
+        from tools.extract_cache import DEFAULT_PATH
+
+        cache_path = args.cache or DEFAULT_PATH
+    build(args.pdf_dir, args.out, args.workers, cache_path, args.cache_max_mb)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,239 @@
+"""
+Columnar, memory-mappable snapshot of the locations table.
+
+A snapshot is a directory of NumPy arrays, one per column, with the state
+and district names dictionary-encoded:
+
+    meta.json          version, row count, source file
+    states.json        sorted state names (state_code indexes this)
+    districts.json     sorted district names (district_code indexes this)
+    state_code.npy     int32
+    district_code.npy  int32
+    wind.npy, factor.npy, tmax.npy, tmin.npy   float64 (NaN when missing)
+    zone.npy           int8 zone rank (II -> 2 ... V -> 5, -1 when unknown)
+    zone_label.npy     int16 index into meta["zone_labels"]
+    key.npy            int64 state_code * len(districts) + district_code
+
+Rows are sorted by (state_code, district_code), so lookups are a binary
+search on the mapped key column. Readers open the arrays with
+mmap_mode="r": worker processes share one page-cached copy and start
+without materializing any rows.
+
+Run from src/:
+    python -m tools.snapshot export --db data/locations.db --out data/locations.snapshot
+    python -m tools.snapshot query data/locations.snapshot --wind-min 47 --zone-min IV
+"""
+import argparse
+import json
+import os
+import sys
+
+from ui.db import DB, DB_PATH, LocationData, zone_rank
+
+SNAPSHOT_VERSION = 1
+FLOAT_COLUMNS = ("wind", "factor", "tmax", "tmin")
+
+
+# ==============================================================
+# Export
+# ==============================================================
+
+def export_snapshot(db_path, out_dir):
+    """Write the locations table at db_path as a snapshot directory."""
+    import numpy as np
+
+    with DB(db_path) as db:
+        pairs = db.get_locations()
+        records = [db.get_location(s, d) for s, d in pairs]
+
+    states = sorted({s for s, _ in pairs})
+    districts = sorted({d for _, d in pairs})
+    state_ids = {name: i for i, name in enumerate(states)}
+    district_ids = {name: i for i, name in enumerate(districts)}
+    zone_labels = sorted({str(r.zone) for r in records if r.zone is not None})
+    zone_ids = {label: i for i, label in enumerate(zone_labels)}
+
+    def floats(values):
+        return np.asarray([np.nan if v is None else v for v in values], dtype=np.float64)
+
+    # get_locations() is sorted by name, which matches the code order
+    columns = {
+        "state_code": np.asarray([state_ids[s] for s, _ in pairs], dtype=np.int32),
+        "district_code": np.asarray([district_ids[d] for _, d in pairs], dtype=np.int32),
+        "wind": floats(r.wind for r in records),
+        "factor": floats(r.factor for r in records),
+        "tmax": floats(r.tmax for r in records),
+        "tmin": floats(r.tmin for r in records),
+        "zone": np.asarray([zone_rank(r.zone, -1) for r in records], dtype=np.int8),
+        "zone_label": np.asarray(
+            [-1 if r.zone is None else zone_ids[str(r.zone)] for r in records], dtype=np.int16),
+    }
+    # Stored, so readers binary-search the mapped file instead of building it
+    columns["key"] = columns["state_code"].astype(np.int64) * len(districts) + columns["district_code"]
+
+    os.makedirs(out_dir, exist_ok=True)
+    for name, array in columns.items():
+        np.save(os.path.join(out_dir, f"{name}.npy"), array)
+    for name, table in (("states", states), ("districts", districts)):
+        with open(os.path.join(out_dir, f"{name}.json"), "w", encoding="utf-8") as f:
+            json.dump(table, f, ensure_ascii=False)
+    # meta.json last: a snapshot without it is incomplete
+    with open(os.path.join(out_dir, "meta.json"), "w", encoding="utf-8") as f:
+        json.dump({
+            "version": SNAPSHOT_VERSION,
+            "rows": len(pairs),
+            "source": os.path.abspath(db_path),
+            "zone_labels": zone_labels,
+        }, f, indent=2)
+    return len(pairs)
+
+
+# ==============================================================
+# Reader
+# ==============================================================
+
+class LocationSnapshot:
+    """Lookups and vectorized filters served from a memory-mapped snapshot."""
+
+    def __init__(self, path):
+        import numpy as np
+
+        self.path = path
+        with open(os.path.join(path, "meta.json"), encoding="utf-8") as f:
+            self.meta = json.load(f)
+        if self.meta["version"] > SNAPSHOT_VERSION:
+            raise ValueError(f"snapshot version {self.meta['version']} is not supported")
+        with open(os.path.join(path, "states.json"), encoding="utf-8") as f:
+            self.states = json.load(f)
+        with open(os.path.join(path, "districts.json"), encoding="utf-8") as f:
+            self.districts = json.load(f)
+        self._state_ids = {name: i for i, name in enumerate(self.states)}
+        self._district_ids = {name: i for i, name in enumerate(self.districts)}
+
+        load = lambda name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode="r")
+        self.state_code = load("state_code")
+        self.district_code = load("district_code")
+        self.zone = load("zone")
+        self.zone_label = load("zone_label")
+        for name in FLOAT_COLUMNS:
+            setattr(self, name, load(name))
+        # Snapshots written before key.npy existed compute it on first find()
+        self._keys = load("key") if os.path.exists(os.path.join(path, "key.npy")) else None
+
+    def __len__(self):
+        return self.meta["rows"]
+
+    def _key_column(self):
+        if self._keys is None:
+            import numpy as np
+
+            self._keys = (self.state_code.astype(np.int64) * len(self.districts)
+                          + self.district_code)
+        return self._keys
+
+    def find(self, state, district):
+        """Row number of (state, district), or -1."""
+        import numpy as np
+
+        s, d = self._state_ids.get(state), self._district_ids.get(district)
+        if s is None or d is None:
+            return -1
+        key = s * len(self.districts) + d
+        keys = self._key_column()
+        row = int(np.searchsorted(keys, key))
+        return row if row < len(keys) and keys[row] == key else -1
+
+    def row(self, row):
+        """LocationData for a row number."""
+        label = int(self.zone_label[row])
+        value = lambda column: None if column[row] != column[row] else float(column[row])
+        return LocationData(
+            value(self.wind),
+            None if label < 0 else self.meta["zone_labels"][label],
+            value(self.factor),
+            value(self.tmax),
+            value(self.tmin),
+        )
+
+    def get_location(self, state, district):
+        row = self.find(state, district)
+        return None if row < 0 else self.row(row)
+
+    def mask(self, wind_min=None, wind_max=None, zone_min=None, zone_max=None,
+             factor_min=None, factor_max=None, tmax_min=None, tmin_max=None,
+             state=None):
+        """
+        Boolean row mask for the given envelope (all bounds inclusive).
+        Zone bounds accept "IV" or 4; an unknown zone raises ValueError.
+        tmax_min / tmin_max select hot and cold sites: TempMax >= tmax_min,
+        TempMin <= tmin_max.
+        """
+        import numpy as np
+
+        mask = np.ones(len(self), dtype=bool)
+        for column, low, high in (
+            (self.wind, wind_min, wind_max),
+            (self.factor, factor_min, factor_max),
+            (self.tmax, tmax_min, None),
+            (self.tmin, None, tmin_max),
+        ):
+            if low is not None:
+                mask &= column >= low
+            if high is not None:
+                mask &= column <= high
+        if zone_min is not None:
+            mask &= self.zone >= zone_rank(zone_min)
+        if zone_max is not None:
+            mask &= (self.zone <= zone_rank(zone_max)) & (self.zone >= 0)
+        if state is not None:
+            mask &= self.state_code == self._state_ids.get(state, -1)
+        return mask
+
+    def filter(self, **bounds):
+        """[(state, district)] of rows inside the envelope; see mask()."""
+        import numpy as np
+
+        rows = np.nonzero(self.mask(**bounds))[0]
+        return [(self.states[self.state_code[r]], self.districts[self.district_code[r]])
+                for r in rows]
+
+
+# ==============================================================
+# CLI
+# ==============================================================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Columnar snapshot of the locations table.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    export = sub.add_parser("export", help="write a snapshot from locations.db")
+    export.add_argument("--db", default=DB_PATH)
+    export.add_argument("--out", default=os.path.join("data", "locations.snapshot"))
+
+    query = sub.add_parser("query", help="list locations inside an envelope")
+    query.add_argument("snapshot")
+    for name, kind in (("wind-min", float), ("wind-max", float), ("zone-min", str),
+                       ("zone-max", str), ("factor-min", float), ("factor-max", float),
+                       ("tmax-min", float), ("tmin-max", float), ("state", str)):
+        query.add_argument(f"--{name}", type=kind, default=None)
+
+    args = parser.parse_args(argv)
+    if args.command == "export":
+        rows = export_snapshot(args.db, args.out)
+        print(f"wrote {rows} rows to {args.out}", file=sys.stderr)
+        return 0
+
+    snap = LocationSnapshot(args.snapshot)
+    bounds = {k: v for k, v in vars(args).items() if k not in ("command", "snapshot") and v is not None}
+    try:
+        matches = snap.filter(**bounds)
+    except ValueError as exc:
+        parser.error(str(exc))
+    for state, district in matches:
+        print(f"{state}\t{district}")
+    print(f"{len(matches)} of {len(snap)} locations", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
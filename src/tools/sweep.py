@@ -0,0 +1,295 @@
+"""
+Parametric design-space sweep.
+
+Takes value lists (or start:stop:step ranges) for span, carriageway width,
+footpath, skew, girder spacing, deck overhang and the three material
+grades, crosses them with a list of locations, and evaluates the input
+validation, girder layout and material properties (with design strengths
+and the girders' restrained thermal stress at each location's temperature
+range) for every combination.
+
+Configurations are addressed by a flat index, so the parent only sends
+(start, stop) ranges to the worker processes; each chunk is evaluated with
+NumPy and streamed to CSV or Parquet as it completes.
+
+Run from src/:
+    python -m tools.sweep --span 20:45:5 --cw 7.5,11 --skew -15:15:5 -o sweep.csv
+"""
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from ui import materials
+from ui.db import DB_PATH
+from ui.materials import CONCRETE_GRADES, STEEL_GRADES
+
+FOOTPATHS = ("None", "Single-Sided", "Both Sides")
+
+# Sweep axes in index order; the location axis is always last
+AXES = ("span", "carriageway_width", "footpath", "skew", "spacing", "overhang",
+        "girder_grade", "cross_grade", "concrete_grade")
+
+LOCATION_COLUMNS = ("state", "district", "wind", "seismic_zone", "seismic_factor",
+                    "temp_max", "temp_min")
+
+
+def parse_values(text, cast=float):
+    """'20:45:5' -> [20, 25, ..., 45] (stop inclusive); 'a,b,c' -> [a, b, c]."""
+    text = text.strip()
+    if ":" in text and cast is float:
+        start, stop, step = (float(v) for v in text.split(":"))
+        if step <= 0:
+            raise ValueError(f"range step must be positive: {text}")
+        count = int(round((stop - start) / step)) + 1
+        return [round(start + i * step, 6) for i in range(max(count, 0))]
+    return [cast(v.strip()) for v in text.split(",") if v.strip()]
+
+
+def load_locations(db_path, pairs=None):
+    """[(state, district, LocationData)] for the given pairs, or every location."""
+    from ui.db import DB
+
+    with DB(db_path) as db:
+        pairs = list(pairs) if pairs else db.get_locations()
+        data = db.get_location_data_many(pairs)
+    return [(s, d, row) for (s, d), row in zip(pairs, data) if row is not None]
+
+
+def _thermal_stress(grade, row):
+    if row.tmin is None or row.tmax is None:
+        return float("nan")
+    return materials.thermal_effects(grade, row.tmin, row.tmax)["stress"]
+
+
+def material_tables(axes, locations=()):
+    """
+    Per-grade property arrays aligned with the grade axes; raises
+    MaterialError for an unknown grade before any worker starts.
+    modular_ratio is indexed [girder grade, concrete grade] and
+    girder_thermal_stress [girder grade, location].
+    """
+    import numpy as np
+
+    girder, cross, conc = axes["girder_grade"], axes["cross_grade"], axes["concrete_grade"]
+    return {
+        "girder_fy": np.asarray([materials.steel(g).fy for g in girder]),
+        "girder_fyd": np.asarray([materials.steel_design(g)["fyd"] for g in girder]),
+        "cross_fy": np.asarray([materials.steel(g).fy for g in cross]),
+        "cross_fyd": np.asarray([materials.steel_design(g)["fyd"] for g in cross]),
+        "concrete_fck": np.asarray([materials.concrete(c).fck for c in conc]),
+        "concrete_fcd": np.asarray([materials.concrete_design(c)["fcd"] for c in conc]),
+        "modular_ratio": np.asarray([[materials.modular_ratio(g, c) for c in conc] for g in girder]),
+        # Many districts share a temperature range, so most lookups hit the cache
+        "girder_thermal_stress": np.asarray(
+            [[_thermal_stress(g, row) for *_, row in locations] for g in girder],
+            dtype=float).reshape(len(girder), len(locations)),
+    }
+
+
+def config_count(axes, locations):
+    total = max(len(locations), 1)
+    for name in AXES:
+        total *= len(axes[name])
+    return total
+
+
+# ==============================================================
+# Evaluation (runs in worker processes)
+# ==============================================================
+
+_axes = None
+_locations = None
+_materials = None
+
+
+def _init_worker(axes, locations, tables):
+    import numpy as np
+
+    global _axes, _locations, _materials
+    _axes = {name: np.asarray(axes[name]) for name in AXES}
+    _materials = tables
+    _locations = {
+        "state": np.asarray([s for s, _, _ in locations], dtype=object),
+        "district": np.asarray([d for _, d, _ in locations], dtype=object),
+        "wind": np.asarray([r.wind for *_, r in locations], dtype=float),
+        "seismic_zone": np.asarray([r.zone for *_, r in locations], dtype=object),
+        "seismic_factor": np.asarray([r.factor for *_, r in locations], dtype=float),
+        "temp_max": np.asarray([r.tmax for *_, r in locations], dtype=float),
+        "temp_min": np.asarray([r.tmin for *_, r in locations], dtype=float),
+    }
+
+
+def evaluate_chunk(start, stop):
+    """Evaluate configurations [start, stop) and return them as a DataFrame."""
+    import numpy as np
+    import pandas as pd
+
+    from ui import geometry, validation
+
+    n_loc = max(len(_locations["state"]), 1)
+    shape = tuple(len(_axes[name]) for name in AXES) + (n_loc,)
+    idx = np.unravel_index(np.arange(start, stop), shape)
+
+    cols = {name: _axes[name][i] for name, i in zip(AXES, idx)}
+    span, skew = cols["span"].astype(float), cols["skew"].astype(float)
+    overall = cols["carriageway_width"].astype(float) + geometry.OVERALL_WIDTH_ALLOWANCE
+    girders, spacing, layout_ok = geometry.snap_spacing(
+        overall, cols["spacing"].astype(float), cols["overhang"].astype(float))
+
+    cols["overall_width"] = overall
+    cols["girders"] = girders
+    cols["spacing_exact"] = spacing
+    cols["span_ok"] = (span >= validation.SPAN_MIN) & (span <= validation.SPAN_MAX)
+    cols["skew_ok"] = np.abs(skew) <= validation.SKEW_LIMIT
+    cols["layout_ok"] = layout_ok
+
+    girder, cross, conc = (idx[AXES.index(name)] for name in ("girder_grade", "cross_grade", "concrete_grade"))
+    for name in ("girder_fy", "girder_fyd"):
+        cols[name] = _materials[name][girder]
+    for name in ("cross_fy", "cross_fyd"):
+        cols[name] = _materials[name][cross]
+    for name in ("concrete_fck", "concrete_fcd"):
+        cols[name] = _materials[name][conc]
+    cols["modular_ratio"] = _materials["modular_ratio"][girder, conc]
+
+    if len(_locations["state"]):
+        for name in LOCATION_COLUMNS:
+            cols[name] = _locations[name][idx[-1]]
+        cols["girder_thermal_stress"] = _materials["girder_thermal_stress"][girder, idx[-1]]
+    return pd.DataFrame(cols)
+
+
+# ==============================================================
+# Driver
+# ==============================================================
+
+class _Writer:
+    """Appends DataFrame chunks to a CSV or Parquet file."""
+
+    def __init__(self, path):
+        self.path = path
+        self.parquet = path.endswith(".parquet")
+        self._writer = None
+        self._first = True
+
+    def write(self, frame):
+        if self.parquet:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            table = pa.Table.from_pandas(frame, preserve_index=False)
+            if self._writer is None:
+                self._writer = pq.ParquetWriter(self.path, table.schema)
+            self._writer.write_table(table)
+        else:
+            frame.to_csv(self.path, mode="w" if self._first else "a",
+                         header=self._first, index=False)
+        self._first = False
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+
+
+def run_sweep(axes, locations, out_path, workers=None, chunk_size=100_000,
+              progress=None, is_cancelled=None):
+    """
+    Evaluate every configuration and stream the results to out_path.
+
+    progress(done, total) is called after each written chunk; the sweep
+    stops early when is_cancelled() returns True. Returns rows written.
+    """
+    total = config_count(axes, locations)
+    tables = material_tables(axes, locations)
+    bounds = [(s, min(s + chunk_size, total)) for s in range(0, total, chunk_size)]
+    workers = workers or os.cpu_count() or 1
+    writer = _Writer(out_path)
+    done = 0
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(axes, locations, tables)) as pool:
+            # Keep a bounded window of chunks in flight so results are
+            # written in order without holding the whole sweep in memory
+            pending = []
+            queue = iter(bounds)
+            for bound in queue:
+                pending.append(pool.submit(evaluate_chunk, *bound))
+                if len(pending) >= workers * 2:
+                    break
+            while pending:
+                frame = pending.pop(0).result()
+                writer.write(frame)
+                done += len(frame)
+                if progress is not None:
+                    progress(done, total)
+                if is_cancelled is not None and is_cancelled():
+                    for future in pending:
+                        future.cancel()
+                    break
+                bound = next(queue, None)
+                if bound is not None:
+                    pending.append(pool.submit(evaluate_chunk, *bound))
+    finally:
+        writer.close()
+    return done
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run a parametric design-space sweep.")
+    parser.add_argument("--span", default="20:45:5")
+    parser.add_argument("--cw", default="7.5", help="carriageway widths (m)")
+    parser.add_argument("--footpath", default=",".join(FOOTPATHS))
+    parser.add_argument("--skew", default="0")
+    parser.add_argument("--spacing", default="2.5")
+    parser.add_argument("--overhang", default="1.0")
+    parser.add_argument("--girder-grade", default=",".join(STEEL_GRADES))
+    parser.add_argument("--cross-grade", default=",".join(STEEL_GRADES))
+    parser.add_argument("--concrete-grade", default=",".join(CONCRETE_GRADES))
+    parser.add_argument("--locations", default="all",
+                        help="'all', 'none', or 'State/District;State/District'")
+    parser.add_argument("--db", default=DB_PATH)
+    parser.add_argument("-o", "--output", required=True, help=".csv or .parquet")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--chunk-size", type=int, default=100_000)
+    args = parser.parse_args(argv)
+
+    axes = {
+        "span": parse_values(args.span),
+        "carriageway_width": parse_values(args.cw),
+        "footpath": parse_values(args.footpath, str),
+        "skew": parse_values(args.skew),
+        "spacing": parse_values(args.spacing),
+        "overhang": parse_values(args.overhang),
+        "girder_grade": parse_values(args.girder_grade, str),
+        "cross_grade": parse_values(args.cross_grade, str),
+        "concrete_grade": parse_values(args.concrete_grade, str),
+    }
+    try:
+        material_tables(axes)
+    except materials.MaterialError as exc:
+        parser.error(str(exc))
+
+    if args.locations == "none":
+        locations = []
+    elif args.locations == "all":
+        locations = load_locations(args.db)
+    else:
+        pairs = [tuple(p.split("/", 1)) for p in args.locations.split(";") if p]
+        locations = load_locations(args.db, pairs)
+
+    total = config_count(axes, locations)
+    start = time.perf_counter()
+
+    def report(done, total):
+        print(f"\r{done}/{total} ({done / total:.0%})", end="", file=sys.stderr, flush=True)
+
+    rows = run_sweep(axes, locations, args.output, args.workers, args.chunk_size, report)
+    print(f"\n{rows} configurations written to {args.output} "
+          f"in {time.perf_counter() - start:.1f} s", file=sys.stderr)
+    return 0 if rows == total else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
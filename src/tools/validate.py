@@ -0,0 +1,44 @@
+"""
+Validate serialized Basic Inputs forms with the same rules as the UI.
+
+Reads a CSV (one form per row, columns named after the rule fields, e.g.
+span and skew) and prints every row with a message. Exits non-zero when
+any error-severity rule fails.
+
+Run from src/:  python -m tools.validate forms.csv
+"""
+import argparse
+import csv
+import sys
+
+from ui import validation
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Validate Basic Inputs forms from a CSV.")
+    parser.add_argument("input", help="CSV file ('-' for stdin)")
+    args = parser.parse_args(argv)
+
+    infile = sys.stdin if args.input == "-" else open(args.input, newline="", encoding="utf-8-sig")
+    rows = errors = warnings = 0
+    try:
+        reader = csv.DictReader(infile)
+        for line_no, result in enumerate(validation.validate_records(reader), start=2):
+            rows += 1
+            for field, message in result.items():
+                if not message:
+                    continue
+                severity = validation.RULES_BY_FIELD[field].severity
+                errors += severity == validation.ERROR
+                warnings += severity == validation.WARNING
+                print(f"line {line_no}: {field}: {severity}: {message}")
+    finally:
+        if infile is not sys.stdin:
+            infile.close()
+
+    print(f"{rows} forms, {errors} errors, {warnings} warnings", file=sys.stderr)
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,287 @@
+"""
+Application images, resolved and decoded once.
+
+- asset paths are resolved once at import
+- preload() decodes images in QThreadPool workers (QImage is safe off the
+  GUI thread; QPixmap is not)
+- pixmap(name, size, dpr) returns a variant pre-scaled for the screen's
+  device pixel ratio, cached in QPixmapCache and as a PNG under the user
+  cache directory (keyed by the scaled size and the source file's mtime,
+  so edited assets are picked up; the least recently used files go once
+  the directory outgrows DISK_CACHE_BYTES)
+- AssetLabel shows an asset that rescales with its widget, smoothly but
+  only after resizing pauses
+"""
+import os
+import threading
+
+from PySide6.QtWidgets import QLabel, QSizePolicy
+from PySide6.QtGui import QIcon, QImage, QImageReader, QPixmap, QPixmapCache
+from PySide6.QtCore import (
+    Qt, QObject, QRunnable, QThreadPool, QTimer, QSize, Signal
+)
+
+from ui.resources import resource_path, user_dir
+
+ASSETS = {
+    "icon": "assets/icon.ico",
+    "splash": "assets/splash.png",
+    "cross_section": "assets/bridge_cross_section.png",
+}
+PATHS = {name: resource_path(relative) for name, relative in ASSETS.items()}
+
+# Requested sizes are rounded down to this step (logical px) so a splitter
+# drag produces a handful of cached variants instead of one per pixel
+SIZE_STEP = 16
+
+# Scaled PNGs kept on disk, least recently used removed first
+DISK_CACHE_BYTES = 32 * 1024 * 1024
+
+_images = {}                 # name -> decoded full-size QImage
+_locks = {}                  # name -> lock held while decoding it
+_lock = threading.Lock()
+_icons = {}
+_signals = None
+_disk_dir = None
+_pending = set()             # cache keys with a _ScaleTask queued or running
+
+
+class AssetSignals(QObject):
+    # cache key, scaled QImage; queued back to the GUI thread
+    scaled = Signal(str, QImage)
+
+
+def signals():
+    """Shared signal object; create it from the GUI thread first."""
+    global _signals
+    if _signals is None:
+        _signals = AssetSignals()
+        # Connected first, so QPixmapCache is filled before labels look
+        _signals.scaled.connect(_on_scaled)
+    return _signals
+
+
+def path(name):
+    return PATHS[name]
+
+
+# ==============================================================
+# Decoding and scaling (any thread)
+# ==============================================================
+
+def image(name):
+    """Full-size QImage of an asset, decoded on first use."""
+    with _lock:
+        lock = _locks.setdefault(name, threading.Lock())
+    # Per-asset lock: a caller waits for an in-flight decode of the same
+    # asset instead of repeating it, but not for other assets
+    with lock:
+        if name not in _images:
+            _images[name] = QImage(PATHS[name])
+        return _images[name]
+
+
+def _quantize(size):
+    return QSize(max(SIZE_STEP, size.width() // SIZE_STEP * SIZE_STEP),
+                 max(SIZE_STEP, size.height() // SIZE_STEP * SIZE_STEP))
+
+
+def cache_key(name, size=None, dpr=1.0):
+    if size is None:
+        return f"asset:{name}@{dpr:g}"
+    size = _quantize(size)
+    return f"asset:{name}:{size.width()}x{size.height()}@{dpr:g}"
+
+
+def _disk_cache_dir():
+    global _disk_dir
+    if _disk_dir is None:
+        _disk_dir = os.path.join(user_dir("cache"), "assets")
+    return _disk_dir
+
+
+def _disk_path(name, scaled):
+    """Cache file for `name` scaled to `scaled` device pixels."""
+    try:
+        mtime = os.stat(PATHS[name]).st_mtime_ns
+    except OSError:
+        return None
+    return os.path.join(_disk_cache_dir(), f"{name}-{scaled.width()}x{scaled.height()}-{mtime}.png")
+
+
+def _trim_disk_cache(limit=DISK_CACHE_BYTES):
+    """Delete the least recently used cache files until the rest fit in limit."""
+    try:
+        files = [(e.stat().st_mtime, e.stat().st_size, e.path)
+                 for e in os.scandir(_disk_cache_dir()) if e.is_file()]
+    except OSError:
+        return
+    total = sum(size for _, size, _ in files)
+    for _, size, file in sorted(files):
+        if total <= limit:
+            break
+        try:
+            os.remove(file)
+        except OSError:
+            continue    # another worker got there first
+        total -= size
+
+
+def _source_size(name):
+    """Pixel size of an asset, from its header if it is not decoded yet."""
+    if name in _images:
+        return _images[name].size()
+    return QImageReader(PATHS[name]).size()
+
+
+def scaled_image(name, size=None, dpr=1.0):
+    """
+    QImage of `name` fitted (aspect kept) into `size` logical pixels at
+    `dpr`, never upscaled past the source. Reads and fills the disk cache.
+    """
+    if size is None:
+        return image(name)
+    size = _quantize(size)
+    target = QSize(int(size.width() * dpr), int(size.height() * dpr))
+    source_size = _source_size(name)
+    if not source_size.isValid() or (target.width() >= source_size.width()
+                                     and target.height() >= source_size.height()):
+        return image(name)
+
+    # Every box the image fits the same way shares one file
+    disk = _disk_path(name, source_size.scaled(target, Qt.KeepAspectRatio))
+    if disk and os.path.exists(disk):
+        cached = QImage(disk)
+        if not cached.isNull():
+            try:
+                os.utime(disk)    # recently used
+            except OSError:
+                pass
+            return cached
+
+    source = image(name)
+    if source.isNull():
+        return source
+    result = source.scaled(target, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+    if disk:
+        try:
+            os.makedirs(os.path.dirname(disk), exist_ok=True)
+            tmp = f"{disk}.{threading.get_ident()}.tmp"
+            if result.save(tmp, "PNG"):
+                os.replace(tmp, disk)
+                _trim_disk_cache()
+        except OSError:
+            pass
+    return result
+
+
+class _ScaleTask(QRunnable):
+    def __init__(self, name, size, dpr, key):
+        super().__init__()
+        self.name, self.size, self.dpr, self.key = name, size, dpr, key
+
+    def run(self):
+        signals().scaled.emit(self.key, scaled_image(self.name, self.size, self.dpr))
+
+
+def preload(*names):
+    """Start decoding the given assets in the background."""
+    for name in names:
+        QThreadPool.globalInstance().start(lambda n=name: image(n))
+
+
+# ==============================================================
+# Pixmaps (GUI thread)
+# ==============================================================
+
+def icon(name):
+    """QIcon of an asset (QIcon loads its files lazily)."""
+    if name not in _icons:
+        _icons[name] = QIcon(PATHS[name])
+    return _icons[name]
+
+
+def _to_pixmap(img, dpr):
+    pixmap = QPixmap.fromImage(img)
+    pixmap.setDevicePixelRatio(dpr)
+    return pixmap
+
+
+def pixmap(name, size=None, dpr=1.0):
+    """Pixmap of `name` scaled to fit `size` (logical px), cached."""
+    key = cache_key(name, size, dpr)
+    cached = QPixmapCache.find(key)
+    if cached is not None and not cached.isNull():
+        return cached
+    result = _to_pixmap(scaled_image(name, size, dpr), dpr)
+    QPixmapCache.insert(key, result)
+    return result
+
+
+def request(name, size, dpr=1.0):
+    """
+    Cached pixmap for (name, size, dpr), or None after starting a worker
+    that scales it (unless one already is); signals().scaled fires with
+    the key when it is done.
+    """
+    key = cache_key(name, size, dpr)
+    cached = QPixmapCache.find(key)
+    if cached is not None and not cached.isNull():
+        return cached
+    # One worker per key; its result reaches every label waiting for it
+    if key not in _pending:
+        _pending.add(key)
+        QThreadPool.globalInstance().start(_ScaleTask(name, size, dpr, key))
+    return None
+
+
+def _on_scaled(key, img):
+    _pending.discard(key)
+    dpr = float(key.rsplit("@", 1)[1])
+    QPixmapCache.insert(key, _to_pixmap(img, dpr))
+
+
+class AssetLabel(QLabel):
+    """
+    Label showing an asset fitted to its size. On resize the current
+    pixmap stays up until resizing pauses for RESCALE_DELAY_MS, then the
+    new variant comes from the cache or a background worker.
+    """
+    RESCALE_DELAY_MS = 80
+
+    def __init__(self, name, parent=None):
+        super().__init__(parent)
+        self.name = name
+        self._key = None
+        self.setAlignment(Qt.AlignCenter)
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        # Our own pixmap must not feed back into the layout's size hint
+        self.setMinimumSize(1, 1)
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(self.RESCALE_DELAY_MS)
+        self._timer.timeout.connect(self.rescale)
+
+        signals().scaled.connect(self._on_scaled)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        if self.pixmap().isNull():
+            self.rescale()
+        else:
+            self._timer.start()
+
+    def rescale(self):
+        dpr = self.devicePixelRatioF()
+        self._key = cache_key(self.name, self.size(), dpr)
+        result = request(self.name, self.size(), dpr)
+        if result is not None:
+            self.setPixmap(result)
+
+    def _on_scaled(self, key, _img):
+        if key == self._key:
+            cached = QPixmapCache.find(key)
+            if cached is not None:
+                self.setPixmap(cached)
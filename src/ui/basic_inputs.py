@@ -1,19 +1,49 @@
+import math
+
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QLabel, QGroupBox, QRadioButton, QHBoxLayout,
     QComboBox, QLineEdit, QPushButton, QTabWidget, QCheckBox, QFormLayout,
     QMessageBox, QSizePolicy, QFrame, QScrollArea
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer, Signal
 
-from ui.db import DB
-from ui.modify_geometry_dialog import ModifyGeometryDialog
-from ui.custom_table_editor import CustomTableEditor
+from ui.db_loader import load_database
+from ui.environment import SOURCE_CUSTOM, EnvironmentStore
+from ui.form_validator import FormValidator
+from ui.geometry import overall_width
+from ui.materials import CONCRETE_GRADES, STEEL_GRADES, describe
+from ui.location_picker import LocationPicker, build_location_index
+from ui.matcher import NameMatcher
+from ui.session_cache import SessionCache
+from ui.tasks import TaskRunner
+from ui.validation import CUSTOM_FIELDS, check_custom, parse_number
 
 
 class BasicInputs(QWidget):
-    def __init__(self):
+    DB_LOAD_TIMEOUT_MS = 15000
+
+    # Emitted when the location DB load has finished (True) or given up (False)
+    db_ready = Signal(bool)
+    # Cross-section inputs (see section_geometry()) whenever one changes
+    geometry_changed = Signal(object)
+
+    def __init__(self, session=None):
+        """`session`: SessionCache to use; default is the user's QSettings."""
         super().__init__()
 
+        self.db = None
+        self.custom_values = None      # last CustomTableEditor.get_values()
+        self.geometry_values = None    # last ModifyGeometryDialog.get_values()
+        self._pending_location = None  # project location waiting for the DB
+        self.session = session if session is not None else SessionCache()
+        self._session_state = None     # state whose districts the session holds
+        # Slow work (DB load, file I/O) runs here, off the GUI thread
+        self.tasks = TaskRunner(self)
+
+        # Wind/seismic/temperature parameters in effect; drives the labels
+        self.environment = EnvironmentStore(self)
+        self.environment.changed.connect(self.update_environment_labels)
+
         # =============================================================
         # MAIN LAYOUT + SCROLLABLE PAGE
         # =============================================================
@@ -87,6 +117,16 @@ class BasicInputs(QWidget):
         self.cmb_state.setStyleSheet(combo_style)
         self.cmb_district.setStyleSheet(combo_style)
 
+        # Type-ahead search on both combos; models are attached once the DB loads
+        self.state_picker = LocationPicker(self.cmb_state)
+        self.district_picker = LocationPicker(self.cmb_district)
+        self.state_picker.picked.connect(self.on_location_picked)
+        self.district_picker.picked.connect(self.on_location_picked)
+
+        self.chk_search_all = QCheckBox("Search districts in all states")
+        self.chk_search_all.setEnabled(False)
+        self.chk_search_all.toggled.connect(self.on_search_all_toggled)
+
         # Environment labels
         self.lbl_wind = QLabel("Basic Wind Speed: -")
         self.lbl_seismic = QLabel("Seismic Zone: -")
@@ -143,6 +183,7 @@ class BasicInputs(QWidget):
         # Add rows
         form_layout.addRow("State:", self.cmb_state)
         form_layout.addRow("District:", self.cmb_district)
+        form_layout.addRow("", self.chk_search_all)
         loc_layout.addWidget(form_container)
 
         # Separator
@@ -166,8 +207,6 @@ class BasicInputs(QWidget):
         btn_row.addWidget(self.btn_custom_table)
         loc_layout.addLayout(btn_row)
 
-        self.btn_custom_table.clicked.connect(self.open_custom_dialog)
-
         page_layout.addWidget(loc_box)
 
         # =============================================================
@@ -192,12 +231,11 @@ class BasicInputs(QWidget):
 
         page_layout.addWidget(geom_box)
 
+        # Styled by FormValidator according to each rule's severity
         self.err_span = QLabel("")
-        self.err_span.setStyleSheet("color: red;")
         page_layout.addWidget(self.err_span)
 
         self.warn_skew = QLabel("")
-        self.warn_skew.setStyleSheet("color: orange;")
         page_layout.addWidget(self.warn_skew)
 
         # =============================================================
@@ -210,17 +248,26 @@ class BasicInputs(QWidget):
         mat_box.setLayout(mat_form)
 
         self.cmb_girder = QComboBox()
-        self.cmb_girder.addItems(["E250", "E350", "E450"])
+        self.cmb_girder.addItems(STEEL_GRADES)
 
         self.cmb_cross = QComboBox()
-        self.cmb_cross.addItems(["E250", "E350", "E450"])
+        self.cmb_cross.addItems(STEEL_GRADES)
 
         self.cmb_concrete = QComboBox()
-        self.cmb_concrete.addItems(["M25", "M30", "M35", "M40", "M50", "M60"])
-
-        mat_form.addRow("Girder Steel Grade:", self.cmb_girder)
-        mat_form.addRow("Cross-Bracing Steel Grade:", self.cmb_cross)
-        mat_form.addRow("Deck Concrete Grade:", self.cmb_concrete)
+        self.cmb_concrete.addItems(CONCRETE_GRADES)
+
+        # Property summary under each grade
+        self.material_labels = {}
+        for label, combo in (("Girder Steel Grade:", self.cmb_girder),
+                             ("Cross-Bracing Steel Grade:", self.cmb_cross),
+                             ("Deck Concrete Grade:", self.cmb_concrete)):
+            props = QLabel()
+            props.setStyleSheet("color: gray;")
+            combo.currentTextChanged.connect(self.update_material_labels)
+            self.material_labels[combo] = props
+            mat_form.addRow(label, combo)
+            mat_form.addRow("", props)
+        self.update_material_labels()
 
         page_layout.addWidget(mat_box)
 
@@ -241,16 +288,25 @@ class BasicInputs(QWidget):
         self.chk_mode_name.toggled.connect(self.toggle_location_modes)
         self.chk_mode_custom.toggled.connect(self.toggle_location_modes)
 
-        self.in_span.textChanged.connect(self.validate_span)
-        self.in_skew.textChanged.connect(self.validate_skew)
+        self.validator = FormValidator(self)
+        self.validator.bind("span", self.in_span, self.err_span)
+        self.validator.bind("skew", self.in_skew, self.warn_skew)
 
-        # Load DB at end
+        self.in_cw.textChanged.connect(self.emit_geometry)
+        self.in_span.textChanged.connect(self.emit_geometry)
+        self.in_fp.currentTextChanged.connect(self.emit_geometry)
+
+        # Load DB at end (in the background, combos filled when ready)
         self.load_db()
 
     # ==============================================================  
     # Validation & Mode Switching
     # ==============================================================  
 
+    def update_material_labels(self, *_):
+        for combo, label in self.material_labels.items():
+            label.setText(describe(combo.currentText()))
+
     def on_structure_type_change(self):
         if self.radio_other.isChecked():
             self.type_warning.setText("Other structures are not included. Inputs disabled.")
@@ -260,35 +316,19 @@ class BasicInputs(QWidget):
     def toggle_location_modes(self):
         if self.chk_mode_name.isChecked():
             self.chk_mode_custom.setChecked(False)
-            self.cmb_state.setEnabled(True)
+            self.cmb_state.setEnabled(self.db is not None)
             self.cmb_district.setEnabled(False)
+            self.chk_search_all.setEnabled(self.db is not None)
             self.btn_custom_table.setEnabled(False)
 
         elif self.chk_mode_custom.isChecked():
             self.chk_mode_name.setChecked(False)
             self.cmb_state.setEnabled(False)
             self.cmb_district.setEnabled(False)
+            self.chk_search_all.setEnabled(False)
             self.btn_custom_table.setEnabled(True)
 
-    def validate_span(self):
-        try:
-            value = float(self.in_span.text())
-            if value < 20 or value > 45:
-                self.err_span.setText("Outside the software range.")
-            else:
-                self.err_span.setText("")
-        except:
-            self.err_span.setText("")
-
-    def validate_skew(self):
-        try:
-            skew = float(self.in_skew.text())
-            if skew < -15 or skew > 15:
-                self.warn_skew.setText("IRC 24 (2010) requires detailed analysis.")
-            else:
-                self.warn_skew.setText("")
-        except:
-            self.warn_skew.setText("")
+        self.sync_environment()
 
     # ==============================================================  
     # DB LOADERS
@@ -299,14 +339,19 @@ class BasicInputs(QWidget):
             self.cmb_district.blockSignals(True)
             self.cmb_district.clear()
             self.cmb_district.addItem("Select state first")
-            self.cmb_district.setEnabled(False)
+            self.cmb_district.setEnabled(self.chk_search_all.isChecked())
             self.cmb_district.blockSignals(False)
+            self.sync_environment()
             return
 
+        if not self.chk_search_all.isChecked():
+            self.district_picker.set_state(state)
+
         # Load districts
         self.cmb_district.blockSignals(True)
         self.cmb_district.clear()
-        districts = self.db.get_districts(state) or []
+        # Empty for partially typed text in the editable combo too
+        districts = self.db.get_districts(state)
 
         if districts:
             self.cmb_district.addItem("Select district...")
@@ -317,17 +362,45 @@ class BasicInputs(QWidget):
             self.cmb_district.setEnabled(False)
 
         self.cmb_district.blockSignals(False)
+        # No district is selected any more, so the store clears
+        self.sync_environment()
+
+    def on_location_picked(self, state, district):
+        """A state or (state, district) was chosen from a type-ahead popup."""
+        if state != self.cmb_state.currentText():
+            self.cmb_state.setCurrentText(state)
+        if district:
+            self.cmb_district.setCurrentText(district)
+
+    def on_search_all_toggled(self, checked):
+        state = self.cmb_state.currentText()
+        self.district_picker.set_state(None if checked else state)
+        if checked:
+            self.cmb_district.setEnabled(True)
+        else:
+            self.cmb_district.setEnabled(self.db is not None and bool(self.db.get_districts(state)))
+
+    def current_location(self):
+        """(state, district) if a database location is selected, else None."""
+        state, district = self.cmb_state.currentText(), self.cmb_district.currentText()
+        if self.db is None or self.db.get_location(state, district) is None:
+            return None
+        return state, district
 
     def on_district_changed(self, district):
         if not district or district.startswith("Select"):
             return
 
-        data = self.db.get_location_data(district)
+        state = self.cmb_state.currentText()
+        data = self.db.get_location(state, district)
         if data:
-            wind, zone, factor, tmax, tmin = data
-            self.lbl_wind.setText(f"Basic Wind Speed: {wind} m/s")
-            self.lbl_seismic.setText(f"Seismic Zone: {zone} | Factor: {factor}")
-            self.lbl_temp.setText(f"Temperature Range: {tmin}°C – {tmax}°C")
+            self.session.set_last_location(state, district)
+            # The lists only change with the state
+            if state != self._session_state:
+                self.session.set_combo_contents(self.db.get_states(), self.db.get_districts(state))
+                self._session_state = state
+            if not self.chk_mode_custom.isChecked():
+                self.environment.set_from_database(state, district, data)
 
     # ==============================================================  
     # CUSTOM TABLE EDITOR POPUP  
@@ -335,37 +408,156 @@ class BasicInputs(QWidget):
 
     def open_custom_table_editor(self):
         """Open the custom table editor dialog to input environmental parameters."""
-        dialog = CustomTableEditor()
+        from ui.custom_table_editor import CustomTableEditor  # deferred until first use
+
+        dialog = CustomTableEditor(self.custom_values)
         if dialog.exec():
             values = dialog.get_values()
-            # Update the environment labels with custom values
-            self.lbl_wind.setText(f"Basic Wind Speed: {values['wind']} m/s")
-            self.lbl_seismic.setText(f"Seismic Zone: {values['zone']} | Factor: {values['factor']}")
-            self.lbl_temp.setText(f"Temperature Range: {values['tmin']}°C – {values['tmax']}°C")
+            self.custom_values = values
+            self.environment.set_custom(values)
             print("Custom parameters saved:", values)
 
+    # ==============================================================
+    # ENVIRONMENT PARAMETERS
+    # ==============================================================
+
+    def sync_environment(self):
+        """Point the environment store at the active location mode's values."""
+        if self.chk_mode_custom.isChecked():
+            if self.custom_values:
+                self.environment.set_custom(self.custom_values)
+            else:
+                self.environment.clear()
+            return
+        location = self.current_location()
+        if location is None:
+            self.environment.clear()
+        else:
+            self.environment.set_from_database(*location, self.db.get_location(*location))
+
+    def update_environment_labels(self, params):
+        if params is None:
+            self.lbl_wind.setText("Basic Wind Speed: -")
+            self.lbl_seismic.setText("Seismic Zone: -")
+            self.lbl_temp.setText("Temperature Range: -")
+            return
+        self.lbl_wind.setText(f"Basic Wind Speed: {params.wind} m/s")
+        self.lbl_seismic.setText(f"Seismic Zone: {params.zone} | Factor: {params.factor}")
+        self.lbl_temp.setText(f"Temperature Range: {params.tmin}°C – {params.tmax}°C")
+        source = ("Custom values" if params.source == SOURCE_CUSTOM
+                  else f"Database: {params.state} / {params.district}")
+        for lbl in (self.lbl_wind, self.lbl_seismic, self.lbl_temp):
+            lbl.setToolTip(source)
+
     # ==============================================================  
     # MODIFY GEOMETRY POPUP  
     # ==============================================================  
 
     def open_modify_dialog(self):
-        cw = self.in_cw.text()
-
-        if not cw:
+        text = self.in_cw.text().strip()
+        if not text:
             QMessageBox.warning(self, "Missing Input", "Please enter Carriageway Width first.")
             return
+        # parse_number() gives None for non-numeric and non-finite text
+        cw = parse_number(text)
+        if cw is None or cw <= 0:
+            QMessageBox.warning(self, "Invalid Input", "Carriageway Width must be a positive number.")
+            return
 
-        dialog = ModifyGeometryDialog(float(cw))
+        from ui.modify_geometry_dialog import ModifyGeometryDialog  # deferred until first use
+
+        dialog = ModifyGeometryDialog(cw)
+        # Preview edits live; the saved layout comes back if cancelled
+        dialog.values_changed.connect(
+            lambda values: self.geometry_changed.emit(self.section_geometry(values)))
         if dialog.exec():
             values = dialog.get_values()
+            self.geometry_values = values
             print("Updated geometry:", values)
+        self.emit_geometry()
+
+    def section_geometry(self, layout=None):
+        """
+        Values drawn by the cross-section view: carriageway_width, span,
+        footpath, plus girders/spacing/overhang from `layout` (or the saved
+        additional geometry) when it was made for the current width.
+        """
+        values = {
+            "carriageway_width": parse_number(self.in_cw.text()),
+            "span": parse_number(self.in_span.text()),
+            "footpath": self.in_fp.currentText(),
+        }
+        layout = layout if layout is not None else self.geometry_values
+        cw = values["carriageway_width"]
+        if layout and cw is not None and layout.get("overall_width") == overall_width(cw):
+            for key in ("girders", "spacing", "overhang"):
+                values[key] = layout.get(key)
+        return values
+
+    def emit_geometry(self, *_):
+        self.geometry_changed.emit(self.section_geometry())
 
     # ==============================================================  
     # LOAD DB
     # ==============================================================  
 
-    def load_db(self):
-        self.db = DB()
+    def load_db(self, path=None):
+        """
+        Open the location DB (`path`, default DB_PATH) on a worker thread.
+        Until it is ready the combos show the cached contents and last
+        location from the previous session (or the loading placeholder),
+        disabled.
+        """
+        cached = self.session.combo_contents()
+        last = self.session.last_location()
+
+        self.cmb_state.blockSignals(True)
+        self.cmb_district.blockSignals(True)
+        self.cmb_state.clear()
+        if cached and last:
+            states, districts = cached
+            self.cmb_state.addItem("Select state...")
+            self.cmb_state.addItems(states)
+            _select(self.cmb_state, last[0])
+            self.cmb_district.clear()
+            self.cmb_district.addItem("Select district...")
+            self.cmb_district.addItems(districts)
+            _select(self.cmb_district, last[1])
+            if self._pending_location is None:
+                self._pending_location = {"state": last[0], "district": last[1]}
+        else:
+            self.cmb_state.addItem("Loading states…")
+        self.cmb_state.setEnabled(False)
+        self.cmb_district.setEnabled(False)
+        self.cmb_state.blockSignals(False)
+        self.cmb_district.blockSignals(False)
+
+        self._db_timeout = QTimer(self)
+        self._db_timeout.setSingleShot(True)
+        self._db_timeout.timeout.connect(self.on_db_timeout)
+        self._db_timeout.start(self.DB_LOAD_TIMEOUT_MS)
+
+        # A second load_db() supersedes one still in flight
+        self.tasks.submit(
+            "db", load_database, path,
+            previous_signature=self.session.db_signature(),
+            prefetch_state=last[0] if last else None,
+            on_result=lambda loaded: self.on_db_loaded(*loaded),
+            on_error=lambda exc: self.on_db_failed(str(exc)),
+        )
+
+    def on_db_loaded(self, db, signature=None, state_index=None, district_index=None):
+        """
+        Fill the combos from a loaded DB. The picker indexes are normally
+        built by the loader task; they are built here when not given.
+        """
+        self._db_timeout.stop()
+        first_load = self.db is None
+        self.db = db
+        if signature is not None and not self.session.check_db(signature):
+            # Database content changed since the cache was written
+            self.session.set_combo_contents(self.db.get_states(), [])
+            self._session_state = None
 
         states = self.db.get_states() or []
 
@@ -387,22 +579,184 @@ class BasicInputs(QWidget):
         self.cmb_district.setEnabled(False)
         self.cmb_district.blockSignals(False)
 
-        # signals - only disconnect if already connected
-        self.cmb_state.currentTextChanged.connect(self.on_state_changed)
-        self.cmb_district.currentTextChanged.connect(self.on_district_changed)
+        # type-ahead search over the preloaded index. District suggestions
+        # cover every state only while "search all" is on: republishing
+        # all districts to the completer is what makes that toggle slow.
+        if state_index is None:
+            state_index = build_location_index(states=states)
+        if district_index is None:
+            district_index = build_location_index(pairs=self.db.get_locations())
+        self.state_picker.set_index(state_index, NameMatcher(states))
+        self.district_picker.set_state(None if self.chk_search_all.isChecked() else "")
+        self.district_picker.set_index(district_index, self.db.district_matcher())
+
+        # signals - connect only once, even if the DB is reloaded
+        if first_load:
+            self.cmb_state.currentTextChanged.connect(self.on_state_changed)
+            self.cmb_district.currentTextChanged.connect(self.on_district_changed)
 
         self.toggle_location_modes()
-    
-    def open_custom_dialog(self):
-        dialog = CustomTableEditor()
-        if dialog.exec():
-            values = dialog.get_values()
+        if self._pending_location is not None:
+            self._restore_location(self._pending_location)
+        self.db_ready.emit(True)
+
+    def on_db_failed(self, message):
+        self._db_timeout.stop()
+        self._show_db_error("— Location database unavailable —", message)
+
+    def on_db_timeout(self):
+        # A late result still goes through on_db_loaded and recovers the combos
+        self._show_db_error("— Loading states timed out —",
+                            "Opening the location database is taking too long.")
+
+    def _show_db_error(self, placeholder, message):
+        if self.db is not None:
+            return
+        self.cmb_state.blockSignals(True)
+        self.cmb_state.clear()
+        self.cmb_state.addItem(placeholder)
+        self.cmb_state.setEnabled(False)
+        self.cmb_state.setToolTip(message)
+        self.cmb_state.blockSignals(False)
+        self.db_ready.emit(False)
+
+    # ==============================================================
+    # PROJECT STATE
+    # ==============================================================
+
+    def get_state(self):
+        """All user input as project sections (see ui.project)."""
+        mode = "name" if self.chk_mode_name.isChecked() else (
+            "custom" if self.chk_mode_custom.isChecked() else None)
+        return {
+            "structure": {"type": "other" if self.radio_other.isChecked() else "highway"},
+            "location": {
+                "mode": mode,
+                "state": self.cmb_state.currentText(),
+                "district": self.cmb_district.currentText(),
+                "custom": self.custom_values,
+            },
+            "geometry": {
+                "span": self.in_span.text(),
+                "carriageway_width": self.in_cw.text(),
+                "footpath": self.in_fp.currentText(),
+                "skew": self.in_skew.text(),
+                "additional": self.geometry_values,
+            },
+            "materials": {
+                "girder": self.cmb_girder.currentText(),
+                "cross": self.cmb_cross.currentText(),
+                "concrete": self.cmb_concrete.currentText(),
+            },
+        }
+
+    def set_state(self, project):
+        """
+        Restore widgets from project sections in one batched update.
+        Signals stay blocked while values are written, and the derived
+        updates (modes, districts, labels, validation) run once afterwards.
+        """
+        structure = project.get("structure") or {}
+        location = project.get("location") or {}
+        geometry = project.get("geometry") or {}
+        materials = project.get("materials") or {}
+        # Checked before any widget changes, so a bad file leaves the form as it was
+        custom = _saved_custom(location.get("custom"))
+        layout = _saved_layout(geometry.get("additional"))
+
+        widgets = (self.radio_highway, self.radio_other, self.chk_mode_name,
+                   self.chk_mode_custom, self.in_span, self.in_cw, self.in_fp,
+                   self.in_skew, self.cmb_girder, self.cmb_cross, self.cmb_concrete)
+        for widget in widgets:
+            widget.blockSignals(True)
+        try:
+            self.radio_other.setChecked(structure.get("type") == "other")
+            self.radio_highway.setChecked(structure.get("type") != "other")
+            self.chk_mode_name.setChecked(location.get("mode") == "name")
+            self.chk_mode_custom.setChecked(location.get("mode") == "custom")
+            self.in_span.setText(_text(geometry.get("span")))
+            self.in_cw.setText(_text(geometry.get("carriageway_width")))
+            self.in_skew.setText(_text(geometry.get("skew")))
+            _select(self.in_fp, geometry.get("footpath"))
+            _select(self.cmb_girder, materials.get("girder"))
+            _select(self.cmb_cross, materials.get("cross"))
+            _select(self.cmb_concrete, materials.get("concrete"))
+        finally:
+            for widget in widgets:
+                widget.blockSignals(False)
+
+        self.custom_values = custom
+        self.geometry_values = layout
+
+        self.on_structure_type_change()
+        self.toggle_location_modes()
+        self.update_material_labels()
+        self.validator.validate_all()
+        self.emit_geometry()
+
+        # Custom values were applied by toggle_location_modes()
+        if location.get("mode") != "custom":
+            if self.db is None:
+                self._pending_location = location
+            else:
+                self._restore_location(location)
 
-            # Update green labels
-            self.lbl_wind.setText(f"Basic Wind Speed: {values['wind']} m/s")
-            self.lbl_seismic.setText(f"Seismic Zone: {values['zone']} | Factor: {values['factor']}")
-            self.lbl_temp.setText(f"Temperature Range: {values['tmin']}°C – {values['tmax']}°C")
+    def _restore_location(self, location):
+        self._pending_location = None
+        state, district = _text(location.get("state")), _text(location.get("district"))
+        if self.db is None or not self.db.get_districts(state):
+            return
+
+        self.cmb_state.blockSignals(True)
+        _select(self.cmb_state, state)
+        self.cmb_state.blockSignals(False)
+        self.on_state_changed(state)
+
+        self.cmb_district.blockSignals(True)
+        _select(self.cmb_district, district)
+        self.cmb_district.blockSignals(False)
+        self.on_district_changed(district)
+
+        if self.chk_mode_name.isChecked():
+            self.cmb_district.setEnabled(True)
 
-            # Disable DB-driven values
-            print("Custom parameters applied:", values)
 
+def _text(value):
+    """Saved value as widget text; hand-edited files may hold numbers."""
+    return "" if value is None else str(value)
+
+
+def _saved_custom(values):
+    """Saved custom parameters in CustomTableEditor.get_values() form, or None."""
+    if values is None:
+        return None
+    numbers = {f: parse_number(values.get(f)) for f in CUSTOM_FIELDS} if isinstance(values, dict) else {}
+    if not numbers or None in numbers.values() or check_custom(numbers):
+        raise ValueError("Invalid custom loading parameters.")
+    numbers["zone"] = int(numbers["zone"])
+    return numbers
+
+
+def _saved_layout(values):
+    """Saved additional geometry in ModifyGeometryDialog.get_values() form, or None."""
+    if values is None:
+        return None
+    keys = ("spacing", "girders", "overhang", "overall_width")
+    numbers = {k: parse_number(values.get(k)) for k in keys} if isinstance(values, dict) else {}
+    if (not numbers or None in numbers.values() or not all(map(math.isfinite, numbers.values()))
+            or numbers["girders"] % 1):
+        raise ValueError("Invalid additional geometry.")
+    numbers["girders"] = int(numbers["girders"])
+    return numbers
+
+
+def _select(combo, text):
+    """Select the item with `text`; editable combos fall back to plain text."""
+    if text is None:
+        return
+    text = str(text)
+    index = combo.findText(text)
+    if index >= 0:
+        combo.setCurrentIndex(index)
+    elif combo.isEditable():
+        combo.setCurrentText(text)
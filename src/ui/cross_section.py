@@ -0,0 +1,209 @@
+from PySide6.QtWidgets import (
+    QGraphicsView, QGraphicsScene, QGraphicsItem, QGraphicsPathItem,
+    QGraphicsSimpleTextItem
+)
+from PySide6.QtGui import QBrush, QColor, QPainter, QPainterPath, QPen
+from PySide6.QtCore import Qt, QRectF
+
+from ui import geometry
+
+# Scene units per metre; geometry below is given in metres
+SCALE = 100.0
+
+DECK_THICKNESS = 0.25
+FOOTPATH_WIDTH = 1.5
+FOOTPATH_HEIGHT = 0.25
+GIRDER_DEPTH = 1.5          # without a span; otherwise span / 20, clamped
+GIRDER_DEPTH_RANGE = (0.9, 3.0)
+FLANGE_WIDTH = 0.45
+FLANGE_THICKNESS = 0.05
+WEB_THICKNESS = 0.02
+
+# Layout drawn until the user saves one in ModifyGeometryDialog
+DEFAULT_SPACING = 2.5
+DEFAULT_OVERHANG = 1.0
+
+DECK_BRUSH = QBrush(QColor("#c8c8c8"))
+FOOTPATH_BRUSH = QBrush(QColor("#9e9e9e"))
+GIRDER_BRUSH = QBrush(QColor("#4a6fa5"))
+OUTLINE = QPen(QColor("#333333"), 0)   # cosmetic: 1 px at any zoom
+
+
+def girder_depth(span=None):
+    if not span:
+        return GIRDER_DEPTH
+    low, high = GIRDER_DEPTH_RANGE
+    return min(high, max(low, span / 20.0))
+
+
+def girder_positions(overall, girders, spacing, overhang):
+    """
+    Girder centre lines (m from the left deck edge). Each girder carries
+    one spacing of deck and the overhang is split between both edges,
+    matching overall = overhang + girders * spacing.
+    """
+    start = overhang / 2.0 + spacing / 2.0
+    return [start + i * spacing for i in range(girders)]
+
+
+def _i_section(depth):
+    """I-girder outline in scene units, top-centre at the origin."""
+    bf, tf, tw = FLANGE_WIDTH * SCALE, FLANGE_THICKNESS * SCALE, WEB_THICKNESS * SCALE
+    d = depth * SCALE
+    path = QPainterPath()
+    path.addRect(QRectF(-bf / 2, 0, bf, tf))
+    path.addRect(QRectF(-tw / 2, tf, tw, d - 2 * tf))
+    path.addRect(QRectF(-bf / 2, d - tf, bf, tf))
+    return path
+
+
+def _cached(item):
+    # Items keep a device-resolution pixmap, so moving them is a blit
+    # until the view's zoom changes
+    item.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+    return item
+
+
+class CrossSectionView(QGraphicsView):
+    """
+    Live bridge cross-section: deck, footpaths, girders and overall width.
+
+    set_geometry() updates the scene in place. Girders are only added or
+    removed when their count changes and are otherwise moved; the view is
+    refitted only when the overall extent changes, which keeps the item
+    caches valid while spacing is being dragged.
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setScene(QGraphicsScene(self))
+        self.setRenderHint(QPainter.Antialiasing)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.setMinimumSize(1, 1)
+
+        self.values = {}
+        self._extent = None      # (overall, depth) the scene is laid out for
+        self._depth = None
+        self._girder_path = None
+        self._girders = []
+
+        scene = self.scene()
+        self._deck = _cached(scene.addRect(QRectF(), OUTLINE, DECK_BRUSH))
+        self._footpaths = [_cached(scene.addRect(QRectF(), OUTLINE, FOOTPATH_BRUSH))
+                           for _ in range(2)]
+        self._dimension = scene.addLine(0, 0, 0, 0, OUTLINE)
+        self._caption = QGraphicsSimpleTextItem()
+        self._caption.setFlag(QGraphicsItem.ItemIgnoresTransformations)
+        scene.addItem(self._caption)
+
+        self._placeholder = QGraphicsSimpleTextItem("Enter a carriageway width to see the cross-section")
+        self._placeholder.setFlag(QGraphicsItem.ItemIgnoresTransformations)
+        scene.addItem(self._placeholder)
+        self._show_section(False)
+
+    def set_geometry(self, values):
+        """
+        values: carriageway_width, footpath ("None" / "Single-Sided" /
+        "Both Sides"), span, and optionally girders, spacing, overhang.
+        None (or no carriageway width) shows the placeholder.
+        """
+        values = dict(values or {})
+        if values == self.values:
+            return
+        self.values = values
+        cw = values.get("carriageway_width")
+        if not cw or cw <= 0:
+            self._show_section(False)
+            return
+        self._show_section(True)
+
+        overall = geometry.overall_width(cw)
+        girders, spacing, overhang = values.get("girders"), values.get("spacing"), values.get("overhang")
+        default = not (girders and spacing)
+        if default:
+            overhang = DEFAULT_OVERHANG
+            try:
+                girders, spacing = geometry.girders_from_spacing(overall, DEFAULT_SPACING, overhang)
+            except geometry.GeometryError:
+                girders, spacing = 0, 0.0
+        overhang = overhang or 0.0
+        depth = girder_depth(values.get("span"))
+
+        self._update_deck(overall, cw, values.get("footpath") or "None")
+        self._update_girders(girder_positions(overall, girders, spacing, overhang), depth)
+        self._update_dimension(overall, depth, girders, spacing, default)
+
+        if self._extent != (overall, depth):
+            self._extent = (overall, depth)
+            margin = 0.1 * overall * SCALE
+            top = -(FOOTPATH_HEIGHT + 0.3) * SCALE
+            bottom = (DECK_THICKNESS + depth + 1.0) * SCALE
+            self.scene().setSceneRect(QRectF(-margin, top, overall * SCALE + 2 * margin, bottom - top))
+            self._fit()
+
+    # ==============================================================
+    # Incremental scene updates
+    # ==============================================================
+
+    def _show_section(self, visible):
+        for item in [self._deck, self._dimension, self._caption] + self._footpaths + self._girders:
+            item.setVisible(visible)
+        self._placeholder.setVisible(not visible)
+        if not visible:
+            self._extent = None
+            self.scene().setSceneRect(QRectF(0, 0, 1, 1))
+            self._placeholder.setPos(0, 0)
+            self.centerOn(self._placeholder)
+
+    def _update_deck(self, overall, cw, footpath):
+        self._deck.setRect(QRectF(0, 0, overall * SCALE, DECK_THICKNESS * SCALE))
+
+        # Footpaths sit next to the carriageway, which is centred on the deck
+        edge = (overall - cw) / 2.0
+        left, right = self._footpaths
+        rect = lambda x: QRectF(x * SCALE, -FOOTPATH_HEIGHT * SCALE,
+                                FOOTPATH_WIDTH * SCALE, FOOTPATH_HEIGHT * SCALE)
+        left.setRect(rect(edge - FOOTPATH_WIDTH))
+        right.setRect(rect(edge + cw))
+        left.setVisible(footpath in ("Single-Sided", "Both Sides"))
+        right.setVisible(footpath == "Both Sides")
+
+    def _update_girders(self, positions, depth):
+        if depth != self._depth:
+            self._depth = depth
+            self._girder_path = _i_section(depth)
+            for item in self._girders:
+                item.setPath(self._girder_path)
+
+        scene = self.scene()
+        while len(self._girders) > len(positions):
+            scene.removeItem(self._girders.pop())
+        while len(self._girders) < len(positions):
+            item = _cached(QGraphicsPathItem(self._girder_path))
+            item.setPen(OUTLINE)
+            item.setBrush(GIRDER_BRUSH)
+            scene.addItem(item)
+            self._girders.append(item)
+
+        y = DECK_THICKNESS * SCALE
+        for item, x in zip(self._girders, positions):
+            item.setPos(x * SCALE, y)
+
+    def _update_dimension(self, overall, depth, girders, spacing, default):
+        y = (DECK_THICKNESS + depth + 0.4) * SCALE
+        self._dimension.setLine(0, y, overall * SCALE, y)
+        layout = f"{girders} girders @ {spacing:g} m" + (" (default layout)" if default else "")
+        self._caption.setText(f"Overall width {overall:g} m  |  {layout}")
+        self._caption.setPos(0, y + 0.1 * SCALE)
+
+    # ==============================================================
+    # View
+    # ==============================================================
+
+    def _fit(self):
+        if self._extent is not None:
+            self.fitInView(self.scene().sceneRect(), Qt.KeepAspectRatio)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._fit()
@@ -1,10 +1,19 @@
+import os
+import traceback
+
 from PySide6.QtWidgets import (
-    QDialog, QVBoxLayout, QFormLayout, QLineEdit,
-    QPushButton, QLabel, QMessageBox
+    QDialog, QVBoxLayout, QHBoxLayout, QFormLayout, QLineEdit,
+    QPushButton, QLabel, QMessageBox, QFileDialog, QCompleter, QProgressDialog
 )
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QDoubleValidator, QIntValidator
 
+from ui import validation
+from ui.tasks import TaskRunner
+
+# Rejected rows listed in the import summary; the rest are counted
+IMPORT_ERRORS_SHOWN = 10
+
 
 class CustomTableEditor(QDialog):
     """
@@ -14,18 +23,26 @@ class CustomTableEditor(QDialog):
     - Seismic Factor
     - Max Temperature
     - Min Temperature
+    Import… loads a CSV/XLSX site table into the custom parameters store
+    (tools.custom_params) in the background; picking a site fills the
+    fields from it.
     """
-    def __init__(self):
+    def __init__(self, values=None):
         super().__init__()
         self.setWindowTitle("Custom Loading Parameters")
         self.setMinimumWidth(350)
 
+        self._store = None
+        self.tasks = TaskRunner(self)
+
         layout = QVBoxLayout(self)
 
         form = QFormLayout()
         layout.addLayout(form)
 
         # Inputs
+        self.in_site = QLineEdit()
+        self.in_site.setPlaceholderText("Imported site (optional)")
         self.in_wind = QLineEdit()
         self.in_zone = QLineEdit()
         self.in_factor = QLineEdit()
@@ -33,15 +50,17 @@ class CustomTableEditor(QDialog):
         self.in_tmin = QLineEdit()
 
         # Validators
-        double_valid = QDoubleValidator(0.0, 500.0, 2)
-        int_valid = QIntValidator(1, 5)
+        double_valid = QDoubleValidator(0.0, validation.CUSTOM_VALUE_MAX, 2)
+        temp_valid = QDoubleValidator(-validation.TEMP_LIMIT, validation.TEMP_LIMIT, 2)
+        int_valid = QIntValidator(validation.ZONE_MIN, validation.ZONE_MAX)
 
         self.in_wind.setValidator(double_valid)
         self.in_factor.setValidator(double_valid)
-        self.in_tmax.setValidator(double_valid)
-        self.in_tmin.setValidator(double_valid)
+        self.in_tmax.setValidator(temp_valid)
+        self.in_tmin.setValidator(temp_valid)
         self.in_zone.setValidator(int_valid)  # zone: 1–5
 
+        form.addRow("Site:", self.in_site)
         form.addRow("Basic Wind Speed (m/s):", self.in_wind)
         form.addRow("Seismic Zone (1–5):", self.in_zone)
         form.addRow("Seismic Factor:", self.in_factor)
@@ -53,27 +72,51 @@ class CustomTableEditor(QDialog):
         self.error_label.setStyleSheet("color: red;")
         layout.addWidget(self.error_label)
 
+        # Bulk import / export
+        bulk = QHBoxLayout()
+        self.btn_import = QPushButton("Import…")
+        self.btn_import.clicked.connect(self.import_table)
+        self.btn_export = QPushButton("Export…")
+        self.btn_export.clicked.connect(self.export_table)
+        bulk.addWidget(self.btn_import)
+        bulk.addWidget(self.btn_export)
+        layout.addLayout(bulk)
+
         # Save button
         self.btn_save = QPushButton("Save")
         self.btn_save.clicked.connect(self.on_save)
         layout.addWidget(self.btn_save)
 
-    def on_save(self):
-        if (not self.in_wind.text()
-            or not self.in_zone.text()
-            or not self.in_factor.text()
-            or not self.in_tmax.text()
-            or not self.in_tmin.text()):
-            self.error_label.setText("All fields are required.")
-            return
+        self.in_site.editingFinished.connect(self.fill_from_site)
+        self.update_sites()
+        if values:
+            self.set_values(values)
 
-        # Basic value integrity checks
-        try:
-            if float(self.in_wind.text()) <= 0:
-                self.error_label.setText("Wind speed must be positive.")
-                return
-        except:
-            self.error_label.setText("Invalid wind value.")
+    def done(self, result):
+        # A running import rolls back
+        self.tasks.cancel()
+        if self._store is not None:
+            self._store.close()
+            self._store = None
+        super().done(result)
+
+    # ==============================================================
+    # Values
+    # ==============================================================
+
+    def _fields(self):
+        return dict(zip(validation.CUSTOM_FIELDS,
+                        (self.in_wind, self.in_zone, self.in_factor, self.in_tmax, self.in_tmin)))
+
+    def set_values(self, values):
+        for field, widget in self._fields().items():
+            value = values.get(field)
+            widget.setText("" if value is None else f"{value:g}" if isinstance(value, float) else str(value))
+
+    def on_save(self):
+        message = validation.check_custom({f: w.text() for f, w in self._fields().items()})
+        if message:
+            self.error_label.setText(message)
             return
 
         self.accept()  # close popup
@@ -86,3 +129,104 @@ class CustomTableEditor(QDialog):
             "tmax": float(self.in_tmax.text()),
             "tmin": float(self.in_tmin.text())
         }
+
+    # ==============================================================
+    # Custom parameters store
+    # ==============================================================
+
+    def store(self, create=False):
+        """The open CustomParamsStore; None if there is none yet and not create."""
+        if self._store is None:
+            from tools.custom_params import CUSTOM_DB_PATH, CustomParamsStore  # deferred until first use
+
+            if create or os.path.exists(CUSTOM_DB_PATH):
+                self._store = CustomParamsStore(CUSTOM_DB_PATH)
+        return self._store
+
+    def update_sites(self):
+        store = self.store()
+        sites = store.sites() if store is not None else []
+        completer = QCompleter(sites, self.in_site)
+        completer.setCaseSensitivity(Qt.CaseInsensitive)
+        completer.setFilterMode(Qt.MatchContains)
+        completer.activated.connect(self.fill_from_site)
+        self.in_site.setCompleter(completer)
+        self.in_site.setEnabled(bool(sites))
+
+    def fill_from_site(self, site=None):
+        store = self.store()
+        site = site or self.in_site.text().strip()
+        values = store.get(site) if store is not None and site else None
+        if values is not None:
+            self.set_values(values)
+            self.error_label.setText("")
+
+    def import_table(self):
+        path, _ = QFileDialog.getOpenFileName(
+            self, "Import Custom Parameters", "",
+            "Site tables (*.csv *.xlsx);;CSV (*.csv);;Excel (*.xlsx)")
+        if not path:
+            return
+
+        from tools.custom_params import CUSTOM_DB_PATH, CustomParamsStore  # deferred until first use
+
+        errors = []
+
+        def on_error(row, message):
+            if len(errors) < IMPORT_ERRORS_SHOWN:
+                errors.append(f"Row {row}: {message}")
+
+        def run(token):
+            # The worker writes through its own connection
+            with CustomParamsStore(CUSTOM_DB_PATH) as store:
+                return store.import_file(path, on_error=on_error, progress=token.progress,
+                                         is_cancelled=token.is_cancelled)
+
+        progress = QProgressDialog("Importing…", "Cancel", 0, 0, self)
+        progress.setWindowTitle("Import Custom Parameters")
+        progress.setWindowModality(Qt.WindowModal)
+        progress.setMinimumDuration(300)
+        progress.canceled.connect(lambda: self.tasks.cancel("import"))
+
+        def finished():
+            progress.canceled.disconnect()
+            progress.close()
+
+        def on_result(counts):
+            finished()
+            self.on_imported(*counts, errors)
+
+        def on_failed(exc):
+            finished()
+            # Raising here would only reach Qt's event loop; log it and tell the user
+            traceback.print_exception(type(exc), exc, exc.__traceback__)
+            QMessageBox.warning(self, "Import Failed", str(exc) or type(exc).__name__)
+
+        self.tasks.submit(
+            "import", run, on_result=on_result, on_error=on_failed,
+            on_progress=lambda rows, _: progress.setLabelText(f"Importing… {rows:,} rows read"),
+        )
+
+    def on_imported(self, imported, rejected, errors):
+        self.update_sites()
+        summary = f"{imported} site(s) imported, {rejected} row(s) rejected."
+        if errors:
+            more = rejected - len(errors)
+            summary += "\n\n" + "\n".join(errors) + (f"\n… and {more} more" if more else "")
+        QMessageBox.information(self, "Import Complete", summary)
+
+    def export_table(self):
+        store = self.store()
+        if store is None:
+            QMessageBox.information(self, "Export", "No custom parameters have been imported yet.")
+            return
+        path, _ = QFileDialog.getSaveFileName(self, "Export Custom Parameters", "custom_params.csv", "CSV (*.csv)")
+        if not path:
+            return
+        try:
+            with open(path, "w", newline="", encoding="utf-8") as f:
+                rows = store.export_csv(f)
+        except OSError as exc:
+            QMessageBox.warning(self, "Export Failed", str(exc))
+            return
+        QMessageBox.information(self, "Export Complete", f"{rows} site(s) exported.")
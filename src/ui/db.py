@@ -1,39 +1,397 @@
 import sqlite3
 import os
 import sys
+import threading
+from collections import namedtuple
+from pathlib import Path
 
-
-def resource_path(relative_path):
-    """Get absolute path to resource, works for dev and for PyInstaller"""
-    try:
-        # PyInstaller creates a temp folder and stores path in _MEIPASS
-        base_path = sys._MEIPASS
-    except Exception:
-        base_path = os.path.abspath(".")
-    return os.path.join(base_path, relative_path)
+from ui.resources import resource_path
 
 
 DB_PATH = resource_path(os.path.join("data", "locations.db"))
 
+# Loading parameters of one location; unpacks like the old row tuples
+LocationData = namedtuple("LocationData", "wind zone factor tmax tmin")
+
+# Seismic zones appear as Roman numerals (IS 1893) or plain numbers
+ZONE_RANKS = {"I": 1, "II": 2, "III": 3, "IV": 4, "V": 5}
+
+
+def zone_rank(zone, default=None):
+    """
+    Numeric rank of a seismic zone ("IV", "Zone IV", 4 -> 4). An unknown
+    zone raises ValueError, or gives `default` when one is passed (for
+    labels read from the data rather than typed bounds).
+    """
+    if isinstance(zone, (int, float)) and not isinstance(zone, bool) and zone == zone:
+        if abs(zone) != float("inf"):
+            return int(zone)
+    else:
+        text = str(zone or "").strip().upper()
+        if text.startswith("ZONE"):
+            text = text[4:].strip()
+        if text.isdigit():
+            return int(text)
+        if text in ZONE_RANKS:
+            return ZONE_RANKS[text]
+    if default is None:
+        raise ValueError(f"unknown seismic zone: {zone!r}")
+    return default
+
+
+# Covering index: a (State, District) lookup is a single index-only seek
+COVERING_INDEX = (
+    "CREATE INDEX IF NOT EXISTS idx_locations_covering ON locations("
+    "State, District, Wind, SeismicZone, SeismicFactor, TempMax, TempMin)"
+)
+
+# Hazard queries: field name -> SQL expression. Each has its own index so
+# range filters and ORDER BY walk an index instead of scanning the table.
+HAZARD_FIELDS = {
+    "wind": "Wind",
+    "zone": "SeismicZone",
+    "factor": "SeismicFactor",
+    "tmax": "TempMax",
+    "tmin": "TempMin",
+    "temp_range": "(TempMax - TempMin)",
+}
+HAZARD_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS idx_locations_wind ON locations(Wind)",
+    "CREATE INDEX IF NOT EXISTS idx_locations_zone ON locations(SeismicZone)",
+    "CREATE INDEX IF NOT EXISTS idx_locations_factor ON locations(SeismicFactor)",
+    "CREATE INDEX IF NOT EXISTS idx_locations_tmax ON locations(TempMax)",
+    "CREATE INDEX IF NOT EXISTS idx_locations_tmin ON locations(TempMin)",
+    "CREATE INDEX IF NOT EXISTS idx_locations_temp_range ON locations((TempMax - TempMin))",
+)
+
 class DB:
-    def __init__(self):
-        self.conn = sqlite3.connect(DB_PATH)
-        self.cur = self.conn.cursor()
+    """
+    Read access to the `locations` table.
+
+    The whole table is loaded once into an in-memory index so that combo
+    box changes never go back to SQLite:
+    - states: sorted list of state names
+    - districts: state -> sorted tuple of district names
+    - records: (state, district) -> LocationData
+    Call reload() after the database file has been rebuilt.
+
+    SQL goes through a small pool of read-only connections, one per
+    thread, so loaders and batch tools can query concurrently. The file is
+    opened with mode=ro (plus immutable=1 for the copy bundled inside a
+    PyInstaller build) and pragmas tuned for a read-mostly workload. Use
+    the DB as a context manager, or call close(), to release them.
+
+    Headless tools that only need batch queries can pass preload=False;
+    the index is then built on the first index lookup.
+    """
+    # Rows per batch query; 3 bound parameters each stays under SQLite's
+    # historic 999-variable limit
+    BATCH_ROWS = 300
+
+    PRAGMAS = (
+        "PRAGMA query_only = 1",
+        "PRAGMA mmap_size = 268435456",   # 256 MiB
+        "PRAGMA cache_size = -16384",     # 16 MiB
+        "PRAGMA temp_store = MEMORY",
+    )
+
+    # Per-connection prepared statement cache; every query below uses a
+    # constant SQL string so repeated lookups reuse the compiled statement
+    CACHED_STATEMENTS = 64
+
+    def __init__(self, path=DB_PATH, preload=True, immutable=None):
+        self.path = path
+        if immutable is None:
+            # The bundled copy in a frozen build never changes on disk
+            immutable = hasattr(sys, "_MEIPASS") and os.path.abspath(path).startswith(
+                os.path.abspath(sys._MEIPASS))
+        self.uri = Path(os.path.abspath(path)).as_uri() + "?mode=ro" + ("&immutable=1" if immutable else "")
+
+        self._local = threading.local()
+        self._connections = []
+        self._lock = threading.Lock()
+        self._attached = {}     # schema -> read-only URI
+
+        if preload:
+            self.reload()
+        else:
+            self.invalidate()
+
+    # ==============================================================
+    # Connections
+    # ==============================================================
+
+    def connection(self):
+        """This thread's read-only connection, opened on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # check_same_thread=False only so close() can run from the
+            # owning thread; each connection is used by one thread
+            conn = sqlite3.connect(self.uri, uri=True, check_same_thread=False,
+                                   cached_statements=self.CACHED_STATEMENTS)
+            for pragma in self.PRAGMAS:
+                conn.execute(pragma)
+            for schema, uri in self._attached.items():
+                conn.execute("ATTACH DATABASE ? AS " + schema, (uri,))
+            self._local.conn = conn
+            with self._lock:
+                self._connections.append(conn)
+        return conn
+
+    def attach(self, path, schema="custom"):
+        """
+        Make another SQLite file (e.g. tools.custom_params' store) readable
+        as `<schema>.<table>` on every pooled connection. Open connections
+        are closed so the next query on each thread picks it up.
+        """
+        if not schema.isidentifier():
+            raise ValueError(f"invalid schema name: {schema}")
+        uri = Path(os.path.abspath(path)).as_uri() + "?mode=ro"
+        # Fail here (sqlite3.Error) rather than on every later connection
+        probe = sqlite3.connect(uri, uri=True)
+        try:
+            probe.execute("SELECT name FROM sqlite_master").fetchall()
+        finally:
+            probe.close()
+        self._attached[schema] = uri
+        self.close()
+
+    def _execute(self, sql, params=()):
+        return self.connection().execute(sql, params)
+
+    def close(self):
+        """Close every pooled connection; the in-memory index stays usable."""
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            conn.close()
+        self._local = threading.local()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # ==============================================================
+    # In-memory index
+    # ==============================================================
+
+    def reload(self):
+        """(Re)build the in-memory index from the locations table."""
+        rows = self._execute(
+            "SELECT State, District, Wind, SeismicZone, SeismicFactor, TempMax, TempMin "
+            "FROM locations"
+        ).fetchall()
+        districts = {}
+        records = {}
+        by_district = {}
+        for state, district, *data in rows:
+            data = LocationData(*data)
+            districts.setdefault(state, []).append(district)
+            records[(state, district)] = data
+            by_district.setdefault(district, data)
+
+        self._states = sorted(districts)
+        self._districts = {state: tuple(sorted(names)) for state, names in districts.items()}
+        self._records = records
+        self._by_district = by_district
+        self._matchers = {}
+        self._zone_labels = None
+
+    def invalidate(self):
+        """Drop the index; it is rebuilt lazily on the next lookup."""
+        self._states = None
+        self._districts = None
+        self._records = None
+        self._by_district = None
+        self._matchers = {}
+        self._zone_labels = None
+
+    def _ensure_index(self):
+        if self._records is None:
+            self.reload()
+
+    # ==============================================================
+    # Lookups
+    # ==============================================================
 
     def get_states(self):
-        self.cur.execute("SELECT DISTINCT State FROM locations ORDER BY State")
-        return [row[0] for row in self.cur.fetchall()]
+        self._ensure_index()
+        return list(self._states)
 
     def get_districts(self, state):
-        self.cur.execute(
+        self._ensure_index()
+        return list(self._districts.get(state, ()))
+
+    def get_locations(self):
+        """All (state, district) pairs, sorted."""
+        self._ensure_index()
+        return sorted(self._records)
+
+    def get_location(self, state, district):
+        """LocationData for (state, district), or None."""
+        self._ensure_index()
+        return self._records.get((state, district))
+
+    def get_location_data(self, district):
+        """
+        Lookup by district name only. Names repeat across states, so this
+        returns the first match; prefer get_location(state, district).
+        """
+        self._ensure_index()
+        return self._by_district.get(district)
+
+    def district_matcher(self, state=None):
+        """
+        Fuzzy matcher over district names, built once per index.
+        With a state the payloads are district names of that state,
+        otherwise (state, district) pairs across all states.
+        """
+        from ui.matcher import NameMatcher
+
+        self._ensure_index()
+        if state not in self._matchers:
+            if state is None:
+                pairs = self.get_locations()
+                matcher = NameMatcher([d for _, d in pairs], pairs)
+            else:
+                matcher = NameMatcher(self._districts.get(state, ()))
+            self._matchers[state] = matcher
+        return self._matchers[state]
+
+    # ==============================================================
+    # Batch lookups
+    # ==============================================================
+
+    def get_location_data_many(self, pairs):
+        """
+        Resolve many (state, district) pairs with one join per BATCH_ROWS
+        pairs instead of one query each. Returns a list aligned with
+        `pairs`: LocationData, or None where the location is unknown.
+        """
+        pairs = list(pairs)
+        out = [None] * len(pairs)
+        for start in range(0, len(pairs), self.BATCH_ROWS):
+            chunk = pairs[start:start + self.BATCH_ROWS]
+            values = ", ".join(["(?, ?, ?)"] * len(chunk))
+            params = [v for i, (state, district) in enumerate(chunk, start)
+                      for v in (i, state, district)]
+            rows = self._execute(
+                f"WITH q(i, State, District) AS (VALUES {values}) "
+                "SELECT q.i, l.Wind, l.SeismicZone, l.SeismicFactor, l.TempMax, l.TempMin "
+                "FROM q JOIN locations l ON l.State = q.State AND l.District = q.District",
+                params
+            ).fetchall()
+            for i, *data in rows:
+                if out[i] is None:
+                    out[i] = LocationData(*data)
+        return out
+
+    # ==============================================================
+    # Hazard queries
+    # ==============================================================
+
+    def zone_labels(self):
+        """Distinct SeismicZone values, lowest zone first."""
+        if self._zone_labels is None:
+            rows = self._execute(
+                "SELECT DISTINCT SeismicZone FROM locations WHERE SeismicZone IS NOT NULL"
+            ).fetchall()
+            self._zone_labels = sorted((row[0] for row in rows), key=lambda z: zone_rank(z, -1))
+        return list(self._zone_labels)
+
+    def _hazard_where(self, bounds):
+        """
+        WHERE clause for an envelope. Bounds are <field>_min / <field>_max
+        for every HAZARD_FIELDS entry (inclusive) plus `state`; zone bounds
+        accept "IV" or 4 (ValueError for an unknown zone) and become an IN
+        list over zone_labels().
+        """
+        clauses, params = [], []
+        bounds = {k: v for k, v in bounds.items() if v is not None}
+        state = bounds.pop("state", None)
+        if state is not None:
+            clauses.append("State = ?")
+            params.append(state)
+
+        zone_min, zone_max = bounds.pop("zone_min", None), bounds.pop("zone_max", None)
+        if zone_min is not None or zone_max is not None:
+            low = zone_rank(zone_min) if zone_min is not None else float("-inf")
+            high = zone_rank(zone_max) if zone_max is not None else float("inf")
+            labels = [z for z in self.zone_labels() if z is not None and low <= zone_rank(z, -1) <= high]
+            clauses.append(f"SeismicZone IN ({', '.join(['?'] * len(labels))})" if labels else "0")
+            params.extend(labels)
+
+        for key, value in bounds.items():
+            field, _, side = key.rpartition("_")
+            if field not in HAZARD_FIELDS or field == "zone" or side not in ("min", "max"):
+                raise ValueError(f"unknown hazard bound: {key}")
+            clauses.append(f"{HAZARD_FIELDS[field]} {'>=' if side == 'min' else '<='} ?")
+            params.append(value)
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def _hazard_order(self, order_by, descending):
+        if order_by not in HAZARD_FIELDS:
+            raise ValueError(f"unknown hazard field: {order_by}")
+        direction = "DESC" if descending else "ASC"
+        labels = self.zone_labels() if order_by == "zone" else None
+        if labels and sorted(labels) != labels:
+            # Roman numerals I-V sort correctly as text and use the index;
+            # other labellings are ranked with a CASE (and a sort)
+            ranks = " ".join(f"WHEN '{z}' THEN {zone_rank(z, -1)}" for z in labels if "'" not in z)
+            expr = f"CASE SeismicZone {ranks} ELSE -1 END" if ranks else "SeismicZone"
+        else:
+            expr = HAZARD_FIELDS[order_by]
+        return f" ORDER BY {expr} {direction}, State, District"
+
+    def count_hazard(self, **bounds):
+        """Number of locations inside the envelope; see _hazard_where()."""
+        where, params = self._hazard_where(bounds)
+        return self._execute(f"SELECT COUNT(*) FROM locations{where}", params).fetchone()[0]
+
+    def hazard_cursor(self, order_by="wind", descending=True, **bounds):
+        """
+        Open cursor over (State, District, Wind, SeismicZone, SeismicFactor,
+        TempMax, TempMin) rows inside the envelope, ranked by `order_by`
+        (a HAZARD_FIELDS name). Rows are produced as they are fetched, so
+        callers can page through large results with fetchmany().
+        """
+        where, params = self._hazard_where(bounds)
+        return self._execute(
+            "SELECT State, District, Wind, SeismicZone, SeismicFactor, TempMax, TempMin "
+            f"FROM locations{where}{self._hazard_order(order_by, descending)}",
+            params
+        )
+
+    def query_hazard(self, order_by="wind", descending=True, limit=None, **bounds):
+        """[(state, district, LocationData)] inside the envelope, ranked."""
+        cursor = self.hazard_cursor(order_by, descending, **bounds)
+        rows = cursor.fetchall() if limit is None else cursor.fetchmany(limit)
+        cursor.close()
+        return [(state, district, LocationData(*data)) for state, district, *data in rows]
+
+    # ==============================================================
+    # Direct SQL (uncached) path, kept for comparison/benchmarks
+    # ==============================================================
+
+    def query_districts(self, state):
+        rows = self._execute(
             "SELECT District FROM locations WHERE State=? ORDER BY District",
             (state,)
-        )
-        return [row[0] for row in self.cur.fetchall()]
+        ).fetchall()
+        return [row[0] for row in rows]
 
-    def get_location_data(self, district):
-        self.cur.execute(
+    def query_location(self, state, district):
+        row = self._execute(
+            "SELECT Wind, SeismicZone, SeismicFactor, TempMax, TempMin FROM locations "
+            "WHERE State=? AND District=?",
+            (state, district)
+        ).fetchone()
+        return LocationData(*row) if row else None
+
+    def query_location_data(self, district):
+        return self._execute(
             "SELECT Wind, SeismicZone, SeismicFactor, TempMax, TempMin FROM locations WHERE District=?",
             (district,)
-        )
-        return self.cur.fetchone()
+        ).fetchone()
@@ -0,0 +1,54 @@
+import os
+import sqlite3
+from collections import namedtuple
+
+from ui import startup_profile
+from ui.db import DB, DB_PATH
+from ui.location_picker import build_location_index
+from ui.session_cache import file_signature
+from ui.tasks import Cancelled
+
+# DB with its index built, file signature for the session cache, and the
+# LocationIndex of the state and district pickers
+LoadedDB = namedtuple("LoadedDB", "db signature state_index district_index")
+
+
+def load_database(token, path=None, previous_signature=None, prefetch_state=None):
+    """
+    TaskRunner task: opens the location database and preloads its index
+    off the GUI thread. It also computes the file signature for the
+    session cache and builds what the type-ahead combos use: their
+    location indexes and the district matchers for all states and for
+    `prefetch_state` (the remembered state). An existing custom parameters
+    store is attached as `custom` (see DB.attach).
+    """
+    with startup_profile.phase("DB open (worker)"):
+        db = DB(path) if path else DB()
+    try:
+        token.check()
+        signature = file_signature(path or DB_PATH, previous_signature)
+        token.check()
+        state_index = build_location_index(states=db.get_states())
+        district_index = build_location_index(pairs=db.get_locations())
+        token.check()
+        _attach_custom_params(db)
+        db.district_matcher()
+        if prefetch_state:
+            db.get_districts(prefetch_state)
+            db.district_matcher(prefetch_state)
+    except Cancelled:
+        # Superseded by a newer load
+        db.close()
+        raise
+    return LoadedDB(db, signature, state_index, district_index)
+
+
+def _attach_custom_params(db):
+    from tools.custom_params import CUSTOM_DB_PATH  # deferred until first use
+
+    # A store created by a later import is attached on the next load
+    if os.path.exists(CUSTOM_DB_PATH):
+        try:
+            db.attach(CUSTOM_DB_PATH)
+        except sqlite3.Error:
+            pass    # unreadable store: locations still work without it
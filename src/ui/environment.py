@@ -0,0 +1,62 @@
+from collections import namedtuple
+
+from PySide6.QtCore import QObject, QTimer, Signal
+
+SOURCE_DATABASE = "database"
+SOURCE_CUSTOM = "custom"
+
+# Loading parameters in effect, where they came from, and for database
+# values the location they belong to
+EnvironmentParams = namedtuple(
+    "EnvironmentParams", "wind zone factor tmax tmin source state district")
+
+
+class EnvironmentStore(QObject):
+    """
+    Single owner of the environmental loading parameters, whichever
+    location mode supplied them.
+
+    Setters only record the new value; `changed` is emitted once when
+    control returns to the event loop, and only if the parameters differ
+    from what was last emitted. A burst of updates from one interaction
+    (mode toggle, state + district change, project load) therefore
+    reaches labels and other consumers as one notification.
+    """
+    changed = Signal(object)   # EnvironmentParams, or None when unset
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._params = None
+        self._emitted = None
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(0)
+        self._timer.timeout.connect(self.flush)
+
+    @property
+    def params(self):
+        return self._params
+
+    def set(self, params):
+        self._params = params
+        self._timer.start()
+
+    def set_from_database(self, state, district, data):
+        """`data` is a ui.db.LocationData."""
+        self.set(EnvironmentParams(*data, SOURCE_DATABASE, state, district))
+
+    def set_custom(self, values):
+        """`values` as returned by CustomTableEditor.get_values()."""
+        self.set(EnvironmentParams(values["wind"], values["zone"], values["factor"],
+                                   values["tmax"], values["tmin"], SOURCE_CUSTOM, None, None))
+
+    def clear(self):
+        self.set(None)
+
+    def flush(self):
+        """Emit a pending change now instead of on the next event loop turn."""
+        self._timer.stop()
+        if self._params != self._emitted:
+            self._emitted = self._params
+            self.changed.emit(self._params)
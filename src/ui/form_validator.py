@@ -0,0 +1,65 @@
+from PySide6.QtCore import QObject, QTimer
+
+from ui import validation
+
+SEVERITY_STYLES = {
+    validation.ERROR: "color: red;",
+    validation.WARNING: "color: orange;",
+}
+
+
+class FormValidator(QObject):
+    """
+    Applies ui.validation rules to line edits.
+
+    Edits only mark their field dirty and restart a debounce timer; when
+    it fires, all dirty fields are checked in one pass. A label's text and
+    style are only touched when its message actually changes.
+    """
+    DEBOUNCE_MS = 150
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._fields = {}     # field -> (edit, label, rule)
+        self._shown = {}      # field -> message currently on the label
+        self._dirty = set()
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(self.DEBOUNCE_MS)
+        self._timer.timeout.connect(self.validate_now)
+
+    def bind(self, field, edit, label):
+        rule = validation.RULES_BY_FIELD[field]
+        self._fields[field] = (edit, label, rule)
+        self._shown[field] = label.text()
+        label.setStyleSheet(SEVERITY_STYLES[rule.severity])
+        edit.textChanged.connect(lambda _text, f=field: self._mark_dirty(f))
+
+    def _mark_dirty(self, field):
+        self._dirty.add(field)
+        self._timer.start()
+
+    def validate_now(self, fields=None):
+        """Check the dirty (or given) fields immediately; returns {field: message}."""
+        self._timer.stop()
+        fields = set(fields) if fields is not None else self._dirty
+        record = {f: self._fields[f][0].text() for f in fields}
+        results = validation.validate_record(record, [self._fields[f][2] for f in fields])
+        self._dirty.clear()
+
+        for field, message in results.items():
+            message = message or ""
+            if message != self._shown[field]:
+                self._shown[field] = message
+                self._fields[field][1].setText(message)
+        return results
+
+    def validate_all(self):
+        return self.validate_now(self._fields)
+
+    def messages(self):
+        """Messages currently shown, after flushing pending edits."""
+        if self._dirty:
+            self.validate_now()
+        return dict(self._shown)
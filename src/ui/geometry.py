@@ -0,0 +1,124 @@
+"""
+Girder layout rules, free of Qt.
+
+The scalar functions are what ModifyGeometryDialog uses per keystroke;
+solve_layouts() evaluates every (spacing, girders, overhang) combination
+for one or many carriageway widths in a single NumPy call for batch jobs.
+"""
+import math
+
+# Overall bridge width = carriageway width + this allowance (m)
+OVERALL_WIDTH_ALLOWANCE = 5.0
+
+# Spacings are reported to one decimal, as shown in the dialog
+SPACING_DECIMALS = 1
+
+# Most girders a layout may have
+MAX_GIRDERS = 50
+
+
+class GeometryError(ValueError):
+    """An input or derived value is outside the valid layout range."""
+
+
+def _check_finite(message, *values):
+    # Typed text such as "nan" or "inf" parses as a float
+    if not all(map(math.isfinite, values)):
+        raise GeometryError(message)
+
+
+def _check_girders(girders):
+    if girders < 1:
+        raise GeometryError("Number of girders must be ≥ 1.")
+    if girders > MAX_GIRDERS:
+        raise GeometryError(f"Number of girders must be ≤ {MAX_GIRDERS}.")
+
+
+def overall_width(carriageway_width):
+    return float(carriageway_width) + OVERALL_WIDTH_ALLOWANCE
+
+
+def girders_from_spacing(overall, spacing, overhang=0.0):
+    """Snap a requested spacing to a whole number of girders: (n, spacing)."""
+    _check_finite("Invalid spacing value.", spacing)
+    _check_finite("Invalid overhang value.", overhang)
+    if spacing <= 0 or spacing >= overall:
+        raise GeometryError("Invalid spacing value.")
+    # Clamped so a tiny spacing cannot overflow round()
+    n = max(1, round(min((overall - overhang) / spacing, MAX_GIRDERS + 1)))
+    _check_girders(n)
+    return n, round((overall - overhang) / n, SPACING_DECIMALS)
+
+
+def spacing_from_girders(overall, girders, overhang=0.0):
+    _check_finite("Invalid overhang value.", overhang)
+    _check_girders(girders)
+    spacing = round((overall - overhang) / girders, SPACING_DECIMALS)
+    if spacing <= 0 or spacing >= overall:
+        raise GeometryError("Computed spacing invalid.")
+    return spacing
+
+
+def spacing_from_overhang(overall, overhang, girders=1):
+    _check_finite("Invalid overhang value.", overhang)
+    if overhang < 0 or overhang >= overall:
+        raise GeometryError("Invalid overhang value.")
+    _check_girders(girders)
+    return round((overall - overhang) / girders, SPACING_DECIMALS)
+
+
+def snap_spacing(overall, spacing, overhang):
+    """
+    Array form of girders_from_spacing over broadcastable inputs; it also
+    rejects overhangs outside [0, overall) like spacing_from_overhang.
+    Layouts of more than MAX_GIRDERS girders are invalid. Returns
+    (girders, spacing, valid); entries where valid is False are 0.
+    """
+    import numpy as np
+
+    overall, spacing, overhang = np.broadcast_arrays(
+        np.asarray(overall, dtype=float),
+        np.asarray(spacing, dtype=float),
+        np.asarray(overhang, dtype=float),
+    )
+    valid = (spacing > 0) & (spacing < overall) & (overhang >= 0) & (overhang < overall)
+    safe = np.where(valid, spacing, 1.0)
+    n = np.maximum(1, np.round((overall - overhang) / safe))
+    valid &= n <= MAX_GIRDERS
+    snapped = np.round((overall - overhang) / n, SPACING_DECIMALS)
+    return np.where(valid, n, 0).astype(int), np.where(valid, snapped, 0.0), valid
+
+
+def solve_layouts(carriageway_widths, overhangs, max_girders=MAX_GIRDERS):
+    """
+    All valid layouts for each carriageway width.
+
+    `carriageway_widths` and `overhangs` are scalars or 1-D sequences;
+    girder counts 1..max_girders (at most MAX_GIRDERS) are tried for every
+    (width, overhang). Non-finite or non-positive widths and non-finite
+    overhangs yield no layouts.
+    Returns a dict of equal-length 1-D arrays: carriageway_width,
+    overall_width, overhang, girders, spacing.
+    """
+    import numpy as np
+
+    _check_girders(max_girders)
+    cw = np.atleast_1d(np.asarray(carriageway_widths, dtype=float))[:, None, None]
+    oh = np.atleast_1d(np.asarray(overhangs, dtype=float))[None, :, None]
+    n = np.arange(1, max_girders + 1, dtype=float)[None, None, :]
+
+    overall = cw + OVERALL_WIDTH_ALLOWANCE
+    with np.errstate(invalid="ignore"):    # inf - inf; masked below
+        spacing = np.round((overall - oh) / n, SPACING_DECIMALS)
+    valid = (np.isfinite(cw) & (cw > 0) & np.isfinite(oh)
+             & (oh >= 0) & (oh < overall) & (spacing > 0) & (spacing < overall))
+
+    shape = spacing.shape
+    idx = np.nonzero(valid)
+    return {
+        "carriageway_width": np.broadcast_to(cw, shape)[idx],
+        "overall_width": np.broadcast_to(overall, shape)[idx],
+        "overhang": np.broadcast_to(oh, shape)[idx],
+        "girders": np.broadcast_to(n, shape)[idx].astype(int),
+        "spacing": spacing[idx],
+    }
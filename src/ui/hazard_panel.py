@@ -0,0 +1,221 @@
+from PySide6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QGridLayout, QLineEdit, QComboBox,
+    QCheckBox, QPushButton, QLabel, QTableView, QAbstractItemView, QHeaderView
+)
+from PySide6.QtGui import QDoubleValidator
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex, Signal
+
+from ui.db import zone_rank
+
+HEADERS = ("State", "District", "Wind (m/s)", "Seismic Zone", "Seismic Factor",
+           "Max Temp (°C)", "Min Temp (°C)")
+
+# (field, label) for the min/max envelope rows; zone has its own combos
+RANGE_FIELDS = (
+    ("wind", "Basic Wind Speed (m/s):"),
+    ("factor", "Seismic Factor:"),
+    ("tmax", "Max Temperature (°C):"),
+    ("tmin", "Min Temperature (°C):"),
+)
+
+ORDER_FIELDS = (
+    ("wind", "Wind Speed"),
+    ("zone", "Seismic Zone"),
+    ("factor", "Seismic Factor"),
+    ("tmax", "Max Temperature"),
+    ("tmin", "Min Temperature"),
+    ("temp_range", "Temperature Range"),
+)
+
+
+class HazardResultModel(QAbstractTableModel):
+    """
+    Table over a DB.hazard_cursor. Rows are pulled PAGE_ROWS at a time as
+    the view scrolls (canFetchMore/fetchMore), so showing a result only
+    costs its first page regardless of how many rows match.
+    """
+    PAGE_ROWS = 200
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+        self._cursor = None
+        self.total = 0
+
+    def set_cursor(self, cursor, total):
+        self.beginResetModel()
+        self._close_cursor()
+        self._rows = []
+        self._cursor = cursor
+        self.total = total
+        self.endResetModel()
+        if self.canFetchMore():
+            self.fetchMore()
+
+    def clear(self):
+        self.set_cursor(None, 0)
+
+    def _close_cursor(self):
+        if self._cursor is not None:
+            self._cursor.close()
+            self._cursor = None
+
+    def location(self, row):
+        """(state, district) shown in `row`."""
+        return tuple(self._rows[row][:2])
+
+    # ==============================================================
+    # Qt model interface
+    # ==============================================================
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        value = self._rows[index.row()][index.column()]
+        if role == Qt.DisplayRole:
+            return "" if value is None else str(value)
+        if role == Qt.TextAlignmentRole and index.column() >= 2:
+            return int(Qt.AlignRight | Qt.AlignVCenter)
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return HEADERS[section]
+        return None
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._cursor is not None
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid() or self._cursor is None:
+            return
+        rows = self._cursor.fetchmany(self.PAGE_ROWS)
+        if len(rows) < self.PAGE_ROWS:
+            self._close_cursor()
+        if rows:
+            start = len(self._rows)
+            self.beginInsertRows(QModelIndex(), start, start + len(rows) - 1)
+            self._rows.extend(rows)
+            self.endInsertRows()
+
+
+class HazardPanel(QDialog):
+    """
+    Popup to find and rank locations by their loading parameters:
+    - min/max envelope per parameter, zone range and optional state
+    - results ranked by any parameter, streamed into the table page by page
+    - double-click a row to select that location in the input panel
+    """
+    location_activated = Signal(str, str)
+
+    def __init__(self, db, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Hazard Query")
+        self.setMinimumSize(760, 520)
+        self.db = db
+
+        layout = QVBoxLayout(self)
+        grid = QGridLayout()
+        layout.addLayout(grid)
+        grid.addWidget(QLabel("Min"), 0, 1)
+        grid.addWidget(QLabel("Max"), 0, 2)
+
+        # Envelope; empty fields are unbounded
+        self.bounds = {}
+        for row, (field, label) in enumerate(RANGE_FIELDS, 1):
+            grid.addWidget(QLabel(label), row, 0)
+            for col, side in enumerate(("min", "max"), 1):
+                edit = QLineEdit()
+                edit.setValidator(QDoubleValidator(edit))
+                edit.returnPressed.connect(self.run_query)
+                self.bounds[f"{field}_{side}"] = edit
+                grid.addWidget(edit, row, col)
+
+        zones = db.zone_labels()
+        row = len(RANGE_FIELDS) + 1
+        grid.addWidget(QLabel("Seismic Zone:"), row, 0)
+        self.cmb_zone_min = QComboBox()
+        self.cmb_zone_max = QComboBox()
+        for col, combo in enumerate((self.cmb_zone_min, self.cmb_zone_max), 1):
+            combo.addItem("Any", None)
+            for zone in zones:
+                # Labels without a rank cannot bound a range
+                if zone_rank(zone, -1) >= 0:
+                    combo.addItem(zone, zone)
+            grid.addWidget(combo, row, col)
+
+        grid.addWidget(QLabel("State:"), row + 1, 0)
+        self.cmb_state = QComboBox()
+        self.cmb_state.addItem("All States", None)
+        for state in db.get_states():
+            self.cmb_state.addItem(state, state)
+        grid.addWidget(self.cmb_state, row + 1, 1, 1, 2)
+
+        grid.addWidget(QLabel("Rank By:"), row + 2, 0)
+        self.cmb_order = QComboBox()
+        for field, label in ORDER_FIELDS:
+            self.cmb_order.addItem(label, field)
+        grid.addWidget(self.cmb_order, row + 2, 1)
+        self.chk_descending = QCheckBox("Highest first")
+        self.chk_descending.setChecked(True)
+        grid.addWidget(self.chk_descending, row + 2, 2)
+
+        btn_row = QHBoxLayout()
+        self.status_label = QLabel("")
+        btn_row.addWidget(self.status_label)
+        btn_row.addStretch()
+        btn_find = QPushButton("Find")
+        btn_find.setDefault(True)
+        btn_find.clicked.connect(self.run_query)
+        btn_row.addWidget(btn_find)
+        layout.addLayout(btn_row)
+
+        # Results
+        self.model = HazardResultModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table.verticalHeader().setVisible(False)
+        # Fixed widths: ResizeToContents would measure every fetched row
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
+        self.table.horizontalHeader().setStretchLastSection(True)
+        self.table.doubleClicked.connect(self.on_row_activated)
+        layout.addWidget(self.table)
+
+    def query_bounds(self):
+        """Envelope from the form, as DB.hazard_cursor keyword arguments."""
+        bounds = {}
+        for key, edit in self.bounds.items():
+            text = edit.text().strip()
+            if text:
+                bounds[key] = float(text)
+        bounds["zone_min"] = self.cmb_zone_min.currentData()
+        bounds["zone_max"] = self.cmb_zone_max.currentData()
+        bounds["state"] = self.cmb_state.currentData()
+        return {k: v for k, v in bounds.items() if v is not None}
+
+    def run_query(self):
+        try:
+            bounds = self.query_bounds()
+        except ValueError:
+            self.status_label.setText("Enter numbers for the min/max fields.")
+            return
+        total = self.db.count_hazard(**bounds)
+        cursor = self.db.hazard_cursor(
+            self.cmb_order.currentData(), self.chk_descending.isChecked(), **bounds)
+        self.model.set_cursor(cursor, total)
+        self.status_label.setText(f"{total:,} matching locations")
+
+    def on_row_activated(self, index):
+        self.location_activated.emit(*self.model.location(index.row()))
+
+    def closeEvent(self, event):
+        self.model.clear()
+        super().closeEvent(event)
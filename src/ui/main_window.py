@@ -1,30 +1,37 @@
+import os
+
 from PySide6.QtWidgets import (
-    QMainWindow, QWidget, QHBoxLayout, QSplitter, QLabel, QSizePolicy
+    QMainWindow, QWidget, QHBoxLayout, QSplitter, QTabWidget, QFileDialog, QMessageBox,
+    QProgressBar
 )
-from PySide6.QtGui import QPixmap, QIcon
-from PySide6.QtCore import Qt
-import sys
-import os
+from PySide6.QtCore import Qt, Signal
 
+from ui import assets, startup_profile
 from ui.basic_inputs import BasicInputs
+from ui.cross_section import CrossSectionView
+from ui.tasks import TaskRunner
 
 
-def resource_path(relative_path):
-    """Get absolute path to resource, works for dev and for PyInstaller"""
-    try:
-        # PyInstaller creates a temp folder and stores path in _MEIPASS
-        base_path = sys._MEIPASS
-    except Exception:
-        base_path = os.path.abspath(".")
-    return os.path.join(base_path, relative_path)
+class MainWindow(QMainWindow):
+    # Staged initialization messages, e.g. for the splash screen
+    progress = Signal(str)
+    # Emitted once the window and its data (location DB, pixmaps) are ready
+    ready = Signal()
 
+    # Longest closeEvent waits for a running project load
+    CLOSE_WAIT_MS = 2000
 
-class MainWindow(QMainWindow):
-    def __init__(self):
+    def __init__(self, on_progress=None, session=None):
         super().__init__()
 
+        # Construction is synchronous, so callers that want the early stages
+        # pass a callback instead of connecting to `progress` afterwards.
+        if on_progress is not None:
+            self.progress.connect(on_progress)
+        self._is_ready = False
+
         self.setWindowTitle("Bridge Module - UI Screening Task")
-        self.setWindowIcon(QIcon(resource_path("assets/icon.ico")))  # Set window icon
+        self.setWindowIcon(assets.icon("icon"))  # Set window icon
         self.setMinimumSize(1100, 700)
 
         # === Central Widget ===
@@ -37,20 +44,160 @@ class MainWindow(QMainWindow):
         layout.addWidget(splitter)
 
         # === Left Panel (Inputs) ===
-        self.basic_inputs_widget = BasicInputs()
+        self.progress.emit("Building input panels…")
+        with startup_profile.phase("widget construction"):
+            self.basic_inputs_widget = BasicInputs(session)
+        # Connect before any progress callback can pump the event loop and
+        # deliver the loader result
+        self.basic_inputs_widget.db_ready.connect(self._on_db_ready)
         splitter.addWidget(self.basic_inputs_widget)
         self.basic_inputs_widget.setMinimumWidth(420)
 
-        # === Right Panel (Reference Image) ===
-        image_label = QLabel()
-        image_label.setAlignment(Qt.AlignCenter)
-        image_label.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        # Location DB loads in the background; readiness waits for it
+        self.progress.emit("Loading location database…")
+
+        # === Right Panel (Cross Section, Reference Image) ===
+        right_tabs = QTabWidget()
+        splitter.addWidget(right_tabs)
+
+        # Live cross-section of the current geometry inputs
+        self.section_view = CrossSectionView()
+        self.section_view.set_geometry(self.basic_inputs_widget.section_geometry())
+        self.basic_inputs_widget.geometry_changed.connect(self.section_view.set_geometry)
+        right_tabs.addTab(self.section_view, "Cross Section")
 
-        pixmap = QPixmap(resource_path("assets/bridge_cross_section.png"))
-        image_label.setPixmap(pixmap.scaled(
-            500, 500, Qt.KeepAspectRatio, Qt.SmoothTransformation
-        ))
-        splitter.addWidget(image_label)
+        # Decoded and scaled off the GUI thread; fitted to the pane on resize
+        self.progress.emit("Loading reference image…")
+        with startup_profile.phase("pixmap decode"):
+            assets.preload("cross_section")
+            self.image_label = assets.AssetLabel("cross_section")
+        right_tabs.addTab(self.image_label, "Reference")
 
         splitter.setStretchFactor(0, 0)
         splitter.setStretchFactor(1, 1)
+
+        # === Menu ===
+        file_menu = self.menuBar().addMenu("File")
+        file_menu.addAction("Open Project…", self.open_project)
+        file_menu.addAction("Save Project…", self.save_project)
+        self.recent_menu = file_menu.addMenu("Recent Projects")
+        self.recent_menu.aboutToShow.connect(self.populate_recent_menu)
+
+        tools_menu = self.menuBar().addMenu("Tools")
+        tools_menu.addAction("Design Space Sweep…", self.open_sweep_dialog)
+        # Needs the location database, which may already have loaded while
+        # progress callbacks pumped the event loop
+        self.act_hazard = tools_menu.addAction("Hazard Query…", self.open_hazard_panel)
+        self.act_hazard.setEnabled(self.basic_inputs_widget.db is not None)
+
+        # === Background tasks ===
+        # Project files are read off the GUI thread; the status bar shows a
+        # busy indicator while this or the input panel's runner has work
+        # in flight
+        self.tasks = TaskRunner(self)
+        self.busy_bar = QProgressBar()
+        self.busy_bar.setRange(0, 0)
+        self.busy_bar.setMaximumWidth(120)
+        self.busy_bar.setVisible(False)
+        self.statusBar().addPermanentWidget(self.busy_bar)
+        for runner in self._runners():
+            runner.busy.connect(self._update_busy)
+        self._update_busy()
+
+    def open_project(self):
+        from ui import project  # deferred until first use
+
+        path, _ = QFileDialog.getOpenFileName(
+            self, "Open Project", "", f"Bridge Project (*{project.EXTENSION});;JSON (*.json)")
+        if path:
+            self.load_project_file(path)
+
+    def load_project_file(self, path):
+        from ui import project  # deferred until first use
+
+        self.statusBar().showMessage(f"Opening {os.path.basename(path)}…")
+        # Sections are decoded on the worker too; opening another project
+        # before this one is read supersedes it
+        self.tasks.submit(
+            "project", lambda token: project.load_project(path).to_dict(),
+            on_result=lambda sections: self._apply_project(path, sections),
+            on_error=lambda exc: self._open_failed(path, exc),
+        )
+
+    def _apply_project(self, path, sections):
+        try:
+            self.basic_inputs_widget.set_state(sections)
+        except ValueError as exc:
+            self._open_failed(path, exc)
+            return
+        self.basic_inputs_widget.session.add_recent_project(path)
+        self.statusBar().showMessage(f"Opened {os.path.basename(path)}", 3000)
+
+    def _open_failed(self, path, exc):
+        self.statusBar().clearMessage()
+        self.basic_inputs_widget.session.remove_recent_project(path)
+        QMessageBox.critical(self, "Open Project", f"Could not open project:\n{exc}")
+
+    def populate_recent_menu(self):
+        self.recent_menu.clear()
+        recent = self.basic_inputs_widget.session.recent_projects()
+        for path in recent:
+            self.recent_menu.addAction(path, lambda p=path: self.load_project_file(p))
+        if not recent:
+            self.recent_menu.addAction("No recent projects").setEnabled(False)
+
+    def save_project(self):
+        from ui import project  # deferred until first use
+
+        path, selected = QFileDialog.getSaveFileName(
+            self, "Save Project", "", f"Bridge Project (*{project.EXTENSION});;JSON (*.json)")
+        if not path:
+            return
+        try:
+            project.save_project(path, self.basic_inputs_widget.get_state(),
+                                 binary=not path.endswith(".json"))
+        except OSError as exc:
+            QMessageBox.critical(self, "Save Project", f"Could not save project:\n{exc}")
+            return
+        self.basic_inputs_widget.session.add_recent_project(path)
+
+    def open_sweep_dialog(self):
+        from ui.sweep_dialog import SweepDialog  # deferred until first use
+
+        dialog = SweepDialog(self.basic_inputs_widget.current_location(), self)
+        dialog.exec()
+
+    def open_hazard_panel(self):
+        from ui.hazard_panel import HazardPanel  # deferred until first use
+
+        panel = HazardPanel(self.basic_inputs_widget.db, self)
+        panel.setAttribute(Qt.WA_DeleteOnClose)
+        panel.location_activated.connect(self.basic_inputs_widget.on_location_picked)
+        panel.show()
+
+    def is_ready(self):
+        return self._is_ready
+
+    def _runners(self):
+        return (self.tasks, self.basic_inputs_widget.tasks)
+
+    def _update_busy(self, *_):
+        self.busy_bar.setVisible(any(runner.is_busy() for runner in self._runners()))
+
+    def closeEvent(self, event):
+        # Stop background work before the widgets its results go to are gone
+        for runner in self._runners():
+            runner.cancel()
+        # Only this runner's tasks, and not for long: a project read
+        # cannot be interrupted, and its result is dropped anyway
+        self.tasks.wait(self.CLOSE_WAIT_MS)
+        super().closeEvent(event)
+
+    def _on_db_ready(self, ok):
+        if hasattr(self, "act_hazard"):
+            self.act_hazard.setEnabled(ok)
+        if self._is_ready:
+            return
+        self.progress.emit("Location database ready" if ok else "Location database unavailable")
+        self._is_ready = True
+        self.ready.emit()
@@ -0,0 +1,102 @@
+"""
+Tolerant name matching for states and districts.
+
+Names are normalized once and indexed by character trigrams, so a fuzzy
+query only scores the few candidates sharing the most trigrams with it
+instead of running thefuzz over every name.
+"""
+import re
+from bisect import bisect_left
+
+# Words that differ between source tables without changing the place
+_NOISE_WORDS = re.compile(r"\b(district|dist|distt)\b")
+
+
+def fold(name):
+    """Case-fold and collapse punctuation/whitespace to single spaces."""
+    return re.sub(r"[^a-z0-9]+", " ", str(name).casefold()).strip()
+
+
+def normalize(name):
+    """Matching key: fold() without words like "District" that vary between tables."""
+    return re.sub(r"\s+", " ", _NOISE_WORDS.sub(" ", fold(name))).strip()
+
+
+def trigrams(key):
+    padded = f"  {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class NameMatcher:
+    """
+    Index over a list of names, each with an optional payload.
+
+    - exact(name): normalized exact hit
+    - prefix(text): names whose normalized key starts with text
+    - search(text): fuzzy best matches, scored with thefuzz on a trigram
+      candidate set
+    """
+    def __init__(self, names, payloads=None, max_candidates=40):
+        self.names = list(names)
+        self.payloads = list(payloads) if payloads is not None else self.names
+        self.keys = [normalize(n) for n in self.names]
+        self.max_candidates = max_candidates
+
+        self._exact = {}
+        self._grams = {}
+        for i, key in enumerate(self.keys):
+            self._exact.setdefault(key, i)
+            for gram in trigrams(key):
+                self._grams.setdefault(gram, []).append(i)
+
+        self._sorted = sorted((key, i) for i, key in enumerate(self.keys))
+        self._sorted_keys = [key for key, _ in self._sorted]
+
+    def __len__(self):
+        return len(self.names)
+
+    def exact(self, name):
+        i = self._exact.get(normalize(name))
+        return None if i is None else self.payloads[i]
+
+    def prefix(self, text, limit=None):
+        key = normalize(text)
+        out = []
+        for pos in range(bisect_left(self._sorted_keys, key), len(self._sorted)):
+            if not self._sorted_keys[pos].startswith(key):
+                break
+            out.append(self.payloads[self._sorted[pos][1]])
+            if limit is not None and len(out) >= limit:
+                break
+        return out
+
+    def candidates(self, key):
+        """Ids sharing the most trigrams with key, best first."""
+        counts = {}
+        for gram in trigrams(key):
+            for i in self._grams.get(gram, ()):
+                counts[i] = counts.get(i, 0) + 1
+        return sorted(counts, key=counts.__getitem__, reverse=True)[:self.max_candidates]
+
+    def search(self, text, limit=10, cutoff=60):
+        """Return [(payload, score)] best first, scores 0-100."""
+        from thefuzz import fuzz
+
+        key = normalize(text)
+        if not key:
+            return []
+        scored = []
+        for i in self.candidates(key):
+            score = fuzz.WRatio(key, self.keys[i])
+            if score >= cutoff:
+                scored.append((score, i))
+        scored.sort(key=lambda item: (-item[0], self.keys[item[1]]))
+        return [(self.payloads[i], score) for score, i in scored[:limit]]
+
+    def best(self, text, cutoff=90):
+        """Exact normalized hit, else the single fuzzy match scoring >= cutoff."""
+        hit = self.exact(text)
+        if hit is not None:
+            return hit
+        matches = self.search(text, limit=1, cutoff=cutoff)
+        return matches[0][0] if matches else None
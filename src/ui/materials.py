@@ -0,0 +1,165 @@
+"""
+Material grade properties, free of Qt.
+
+The tables are built once at import and exposed read-only:
+- STEEL: IS 2062 structural steel grades (girders, cross-bracing)
+- CONCRETE: IRC:112 deck concrete grades
+Strengths and moduli are in MPa, densities in kg/m³, thermal expansion
+coefficients per °C. Lookups by the names shown in the UI ("E350",
+"M40") are a single dict access; other spellings ("Fe 350", "m40") are
+normalized once and cached. Derived quantities for a grade and a
+temperature range are cached as well.
+"""
+import re
+from collections import namedtuple
+from functools import lru_cache
+from types import MappingProxyType
+
+SteelGrade = namedtuple("SteelGrade", "name fy fu E density alpha")
+ConcreteGrade = namedtuple("ConcreteGrade", "name fck fcm fctm Ecm density alpha")
+
+# Partial safety factors: IS 800 (steel), IRC:112 (concrete)
+GAMMA_M0 = 1.10
+GAMMA_M1 = 1.25
+GAMMA_C = 1.5
+ALPHA_CC = 0.67
+
+STEEL_E = 200_000.0
+STEEL_DENSITY = 7850.0
+STEEL_ALPHA = 12e-6
+CONCRETE_DENSITY = 2500.0
+CONCRETE_ALPHA = 10e-6
+
+# name: (fy, fu); fy for thicknesses below 20 mm
+_STEEL = {
+    "E250": (250.0, 410.0),
+    "E350": (350.0, 490.0),
+    "E450": (450.0, 570.0),
+}
+
+# name: (fck, fctm, Ecm in GPa)
+_CONCRETE = {
+    "M25": (25.0, 2.2, 30.0),
+    "M30": (30.0, 2.5, 31.0),
+    "M35": (35.0, 2.8, 32.0),
+    "M40": (40.0, 3.0, 33.0),
+    "M50": (50.0, 3.5, 35.0),
+    "M60": (60.0, 4.1, 37.0),
+}
+
+STEEL = MappingProxyType({
+    name: SteelGrade(name, fy, fu, STEEL_E, STEEL_DENSITY, STEEL_ALPHA)
+    for name, (fy, fu) in _STEEL.items()
+})
+CONCRETE = MappingProxyType({
+    name: ConcreteGrade(name, fck, fck + 10.0, fctm, ecm * 1000.0, CONCRETE_DENSITY, CONCRETE_ALPHA)
+    for name, (fck, fctm, ecm) in _CONCRETE.items()
+})
+
+# Combo box order
+STEEL_GRADES = tuple(STEEL)
+CONCRETE_GRADES = tuple(CONCRETE)
+
+# Accepted spellings per canonical prefix
+_GRADE_RE = {
+    "E": re.compile(r"\s*(?:FE|E)?\s*(\d+)\s*", re.IGNORECASE),
+    "M": re.compile(r"\s*M?\s*(\d+)\s*", re.IGNORECASE),
+}
+
+
+class MaterialError(ValueError):
+    """Unknown grade name."""
+
+
+@lru_cache(maxsize=256)
+def _normalize(grade, prefix):
+    match = _GRADE_RE[prefix].fullmatch(str(grade))
+    return f"{prefix}{match.group(1)}" if match else None
+
+
+def _lookup(table, grade, prefix):
+    """Entry of `table` for a grade name or number, or None."""
+    # Anything else (a list from a damaged project file, say) may not be
+    # hashable, so it can be neither a table key nor a cache key
+    if not isinstance(grade, (str, int)):
+        return None
+    found = table.get(grade)
+    return found if found is not None else table.get(_normalize(grade, prefix))
+
+
+def steel(grade):
+    """SteelGrade for "E350" (also "Fe 350", "e350", 350)."""
+    found = _lookup(STEEL, grade, "E")
+    if found is None:
+        raise MaterialError(f"unknown steel grade: {grade}")
+    return found
+
+
+def concrete(grade):
+    """ConcreteGrade for "M40" (also "m 40", 40)."""
+    found = _lookup(CONCRETE, grade, "M")
+    if found is None:
+        raise MaterialError(f"unknown concrete grade: {grade}")
+    return found
+
+
+# ==============================================================
+# Derived quantities
+# ==============================================================
+
+# Public functions resolve the grade first, so the caches are keyed by
+# the grade record whatever spelling the caller used
+
+def steel_design(grade):
+    """{"fyd", "fud"}: yield (γm0) and ultimate (γm1) design strengths."""
+    return _steel_design(steel(grade))
+
+
+@lru_cache(maxsize=None)
+def _steel_design(s):
+    return MappingProxyType({"fyd": s.fy / GAMMA_M0, "fud": 0.9 * s.fu / GAMMA_M1})
+
+
+def concrete_design(grade):
+    """{"fcd"}: design compressive strength α_cc·fck/γc."""
+    return _concrete_design(concrete(grade))
+
+
+@lru_cache(maxsize=None)
+def _concrete_design(c):
+    return MappingProxyType({"fcd": ALPHA_CC * c.fck / GAMMA_C})
+
+
+def modular_ratio(steel_grade, concrete_grade):
+    """Short-term modular ratio Es / Ecm."""
+    return steel(steel_grade).E / concrete(concrete_grade).Ecm
+
+
+def thermal_effects(grade, tmin, tmax):
+    """
+    {"delta_t", "strain", "stress"} for a steel or concrete grade over a
+    temperature range (°C): free strain α·ΔT and fully restrained stress
+    E·α·ΔT (MPa).
+    """
+    try:
+        material = steel(grade)
+    except MaterialError:
+        material = concrete(grade)
+    return _thermal_effects(material, float(tmin), float(tmax))
+
+
+@lru_cache(maxsize=4096)
+def _thermal_effects(material, tmin, tmax):
+    modulus = material.E if isinstance(material, SteelGrade) else material.Ecm
+    delta_t = tmax - tmin
+    strain = material.alpha * delta_t
+    return MappingProxyType({"delta_t": delta_t, "strain": strain, "stress": modulus * strain})
+
+
+def describe(grade):
+    """One-line property summary for the UI."""
+    s = _lookup(STEEL, grade, "E")
+    if s is not None:
+        return f"fy {s.fy:g} MPa · fu {s.fu:g} MPa · E {s.E / 1000:g} GPa · ρ {s.density:g} kg/m³"
+    c = concrete(grade)
+    return f"fck {c.fck:g} MPa · fctm {c.fctm:g} MPa · Ecm {c.Ecm / 1000:g} GPa · ρ {c.density:g} kg/m³"
@@ -1,10 +1,21 @@
 from PySide6.QtWidgets import (
-    QDialog, QVBoxLayout, QLabel, QFormLayout, QLineEdit, QPushButton, QMessageBox
+    QDialog, QVBoxLayout, QLabel, QFormLayout, QLineEdit, QPushButton, QMessageBox,
+    QSlider
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, Signal
+
+from ui import geometry
+from ui.geometry import GeometryError
 
 
 class ModifyGeometryDialog(QDialog):
+    # Layout after every valid edit, in get_values() form (for live previews)
+    values_changed = Signal(dict)
+
+    # Spacing slider resolution: one step per displayed decimal
+    SLIDER_STEPS_PER_M = 10 ** geometry.SPACING_DECIMALS
+    SLIDER_MAX = 2 ** 31 - 1     # QSlider positions are C ints
+
     def __init__(self, carriageway_width):
         super().__init__()
 
@@ -13,12 +24,15 @@ class ModifyGeometryDialog(QDialog):
 
         # Store base value
         self.carriageway_width = float(carriageway_width)
-        self.overall_width = self.carriageway_width + 5.0
+        self.overall_width = geometry.overall_width(self.carriageway_width)
 
         layout = QVBoxLayout(self)
 
         # ---- Header ----
-        header = QLabel(f"Overall Bridge Width = Carriageway Width + 5 = {self.overall_width:.1f} m")
+        header = QLabel(
+            f"Overall Bridge Width = Carriageway Width + {geometry.OVERALL_WIDTH_ALLOWANCE:g} "
+            f"= {self.overall_width:.1f} m"
+        )
         header.setStyleSheet("font-weight: bold; color: darkblue;")
         layout.addWidget(header)
 
@@ -35,7 +49,13 @@ class ModifyGeometryDialog(QDialog):
         self.in_overhang = QLineEdit()
         self.in_overhang.setPlaceholderText("Enter deck overhang (m)")
 
+        self.slider_spacing = QSlider(Qt.Horizontal)
+        self.slider_spacing.setRange(
+            1, max(1, min(int(self.overall_width * self.SLIDER_STEPS_PER_M) - 1, self.SLIDER_MAX)))
+        self.slider_spacing.setValue(int(2.5 * self.SLIDER_STEPS_PER_M))
+
         form.addRow("Girder Spacing (m):", self.in_spacing)
+        form.addRow("", self.slider_spacing)
         form.addRow("No. of Girders:", self.in_girders)
         form.addRow("Deck Overhang (m):", self.in_overhang)
 
@@ -53,6 +73,7 @@ class ModifyGeometryDialog(QDialog):
         self.in_spacing.textChanged.connect(self.update_from_spacing)
         self.in_girders.textChanged.connect(self.update_from_girders)
         self.in_overhang.textChanged.connect(self.update_from_overhang)
+        self.slider_spacing.valueChanged.connect(self.update_from_slider)
 
     # ======================================================
     # Calculation Logic
@@ -63,31 +84,37 @@ class ModifyGeometryDialog(QDialog):
             return
         try:
             spacing = float(self.in_spacing.text())
-            overhang = float(self.in_overhang.text() or 0)
-
-            if spacing <= 0 or spacing >= self.overall_width:
-                self.error_label.setText("Invalid spacing value.")
-                return
-            self.error_label.setText("")
+        except ValueError:
+            return
+        self._apply_spacing(spacing)
 
-            # Compute number of girders
-            n_float = (self.overall_width - overhang) / spacing
-            n = max(1, round(n_float))
+    def update_from_slider(self, value):
+        self._apply_spacing(value / self.SLIDER_STEPS_PER_M)
 
-            # Adjust spacing to match integer girders
-            spacing_exact = round((self.overall_width - overhang) / n, 1)
+    def _apply_spacing(self, spacing):
+        """Snap a requested spacing to whole girders and show the layout."""
+        try:
+            overhang = float(self.in_overhang.text() or 0)
+        except ValueError:
+            return
 
-            self.in_girders.blockSignals(True)
-            self.in_spacing.blockSignals(True)
+        try:
+            n, spacing_exact = geometry.girders_from_spacing(self.overall_width, spacing, overhang)
+        except GeometryError as exc:
+            self.error_label.setText(str(exc))
+            return
+        self.error_label.setText("")
 
-            self.in_girders.setText(str(n))
-            self.in_spacing.setText(str(spacing_exact))
+        self.in_girders.blockSignals(True)
+        self.in_spacing.blockSignals(True)
 
-            self.in_girders.blockSignals(False)
-            self.in_spacing.blockSignals(False)
+        self.in_girders.setText(str(n))
+        self.in_spacing.setText(str(spacing_exact))
 
-        except:
-            return
+        self.in_girders.blockSignals(False)
+        self.in_spacing.blockSignals(False)
+        self._sync_slider(spacing)
+        self._emit_values()
 
     def update_from_girders(self):
         if not self.in_girders.hasFocus():
@@ -95,25 +122,21 @@ class ModifyGeometryDialog(QDialog):
         try:
             n = int(self.in_girders.text())
             overhang = float(self.in_overhang.text() or 0)
+        except ValueError:
+            return
 
-            if n < 1:
-                self.error_label.setText("Number of girders must be ≥ 1.")
-                return
-            self.error_label.setText("")
-
-            spacing = (self.overall_width - overhang) / n
-            spacing = round(spacing, 1)
-
-            if spacing <= 0 or spacing >= self.overall_width:
-                self.error_label.setText("Computed spacing invalid.")
-                return
-
-            self.in_spacing.blockSignals(True)
-            self.in_spacing.setText(str(spacing))
-            self.in_spacing.blockSignals(False)
-
-        except:
+        try:
+            spacing = geometry.spacing_from_girders(self.overall_width, n, overhang)
+        except GeometryError as exc:
+            self.error_label.setText(str(exc))
             return
+        self.error_label.setText("")
+
+        self.in_spacing.blockSignals(True)
+        self.in_spacing.setText(str(spacing))
+        self.in_spacing.blockSignals(False)
+        self._sync_slider(spacing)
+        self._emit_values()
 
     def update_from_overhang(self):
         if not self.in_overhang.hasFocus():
@@ -121,21 +144,39 @@ class ModifyGeometryDialog(QDialog):
         try:
             overhang = float(self.in_overhang.text())
             n = int(self.in_girders.text() or 1)
+        except ValueError:
+            return
 
-            if overhang < 0 or overhang >= self.overall_width:
-                self.error_label.setText("Invalid overhang value.")
-                return
-            self.error_label.setText("")
+        try:
+            spacing = geometry.spacing_from_overhang(self.overall_width, overhang, n)
+        except GeometryError as exc:
+            self.error_label.setText(str(exc))
+            return
+        self.error_label.setText("")
 
-            spacing = (self.overall_width - overhang) / n
-            spacing = round(spacing, 1)
+        self.in_spacing.blockSignals(True)
+        self.in_spacing.setText(str(spacing))
+        self.in_spacing.blockSignals(False)
+        self._sync_slider(spacing)
+        self._emit_values()
 
-            self.in_spacing.blockSignals(True)
-            self.in_spacing.setText(str(spacing))
-            self.in_spacing.blockSignals(False)
+    def _sync_slider(self, spacing):
+        self.slider_spacing.blockSignals(True)
+        self.slider_spacing.setValue(min(round(spacing * self.SLIDER_STEPS_PER_M), self.SLIDER_MAX))
+        self.slider_spacing.blockSignals(False)
 
-        except:
+    def _emit_values(self):
+        # Like get_values(), but an empty overhang previews as 0
+        try:
+            values = {
+                "spacing": float(self.in_spacing.text()),
+                "girders": int(self.in_girders.text()),
+                "overhang": float(self.in_overhang.text() or 0),
+                "overall_width": self.overall_width
+            }
+        except ValueError:
             return
+        self.values_changed.emit(values)
 
     def on_save(self):
         if self.error_label.text():
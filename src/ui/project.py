@@ -0,0 +1,138 @@
+"""
+Project files, free of Qt.
+
+Binary layout (little-endian):
+    magic     4s   b"BRGP"
+    version   H
+    count     H    number of sections
+    table     count x (name 16s, offset I, length I)
+    payloads  zlib-compressed UTF-8 JSON, one per section
+
+Only the header and section table are read on open; a section payload is
+decompressed and decoded the first time it is accessed. Files starting
+with "{" are read as plain JSON ({"version": ..., "sections": {...}}),
+which is also what save_project(..., binary=False) writes.
+"""
+import json
+import struct
+import zlib
+
+MAGIC = b"BRGP"
+VERSION = 1
+EXTENSION = ".bridge"
+
+_HEADER = struct.Struct("<4sHH")
+_ENTRY = struct.Struct("<16sII")
+
+
+class ProjectError(ValueError):
+    """The file is not a project file or was written by a newer version."""
+
+
+def encode_project(sections, binary=True):
+    """Serialize {section name: JSON-compatible dict} to bytes."""
+    if not binary:
+        return json.dumps({"version": VERSION, "sections": sections}, indent=2).encode("utf-8")
+
+    payloads = []
+    for name, data in sections.items():
+        raw_name = name.encode("utf-8")
+        if len(raw_name) > _ENTRY.size - 8:
+            raise ProjectError(f"section name too long: {name}")
+        payloads.append((raw_name, zlib.compress(
+            json.dumps(data, separators=(",", ":")).encode("utf-8"))))
+
+    offset = _HEADER.size + _ENTRY.size * len(payloads)
+    parts = [_HEADER.pack(MAGIC, VERSION, len(payloads))]
+    for raw_name, payload in payloads:
+        parts.append(_ENTRY.pack(raw_name, offset, len(payload)))
+        offset += len(payload)
+    parts.extend(payload for _, payload in payloads)
+    return b"".join(parts)
+
+
+class Project:
+    """
+    Read-only view of an encoded project; sections decode lazily.
+    Behaves like a mapping of section name -> dict. Damaged files raise
+    ProjectError, on open or when the damaged section is first read.
+    """
+    def __init__(self, data):
+        self._data = data
+        self._cache = {}
+        self._table = {}
+
+        try:
+            if data[:1] == b"{":
+                self._read_json(data)
+            else:
+                self._read_table(data)
+        except struct.error:
+            raise ProjectError("damaged project file (truncated)") from None
+        except (UnicodeDecodeError, json.JSONDecodeError) as exc:
+            raise ProjectError(f"damaged project file ({exc})") from None
+
+        if not isinstance(self.version, int) or isinstance(self.version, bool):
+            raise ProjectError("not a project file")
+        if self.version > VERSION:
+            raise ProjectError(f"project version {self.version} is newer than supported ({VERSION})")
+
+    def _read_json(self, data):
+        doc = json.loads(data.decode("utf-8"))
+        sections = doc.get("sections", {}) if isinstance(doc, dict) else None
+        if not isinstance(sections, dict):
+            raise ProjectError("not a project file")
+        self.version = doc.get("version", VERSION)
+        self._cache = {name: _section(name, section) for name, section in sections.items()}
+        self._table = {name: None for name in self._cache}
+
+    def _read_table(self, data):
+        if len(data) < _HEADER.size:
+            raise ProjectError("not a project file")
+        magic, self.version, count = _HEADER.unpack_from(data, 0)
+        if magic != MAGIC:
+            raise ProjectError("not a project file")
+        for i in range(count):
+            raw_name, offset, length = _ENTRY.unpack_from(data, _HEADER.size + i * _ENTRY.size)
+            if offset + length > len(data):
+                raise ProjectError("damaged project file (truncated)")
+            self._table[raw_name.rstrip(b"\0").decode("utf-8")] = (offset, length)
+
+    def __contains__(self, name):
+        return name in self._table
+
+    def __iter__(self):
+        return iter(self._table)
+
+    def __getitem__(self, name):
+        if name not in self._cache:
+            offset, length = self._table[name]
+            try:
+                payload = zlib.decompress(self._data[offset:offset + length])
+                section = json.loads(payload.decode("utf-8"))
+            except (zlib.error, UnicodeDecodeError, json.JSONDecodeError) as exc:
+                raise ProjectError(f"damaged project section {name!r} ({exc})") from None
+            self._cache[name] = _section(name, section)
+        return self._cache[name]
+
+    def get(self, name, default=None):
+        return self[name] if name in self._table else default
+
+    def to_dict(self):
+        return {name: self[name] for name in self._table}
+
+
+def _section(name, section):
+    if not isinstance(section, dict):
+        raise ProjectError(f"damaged project section {name!r} (not an object)")
+    return section
+
+
+def save_project(path, sections, binary=True):
+    with open(path, "wb") as f:
+        f.write(encode_project(sections, binary))
+
+
+def load_project(path):
+    with open(path, "rb") as f:
+        return Project(f.read())
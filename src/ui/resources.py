@@ -0,0 +1,39 @@
+"""Paths of bundled resources and per-user files, free of Qt so headless
+tools can use it."""
+import os
+import sys
+
+# Resolved once: PyInstaller unpacks into sys._MEIPASS, otherwise resources
+# are relative to the directory the app was started from
+BASE_PATH = getattr(sys, "_MEIPASS", None) or os.path.abspath(".")
+
+
+def resource_path(relative_path):
+    """Get absolute path to resource, works for dev and for PyInstaller"""
+    return os.path.join(BASE_PATH, relative_path)
+
+
+# Per-user files live under <platform base>/FOSSEE/BridgeModule, the same
+# organization/application names as the QSettings session cache
+APP_DIRS = ("FOSSEE", "BridgeModule")
+
+# When set, replaces the platform base directories (the benchmarks point it
+# at a temporary directory)
+USER_BASE = None
+
+
+def user_dir(kind):
+    """Per-user "cache" or "data" directory of the app; not created here."""
+    if USER_BASE is not None:
+        return os.path.join(USER_BASE, kind, *APP_DIRS)
+    home = os.path.expanduser("~")
+    if sys.platform == "win32":
+        var = "LOCALAPPDATA" if kind == "cache" else "APPDATA"
+        base = os.environ.get(var) or home
+    elif sys.platform == "darwin":
+        base = os.path.join(home, "Library", "Caches" if kind == "cache" else "Application Support")
+    elif kind == "cache":
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.join(home, ".cache")
+    else:
+        base = os.environ.get("XDG_DATA_HOME") or os.path.join(home, ".local", "share")
+    return os.path.join(base, *APP_DIRS)
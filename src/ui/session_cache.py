@@ -0,0 +1,109 @@
+import hashlib
+import json
+import os
+
+from PySide6.QtCore import QSettings
+
+# Bump when the layout of the cached values changes
+SCHEMA_VERSION = 1
+MAX_RECENT = 8
+
+
+def file_signature(path, previous=None):
+    """
+    {"mtime", "size", "sha256"} of a file. The hash is reused from
+    `previous` when mtime and size are unchanged, so an unchanged
+    database is not re-read on every launch.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    signature = {"mtime": st.st_mtime_ns, "size": st.st_size}
+    if previous and previous.get("mtime") == signature["mtime"] and previous.get("size") == signature["size"]:
+        signature["sha256"] = previous.get("sha256")
+        return signature
+
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    signature["sha256"] = h.hexdigest()
+    return signature
+
+
+class SessionCache:
+    """
+    Small per-user cache persisted with QSettings:
+    - recent project paths (most recent first)
+    - last selected state and district
+    - combo contents (state list, districts of the last state)
+    Location entries are tied to the locations.db signature and dropped
+    when the database content changes.
+    """
+    def __init__(self, settings=None):
+        self.settings = settings or QSettings("FOSSEE", "BridgeModule")
+        if self.settings.value("cache/schema", 0, int) != SCHEMA_VERSION:
+            self.settings.remove("cache")
+            self.settings.setValue("cache/schema", SCHEMA_VERSION)
+
+    # ==============================================================
+    # Database signature
+    # ==============================================================
+
+    def db_signature(self):
+        # Stored as JSON so 64-bit mtimes survive every QSettings backend
+        sig = self.settings.value("cache/db_signature")
+        return json.loads(sig) if sig else None
+
+    def check_db(self, signature):
+        """
+        Record the current database signature; returns False (and drops
+        cached location data) when its content differs from the cached one.
+        """
+        previous = self.db_signature()
+        valid = bool(previous and signature and previous.get("sha256") == signature.get("sha256"))
+        if not valid:
+            self.settings.remove("cache/location")
+        self.settings.setValue("cache/db_signature", json.dumps(signature))
+        return valid
+
+    # ==============================================================
+    # Location
+    # ==============================================================
+
+    def last_location(self):
+        state = self.settings.value("cache/location/state")
+        district = self.settings.value("cache/location/district")
+        return (state, district) if state else None
+
+    def set_last_location(self, state, district):
+        self.settings.setValue("cache/location/state", state)
+        self.settings.setValue("cache/location/district", district)
+
+    def combo_contents(self):
+        """(states, districts of the last state), or None when not cached."""
+        # type=list keeps one-element lists from coming back as plain strings
+        states = self.settings.value("cache/location/states", [], list)
+        if not states:
+            return None
+        return states, self.settings.value("cache/location/districts", [], list)
+
+    def set_combo_contents(self, states, districts):
+        self.settings.setValue("cache/location/states", list(states))
+        self.settings.setValue("cache/location/districts", list(districts))
+
+    # ==============================================================
+    # Recent projects
+    # ==============================================================
+
+    def recent_projects(self):
+        return [p for p in self.settings.value("recent_projects", [], list) if p]
+
+    def add_recent_project(self, path):
+        path = os.path.abspath(path)
+        recent = [p for p in self.recent_projects() if p != path]
+        self.settings.setValue("recent_projects", [path] + recent[:MAX_RECENT - 1])
+
+    def remove_recent_project(self, path):
+        self.settings.setValue("recent_projects", [p for p in self.recent_projects() if p != path])
@@ -0,0 +1,55 @@
+"""
+Opt-in startup timing.
+
+Enabled with the `--profile-startup` flag or BRIDGE_PROFILE_STARTUP=1.
+Phases are recorded with `phase(name)` and printed by `report()` as a
+per-phase breakdown. When disabled every call is a no-op.
+"""
+import os
+import sys
+import time
+from contextlib import contextmanager
+
+FLAG = "--profile-startup"
+EXIT_FLAG = "--exit-after-startup"
+
+_enabled = FLAG in sys.argv or os.environ.get("BRIDGE_PROFILE_STARTUP") == "1"
+_t0 = time.perf_counter()
+_phases = []
+
+
+def enabled():
+    return _enabled
+
+
+def exit_after_startup():
+    return EXIT_FLAG in sys.argv
+
+
+@contextmanager
+def phase(name):
+    if not _enabled:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(name, (time.perf_counter() - start) * 1000)
+
+
+def record(name, ms):
+    # list.append is atomic, so worker threads may record too
+    if _enabled:
+        _phases.append((name, ms))
+
+
+def report(file=None):
+    if not _enabled:
+        return
+    file = file or sys.stderr
+    total = (time.perf_counter() - _t0) * 1000
+    for name, ms in _phases:
+        print(f"[startup] {name:<24}{ms:>10.1f} ms", file=file)
+    print(f"[startup] {'total':<24}{total:>10.1f} ms", file=file)
+    file.flush()
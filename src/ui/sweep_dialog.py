@@ -0,0 +1,154 @@
+from PySide6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QFormLayout, QLineEdit, QComboBox,
+    QPushButton, QLabel, QProgressBar, QFileDialog, QMessageBox
+)
+
+from tools import sweep
+from ui.tasks import TaskRunner
+
+
+def run_sweep_task(token, axes, pairs, out_path):
+    """
+    TaskRunner task: loads the locations (every one when pairs is None,
+    none when it is empty) and runs tools.sweep.run_sweep, which fans out
+    to processes.
+    """
+    locations = sweep.load_locations(sweep.DB_PATH, pairs) if pairs is None or pairs else []
+    token.check()
+    token.progress(0, sweep.config_count(axes, locations))
+    return sweep.run_sweep(axes, locations, out_path,
+                           progress=token.progress, is_cancelled=token.is_cancelled)
+
+
+class SweepDialog(QDialog):
+    """
+    Popup to run a design-space sweep:
+    - value lists or start:stop:step ranges per input
+    - locations: all in the database, the current selection, or none
+    - progress bar while the sweep streams to CSV/Parquet
+    """
+    # Longest wait for a running sweep to stop when the dialog closes
+    CLOSE_WAIT_MS = 3000
+
+    def __init__(self, current_location=None, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Design Space Sweep")
+        self.setMinimumWidth(460)
+
+        self.current_location = current_location
+        self.tasks = TaskRunner(self)
+        self.tasks.busy.connect(self.on_busy)
+
+        layout = QVBoxLayout(self)
+        form = QFormLayout()
+        layout.addLayout(form)
+
+        # Inputs (same syntax as the tools.sweep command line)
+        self.inputs = {}
+        defaults = (
+            ("span", "Span (m):", "20:45:5"),
+            ("carriageway_width", "Carriageway Width (m):", "7.5"),
+            ("footpath", "Footpath:", ",".join(sweep.FOOTPATHS)),
+            ("skew", "Skew Angle (°):", "-15:15:5"),
+            ("spacing", "Girder Spacing (m):", "2.5"),
+            ("overhang", "Deck Overhang (m):", "1.0"),
+            ("girder_grade", "Girder Steel Grades:", ",".join(sweep.STEEL_GRADES)),
+            ("cross_grade", "Cross-Bracing Steel Grades:", ",".join(sweep.STEEL_GRADES)),
+            ("concrete_grade", "Deck Concrete Grades:", ",".join(sweep.CONCRETE_GRADES)),
+        )
+        for name, label, default in defaults:
+            edit = QLineEdit(default)
+            edit.setPlaceholderText("a,b,c or start:stop:step")
+            self.inputs[name] = edit
+            form.addRow(label, edit)
+
+        self.cmb_locations = QComboBox()
+        self.cmb_locations.addItems(["All database locations", "Current location", "No locations"])
+        if current_location is None:
+            self.cmb_locations.model().item(1).setEnabled(False)
+        form.addRow("Locations:", self.cmb_locations)
+
+        out_row = QHBoxLayout()
+        self.in_output = QLineEdit("sweep.csv")
+        btn_browse = QPushButton("Browse…")
+        btn_browse.clicked.connect(self.browse_output)
+        out_row.addWidget(self.in_output)
+        out_row.addWidget(btn_browse)
+        form.addRow("Output:", out_row)
+
+        # Status
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setRange(0, 100)
+        layout.addWidget(self.progress_bar)
+
+        self.status_label = QLabel("")
+        layout.addWidget(self.status_label)
+
+        # Buttons
+        btn_row = QHBoxLayout()
+        btn_row.addStretch()
+        self.btn_run = QPushButton("Run Sweep")
+        self.btn_run.clicked.connect(self.start_sweep)
+        self.btn_cancel = QPushButton("Cancel")
+        self.btn_cancel.setEnabled(False)
+        self.btn_cancel.clicked.connect(self.cancel_sweep)
+        btn_row.addWidget(self.btn_run)
+        btn_row.addWidget(self.btn_cancel)
+        layout.addLayout(btn_row)
+
+    def browse_output(self):
+        path, _ = QFileDialog.getSaveFileName(
+            self, "Sweep Output", self.in_output.text(), "CSV (*.csv);;Parquet (*.parquet)")
+        if path:
+            self.in_output.setText(path)
+
+    def start_sweep(self):
+        try:
+            axes = {}
+            for name, edit in self.inputs.items():
+                cast = str if name in ("footpath", "girder_grade", "cross_grade", "concrete_grade") else float
+                axes[name] = sweep.parse_values(edit.text(), cast)
+                if not axes[name]:
+                    raise ValueError(f"No values for {name.replace('_', ' ')}.")
+            sweep.material_tables(axes)   # unknown grades
+        except ValueError as exc:
+            QMessageBox.warning(self, "Invalid Input", str(exc))
+            return
+
+        choice = self.cmb_locations.currentIndex()
+        pairs = (None, [self.current_location], [])[choice]
+
+        self.status_label.setText("Loading locations…")
+        self.progress_bar.setValue(0)
+        self.tasks.submit(
+            "sweep", run_sweep_task, axes, pairs, self.in_output.text(),
+            on_result=self.on_done, on_error=self.on_failed, on_progress=self.on_progress,
+        )
+
+    def cancel_sweep(self):
+        if self.tasks.is_running("sweep"):
+            self.tasks.cancel("sweep")
+            self.status_label.setText("Cancelling…")
+
+    def on_busy(self, busy):
+        self.btn_run.setEnabled(not busy)
+        self.btn_cancel.setEnabled(busy)
+        if not busy and self.status_label.text() == "Cancelling…":
+            self.status_label.setText("Sweep cancelled.")
+
+    def on_progress(self, done, total):
+        self.progress_bar.setValue(int(done * 100 / total) if total else 100)
+        self.status_label.setText(f"{done:,} / {total:,} configurations")
+
+    def on_done(self, rows):
+        self.status_label.setText(f"{rows:,} configurations written to {self.in_output.text()}")
+
+    def on_failed(self, exc):
+        self.status_label.setText("")
+        QMessageBox.critical(self, "Sweep Failed", str(exc))
+
+    def done(self, result):
+        # Closing, Esc and reject() all end here. A running sweep stops
+        # after its current chunk; the dialog waits for that only so long
+        self.tasks.wait(self.CLOSE_WAIT_MS)
+        super().done(result)
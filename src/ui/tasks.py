@@ -0,0 +1,167 @@
+"""
+Background tasks on QThreadPool.
+
+TaskRunner.submit(key, fn, *args) runs fn(token, *args) on a pool thread
+and hands the outcome back on the GUI thread:
+- on_result(value) when fn returns
+- on_error(exception) when it raises
+- on_progress(done, total) for each token.progress() call
+Tasks are keyed: submitting a key that is still queued or running
+cancels the older task (a queued one is taken off the pool before it
+starts) and drops its outcome, so a burst of requests only delivers the
+newest one.
+
+Each TaskRunner runs its tasks on its own QThreadPool (unless one is
+passed in), so wait() never blocks on unrelated pool work such as asset
+scaling.
+
+Cancellation is cooperative. fn polls token.is_cancelled() (the
+is_cancelled callback taken by tools.sweep.run_sweep and friends) or
+calls token.check(), which raises Cancelled; a cancelled task reports
+nothing.
+"""
+import threading
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+
+class Cancelled(Exception):
+    """Raised by CancelToken.check() once the task has been cancelled."""
+
+
+class CancelToken:
+    def __init__(self, report=None):
+        self._event = threading.Event()
+        self._report = report
+
+    def cancel(self):
+        self._event.set()
+
+    def is_cancelled(self):
+        return self._event.is_set()
+
+    def check(self):
+        if self._event.is_set():
+            raise Cancelled()
+
+    def progress(self, done, total=0):
+        """Report progress; total 0 means unknown (busy indicator)."""
+        if self._report is not None and not self._event.is_set():
+            self._report(done, total)
+
+
+class TaskSignals(QObject):
+    # The task comes first so one TaskRunner slot serves all its tasks
+    result = Signal(object, object)
+    failed = Signal(object, object)
+    progress = Signal(object, int, int)
+    done = Signal(object)         # always last, whatever the outcome
+
+
+class Task(QRunnable):
+    def __init__(self, key, fn, args, kwargs):
+        super().__init__()
+        # The runner keeps the reference; Qt must not delete a task it
+        # hands back from tryTake()
+        self.setAutoDelete(False)
+        self.key = key
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = TaskSignals()
+        self.token = CancelToken(lambda done, total: self.signals.progress.emit(self, done, total))
+        self.callbacks = {}
+
+    def run(self):
+        try:
+            if not self.token.is_cancelled():
+                value = self.fn(self.token, *self.args, **self.kwargs)
+                self.signals.result.emit(self, value)
+        except Cancelled:
+            pass
+        except Exception as exc:
+            self.signals.failed.emit(self, exc)
+        finally:
+            self.signals.done.emit(self)
+
+
+class TaskRunner(QObject):
+    """
+    Submits keyed tasks and delivers their outcome on the GUI thread.
+    `busy` is emitted with True when the first task starts and False when
+    the last one has finished.
+    """
+    busy = Signal(bool)
+
+    def __init__(self, parent=None, pool=None):
+        super().__init__(parent)
+        self.pool = pool if pool is not None else QThreadPool(self)
+        self._current = {}     # key -> newest task
+        self._active = set()   # submitted and not yet done (includes superseded)
+
+    def submit(self, key, fn, *args, on_result=None, on_error=None, on_progress=None, **kwargs):
+        self.cancel(key)
+        task = Task(key, fn, args, kwargs)
+        task.callbacks = {"result": on_result, "error": on_error, "progress": on_progress}
+        task.signals.result.connect(self._on_result)
+        task.signals.failed.connect(self._on_failed)
+        task.signals.progress.connect(self._on_progress)
+        task.signals.done.connect(self._on_done)
+
+        self._current[key] = task
+        self._active.add(task)
+        if len(self._active) == 1:
+            self.busy.emit(True)
+        self.pool.start(task)
+        return task
+
+    def cancel(self, key=None):
+        """Cancel the task for `key`, or every task when key is None."""
+        tasks = list(self._current.values()) if key is None else [self._current.get(key)]
+        for task in tasks:
+            if task is None:
+                continue
+            del self._current[task.key]
+            task.token.cancel()
+            if self.pool.tryTake(task):
+                # Never started, so it will not report done
+                self._on_done(task)
+
+    def is_running(self, key):
+        return key in self._current
+
+    def is_busy(self):
+        return bool(self._active)
+
+    def wait(self, msecs=-1):
+        """Cancel everything and wait up to msecs for this runner's running tasks."""
+        self.cancel()
+        return self.pool.waitForDone(msecs)
+
+    # ==============================================================
+    # Delivery (GUI thread)
+    # ==============================================================
+
+    def _deliver(self, task, kind, *args):
+        if self._current.get(task.key) is task and not task.token.is_cancelled():
+            callback = task.callbacks.get(kind)
+            if callback is not None:
+                callback(*args)
+
+    def _on_result(self, task, value):
+        # Delivered before `done`, so callbacks can still see is_running()
+        self._deliver(task, "result", value)
+
+    def _on_failed(self, task, exc):
+        self._deliver(task, "error", exc)
+
+    def _on_progress(self, task, done, total):
+        self._deliver(task, "progress", done, total)
+
+    def _on_done(self, task):
+        if self._current.get(task.key) is task:
+            del self._current[task.key]
+        if task in self._active:
+            self._active.discard(task)
+            if not self._active:
+                self.busy.emit(False)
@@ -0,0 +1,180 @@
+"""
+Input rules for the Basic Inputs form, free of Qt.
+
+Each field has one declarative Rule. validate_record() checks a whole
+form (a dict of field -> text or number) in one pass; validate_records()
+does the same for a batch of serialized forms. ui.form_validator applies
+the same rules to the live widgets.
+
+Custom loading parameters (wind, zone, factor, tmax, tmin) are checked
+row by row with check_custom() in CustomTableEditor and column-wise with
+validate_custom_frame() for bulk imports; both report the same messages.
+Non-finite numbers ("inf", "nan") and booleans are invalid values in both.
+"""
+import math
+import re
+from collections import namedtuple
+
+from ui.db import ZONE_RANKS
+
+SPAN_MIN = 20.0
+SPAN_MAX = 45.0
+SKEW_LIMIT = 15.0
+
+SPAN_ERROR = "Outside the software range."
+SKEW_WARNING = "IRC 24 (2010) requires detailed analysis."
+
+ERROR = "error"
+WARNING = "warning"
+
+# minimum/maximum are inclusive; message is reported when the value is outside
+Rule = namedtuple("Rule", "field minimum maximum message severity")
+
+RULES = (
+    Rule("span", SPAN_MIN, SPAN_MAX, SPAN_ERROR, ERROR),
+    Rule("skew", -SKEW_LIMIT, SKEW_LIMIT, SKEW_WARNING, WARNING),
+)
+RULES_BY_FIELD = {rule.field: rule for rule in RULES}
+
+# Plain decimal numbers only, so parsing needs no exception handling
+_NUMBER_RE = re.compile(r"\s*[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?\s*")
+
+
+def parse_number(value):
+    """float for finite numbers and numeric text, None for anything else."""
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return float(value) if math.isfinite(value) else None
+    if isinstance(value, str) and _NUMBER_RE.fullmatch(value):
+        number = float(value)    # "1e400" overflows to inf
+        return number if math.isfinite(number) else None
+    return None
+
+
+def check(rule, value):
+    """
+    Message for one value: the rule's message when out of range, "" when
+    in range, and None when the value is empty or not a number (the form
+    shows nothing until a number is typed).
+    """
+    number = parse_number(value)
+    if number is None:
+        return None
+    return "" if rule.minimum <= number <= rule.maximum else rule.message
+
+
+def validate_record(record, rules=RULES):
+    """{field: message or None} for every rule whose field is in record."""
+    return {rule.field: check(rule, record[rule.field]) for rule in rules if rule.field in record}
+
+
+def validate_records(records, rules=RULES):
+    """validate_record over an iterable of forms, yielding results lazily."""
+    for record in records:
+        yield validate_record(record, rules)
+
+
+# ==============================================================
+# Custom loading parameters
+# ==============================================================
+
+CUSTOM_FIELDS = ("wind", "zone", "factor", "tmax", "tmin")
+CUSTOM_LABELS = {"wind": "wind", "zone": "seismic zone", "factor": "seismic factor",
+                 "tmax": "max temperature", "tmin": "min temperature"}
+
+CUSTOM_VALUE_MAX = 500.0     # wind (m/s) and factor, as in the editor's validators
+ZONE_MIN, ZONE_MAX = 1, 5
+TEMP_LIMIT = 60.0            # |temperature| in °C
+
+CUSTOM_REQUIRED = "All fields are required."
+CUSTOM_INVALID = "Invalid {} value."
+WIND_POSITIVE = "Wind speed must be positive."
+WIND_TOO_LARGE = "Wind speed must be at most %g m/s." % CUSTOM_VALUE_MAX
+FACTOR_RANGE = "Seismic factor must be between 0 and %g." % CUSTOM_VALUE_MAX
+ZONE_RANGE = "Seismic zone must be a whole number from 1 to 5 (or I-V)."
+TEMP_RANGE = "Temperatures must be between -%g and %g °C." % (TEMP_LIMIT, TEMP_LIMIT)
+TEMP_ORDER = "Min temperature is above max temperature."
+
+_ZONE_PREFIX_RE = re.compile(r"^ZONE\s*")
+
+
+def _zone_number(text):
+    """1-5 for "4", "IV", "Zone IV"; None when not a zone number."""
+    text = _ZONE_PREFIX_RE.sub("", str(text).strip().upper())
+    number = parse_number(text)
+    if number is None and text in ZONE_RANKS:
+        number = float(ZONE_RANKS[text])
+    return number
+
+
+def _blank(value):
+    # NaN is how pandas and spreadsheets hand over empty cells
+    return value is None or value != value or str(value).strip() == ""
+
+
+def check_custom(values):
+    """
+    First failing check for one set of custom parameters (field -> text
+    or number), or "" when valid.
+    """
+    if any(_blank(values.get(f)) for f in CUSTOM_FIELDS):
+        return CUSTOM_REQUIRED
+    numbers = {}
+    for field in CUSTOM_FIELDS:
+        numbers[field] = _zone_number(values[field]) if field == "zone" else parse_number(values[field])
+        if numbers[field] is None:
+            return CUSTOM_INVALID.format(CUSTOM_LABELS[field])
+    if numbers["wind"] <= 0:
+        return WIND_POSITIVE
+    if numbers["wind"] > CUSTOM_VALUE_MAX:
+        return WIND_TOO_LARGE
+    if not (ZONE_MIN <= numbers["zone"] <= ZONE_MAX) or numbers["zone"] != int(numbers["zone"]):
+        return ZONE_RANGE
+    if not 0 <= numbers["factor"] <= CUSTOM_VALUE_MAX:
+        return FACTOR_RANGE
+    if any(abs(numbers[f]) > TEMP_LIMIT for f in ("tmax", "tmin")):
+        return TEMP_RANGE
+    if numbers["tmin"] > numbers["tmax"]:
+        return TEMP_ORDER
+    return ""
+
+
+def validate_custom_frame(frame):
+    """
+    Vectorized check_custom() over a DataFrame with CUSTOM_FIELDS columns
+    (text or numbers). Returns (values, messages): a float DataFrame of
+    the parsed fields (zone as its number) and a Series with the first
+    failing message per row, "" for valid rows.
+    """
+    import numpy as np
+    import pandas as pd
+
+    text = pd.DataFrame({f: frame[f].astype("string").str.strip() for f in CUSTOM_FIELDS})
+    zone = text["zone"].str.upper().str.replace(_ZONE_PREFIX_RE.pattern, "", regex=True)
+    text_numbers = text.assign(zone=zone)
+    values = pd.DataFrame({f: pd.to_numeric(text_numbers[f], errors="coerce") for f in CUSTOM_FIELDS})
+    # to_numeric reads "inf" and "Infinity"; parse_number() does not
+    values = values.where(np.isfinite(values.astype(float)))
+    values["zone"] = values["zone"].fillna(zone.map(ZONE_RANKS).astype(float))
+    values = values.astype(float)
+
+    v = {f: values[f].to_numpy() for f in CUSTOM_FIELDS}
+    checks = [((text.isna() | (text == "")).any(axis=1).to_numpy(), CUSTOM_REQUIRED)]
+    checks += [(np.isnan(v[f]), CUSTOM_INVALID.format(CUSTOM_LABELS[f])) for f in CUSTOM_FIELDS]
+    checks += [
+        (v["wind"] <= 0, WIND_POSITIVE),
+        (v["wind"] > CUSTOM_VALUE_MAX, WIND_TOO_LARGE),
+        ((v["zone"] < ZONE_MIN) | (v["zone"] > ZONE_MAX) | (v["zone"] != np.round(v["zone"])), ZONE_RANGE),
+        ((v["factor"] < 0) | (v["factor"] > CUSTOM_VALUE_MAX), FACTOR_RANGE),
+        ((np.abs(v["tmax"]) > TEMP_LIMIT) | (np.abs(v["tmin"]) > TEMP_LIMIT), TEMP_RANGE),
+        (v["tmin"] > v["tmax"], TEMP_ORDER),
+    ]
+
+    # Earlier checks win, as in check_custom(); rows with unparsable values
+    # also trip later checks, but the earlier message overwrites them
+    messages = np.full(len(frame), "", dtype=object)
+    for mask, message in reversed(checks):
+        messages[mask] = message
+    return values, pd.Series(messages, index=frame.index)
+